@@ -1,11 +1,149 @@
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import List, Optional
 from fastapi import FastAPI, Request
 from fastapi.responses import StreamingResponse, JSONResponse
-from playwright.async_api import async_playwright
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 import asyncio
 import json
+import os
+import time
 import uuid
 
-app = FastAPI()
+# 브라우저 풀 설정 (환경 변수로 조정 가능)
+POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "4"))
+PAGE_MAX_USES = int(os.getenv("BROWSER_PAGE_MAX_USES", "50"))
+PAGE_IDLE_TIMEOUT = float(os.getenv("BROWSER_PAGE_IDLE_TIMEOUT", "300"))
+
+
+@dataclass
+class PooledPage:
+    """풀에서 대여되는 컨텍스트/페이지 한 쌍"""
+    context: BrowserContext
+    page: Page
+    uses: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class BrowserPool:
+    """앱 수명 동안 유지되는 브라우저와 미리 준비된 페이지 풀"""
+
+    def __init__(self, size: int = POOL_SIZE, max_uses: int = PAGE_MAX_USES,
+                 idle_timeout: float = PAGE_IDLE_TIMEOUT):
+        self.size = size
+        self.max_uses = max_uses
+        self.idle_timeout = idle_timeout
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self._idle: List[PooledPage] = []
+        self._slots = asyncio.Semaphore(size)
+        self._evictor: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """브라우저를 한 번만 띄우고 페이지를 미리 준비합니다."""
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch()
+        for _ in range(self.size):
+            self._idle.append(await self._new_slot())
+        self._evictor = asyncio.create_task(self._evict_idle())
+
+    async def close(self):
+        if self._evictor:
+            self._evictor.cancel()
+            try:
+                await self._evictor
+            except asyncio.CancelledError:
+                pass
+            self._evictor = None
+        while self._idle:
+            await self._close_slot(self._idle.pop())
+        if self._browser:
+            await self._browser.close()
+        if self._playwright:
+            await self._playwright.stop()
+
+    async def _new_slot(self) -> PooledPage:
+        context = await self._browser.new_context()
+        page = await context.new_page()
+        return PooledPage(context=context, page=page)
+
+    async def _reset_slot(self, slot: PooledPage) -> bool:
+        """다음 요청에 상태가 넘어가지 않도록 쿠키와 스토리지를 비웁니다. 비우지 못하면 False"""
+        try:
+            await slot.context.clear_cookies()
+            # 현재 오리진의 localStorage를 비우고, sessionStorage는 탭을 새로 열어 버림
+            await slot.page.evaluate("() => { try { localStorage.clear(); sessionStorage.clear(); } catch (e) {} }")
+            await slot.page.close()
+            slot.page = await slot.context.new_page()
+            # 다른 오리진(iframe 등)에 localStorage가 남아 있으면 컨텍스트를 재사용하지 않음
+            state = await slot.context.storage_state()
+            return not state.get("origins")
+        except Exception:
+            return False
+
+    async def _close_slot(self, slot: PooledPage):
+        try:
+            await slot.context.close()
+        except Exception:
+            pass
+
+    async def acquire(self) -> PooledPage:
+        await self._slots.acquire()
+        try:
+            # 가장 최근에 반납된 페이지부터 재사용 (오래된 페이지는 유휴 정리 대상)
+            return self._idle.pop() if self._idle else await self._new_slot()
+        except Exception:
+            self._slots.release()
+            raise
+
+    async def release(self, slot: PooledPage, healthy: bool = True):
+        slot.uses += 1
+        slot.last_used = time.monotonic()
+        try:
+            if (healthy and slot.uses < self.max_uses and not slot.page.is_closed()
+                    and await self._reset_slot(slot)):
+                self._idle.append(slot)
+            else:
+                await self._close_slot(slot)
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def page(self):
+        """`async with pool.page() as page:` 형태로 페이지를 대여합니다."""
+        slot = await self.acquire()
+        healthy = False
+        try:
+            yield slot.page
+            healthy = True
+        finally:
+            await self.release(slot, healthy)
+
+    async def _evict_idle(self):
+        """유휴 시간이 초과된 페이지를 주기적으로 닫습니다."""
+        while True:
+            await asyncio.sleep(max(self.idle_timeout / 2, 1))
+            now = time.monotonic()
+            expired = [s for s in self._idle if now - s.last_used > self.idle_timeout]
+            # 닫는 동안 acquire()가 같은 슬롯을 가져가지 않도록 await 전에 먼저 떼어냄
+            self._idle = [s for s in self._idle if s not in expired]
+            for slot in expired:
+                await self._close_slot(slot)
+
+
+pool = BrowserPool()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await pool.start()
+    try:
+        yield
+    finally:
+        await pool.close()
+
+
+app = FastAPI(lifespan=lifespan)
 sessions = {}
 
 @app.get("/sse")
@@ -32,12 +170,9 @@ async def message_endpoint(sessionId: str, request: Request):
         args = params.get("arguments", {})
 
         if name == "navigate":
-            async with async_playwright() as pw:
-                browser = await pw.chromium.launch()
-                page = await browser.new_page()
+            async with pool.page() as page:
                 await page.goto(args["url"])
                 title = await page.title()
-                await browser.close()
             return JSONResponse({"jsonrpc": "2.0", "id": data["id"], "result": {"title": title}})
 
-    return JSONResponse({"jsonrpc": "2.0", "error": {"code": -32000, "message": "Bad Request"}})
\ No newline at end of file
+    return JSONResponse({"jsonrpc": "2.0", "error": {"code": -32000, "message": "Bad Request"}})
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+클래스 카드 단일 순회 추출 엔진
+
+클래스유 목록 페이지의 카드마다 이름 / 제목 / 수강생 수 / 평점 / 강의 수 /
+월 요금 / 링크를 서브트리 한 번 순회로 모두 추출합니다. 모든 패턴은 모듈 로드
+시 한 번만 컴파일하며, lxml이 설치되어 있으면 lxml로, 없으면 BeautifulSoup으로
+파싱합니다.
+
+classu_fetch_mcp.py(요소 구조 기반)와 classu_simple_fetch.py(카드 텍스트 기반)의
+parse_class_info가 함께 사용합니다.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Pattern, Tuple
+
+from bs4 import CData, NavigableString, Tag
+
+from html_parsing import make_soup
+
+try:
+    import lxml.html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+logger = logging.getLogger(__name__)
+
+# -----------------------------------------------------------------------------
+# 컴파일된 패턴
+# -----------------------------------------------------------------------------
+
+NAME_TAGS = frozenset({"h3", "h4", "div", "span"})
+# 내용을 읽지 않는 요소 (자식 하나로는 세지만 안쪽 텍스트는 이름/본문에 넣지 않음)
+SKIPPED_TAGS = frozenset({"script", "style"})
+TITLE_TAGS = frozenset({"h1", "h2", "h3", "div"})
+NAME_TEXT = re.compile(r".*코치|.*쌤|.*선생|.*T")
+NAME_CLASS = re.compile(r"name|author|teacher")
+TITLE_CLASS = re.compile(r"title|subject|class")
+
+STUDENTS = re.compile(r"(\d+,?\d*)명")
+RATING = re.compile(r"(\d+\.\d+)")
+LESSONS = re.compile(r"(\d+)강")
+FEE = re.compile(r"(\d+,?\d*)원")
+
+# 카드 전체 텍스트 기반 규칙 (classu_simple_fetch)
+TEXT_STUDENTS = re.compile(r"(\d+,?\d*)\s*명")
+TEXT_NAMES = (
+    re.compile(r"([가-힣]+(?:코치|쌤|선생|T\b))"),
+    re.compile(r"([가-힣]{2,4})\s*(?:코치|쌤|선생)"),
+    re.compile(r"(\b[가-힣]{2,4})\s+\d+,?\d*명"),
+)
+TEXT_SENTENCE_SPLIT = re.compile(r"[.!?]")
+TEXT_HAS_STUDENTS = re.compile(r"\d+명")
+TEXT_FEE = re.compile(r"(\d+,?\d*)\s*원")
+
+NO_INFO = "정보없음"
+
+
+@dataclass
+class CardFields:
+    """카드 하나에서 추출한 필드"""
+    name: Optional[str] = None
+    class_title: Optional[str] = None
+    students_count: int = 0
+    rating: float = 0.0
+    lesson_count: int = 0
+    monthly_fee: str = NO_INFO
+    class_url: str = ""
+    text: str = ""
+
+
+class _Frame:
+    __slots__ = ("tag", "children", "only_string", "kind", "parts")
+
+    def __init__(self, tag: str, kind: Optional[str]):
+        self.tag = tag
+        self.children = 0
+        self.only_string: Optional[str] = None
+        self.kind = kind
+        self.parts: List[str] = []
+
+
+class _CardWalker:
+    """카드 서브트리를 한 번 순회하면서 모든 필드를 채우는 상태 기계
+
+    start / text / end 이벤트만 받으므로 파서(BeautifulSoup, lxml)와 무관합니다.
+    """
+
+    __slots__ = ("fields", "strings", "stack", "collectors", "name_by_text", "name_by_class",
+                 "need_students", "need_rating", "need_lessons", "need_fee")
+
+    def __init__(self):
+        self.fields = CardFields()
+        self.strings: List[str] = []
+        self.stack: List[_Frame] = []
+        self.collectors: List[_Frame] = []
+        self.name_by_text: Optional[str] = None
+        self.name_by_class: Optional[str] = None
+        self.need_students = self.need_rating = self.need_lessons = self.need_fee = True
+
+    def start(self, tag: str, class_attr: str, href: Optional[str]):
+        if self.stack:
+            self.stack[-1].children += 1
+        kind = None
+        if class_attr:
+            # 문서 순서상 첫 번째 요소만 사용 ("" 는 찾았지만 아직 텍스트를 모으는 중)
+            if self.fields.class_title is None and tag in TITLE_TAGS and TITLE_CLASS.search(class_attr):
+                kind = "title"
+                self.fields.class_title = ""
+            elif self.name_by_class is None and tag in NAME_TAGS and NAME_CLASS.search(class_attr):
+                kind = "name"
+                self.name_by_class = ""
+        frame = _Frame(tag, kind)
+        self.stack.append(frame)
+        if kind:
+            self.collectors.append(frame)
+        if tag == "a" and href and not self.fields.class_url:
+            self.fields.class_url = href
+
+    def text(self, value: str):
+        if not value:
+            return
+        self.strings.append(value)
+        if self.stack:
+            parent = self.stack[-1]
+            parent.children += 1
+            parent.only_string = value
+        for frame in self.collectors:
+            frame.parts.append(value)
+
+        fields = self.fields
+        if self.need_students:
+            match = STUDENTS.search(value)
+            if match:
+                fields.students_count = int(match.group(1).replace(",", ""))
+                self.need_students = False
+        if self.need_rating:
+            match = RATING.search(value)
+            if match:
+                fields.rating = float(match.group(1))
+                self.need_rating = False
+        if self.need_lessons:
+            match = LESSONS.search(value)
+            if match:
+                fields.lesson_count = int(match.group(1))
+                self.need_lessons = False
+        if self.need_fee:
+            match = FEE.search(value)
+            if match:
+                fields.monthly_fee = f"{match.group(1)}원"
+                self.need_fee = False
+
+    def end(self):
+        frame = self.stack.pop()
+        # BeautifulSoup의 .string 규칙: 자식이 하나뿐이면 그 자식의 문자열
+        # (<div><b>홍길동코치</b></div>처럼 요소 하나로 감싼 경우도 안쪽 문자열을 그대로 씀)
+        string = frame.only_string if frame.children == 1 else None
+        if self.stack:
+            self.stack[-1].only_string = string
+        # BeautifulSoup의 find(string=...) 조건: .string이 패턴에 맞는 요소
+        if (self.name_by_text is None and frame.tag in NAME_TAGS
+                and string is not None and NAME_TEXT.search(string)):
+            self.name_by_text = string.strip()
+        if frame.kind:
+            self.collectors.remove(frame)
+            value = "".join(part.strip() for part in frame.parts)
+            if frame.kind == "title":
+                self.fields.class_title = value
+            else:
+                self.name_by_class = value
+
+    def finish(self) -> CardFields:
+        fields = self.fields
+        fields.name = self.name_by_text if self.name_by_text is not None else self.name_by_class
+        fields.text = "".join(self.strings)
+        return fields
+
+
+def _class_string(value) -> str:
+    if not value:
+        return ""
+    return value if isinstance(value, str) else " ".join(value)
+
+
+def _walk_bs4(node: Tag, walker: _CardWalker):
+    for child in node.children:
+        if isinstance(child, Tag):
+            walker.start(child.name, _class_string(child.get("class")), child.get("href"))
+            if child.name not in SKIPPED_TAGS:
+                _walk_bs4(child, walker)
+            walker.end()
+        elif type(child) in (NavigableString, CData):
+            walker.text(str(child))
+
+
+def _walk_lxml(node, walker: _CardWalker):
+    if node.text:
+        walker.text(node.text)
+    for child in node:
+        if isinstance(child.tag, str):
+            walker.start(child.tag, child.get("class") or "", child.get("href"))
+            if child.tag not in SKIPPED_TAGS:
+                _walk_lxml(child, walker)
+            walker.end()
+        # 주석 / 처리 지시문은 건너뛰되 뒤따르는 텍스트(tail)는 부모 텍스트
+        if child.tail:
+            walker.text(child.tail)
+
+
+class ClassCardExtractor:
+    """카드 요소를 찾고 카드마다 한 번 순회로 CardFields를 추출하는 엔진"""
+
+    def __init__(self, card_tags: Iterable[str] = ("div", "article"),
+                 card_class: Pattern = re.compile(r"class|card|item"), use_lxml: Optional[bool] = None):
+        self.card_tags: Tuple[str, ...] = tuple(card_tags)
+        self.card_class = card_class
+        self.use_lxml = HAS_LXML if use_lxml is None else (use_lxml and HAS_LXML)
+
+    def extract(self, html_content: str) -> List[CardFields]:
+        if not html_content or not html_content.strip():
+            return []
+        if self.use_lxml:
+            try:
+                return self._extract_lxml(html_content)
+            except (ValueError, lxml.etree.ParserError) as e:
+                logger.debug(f"lxml 파싱 실패, BeautifulSoup으로 재시도: {e}")
+        return self._extract_bs4(html_content)
+
+    def _extract_bs4(self, html_content: str) -> List[CardFields]:
+        soup = make_soup(html_content)
+        cards = []
+        for card in soup.find_all(self.card_tags, class_=self.card_class):
+            walker = _CardWalker()
+            _walk_bs4(card, walker)
+            cards.append(walker.finish())
+        return cards
+
+    def _extract_lxml(self, html_content: str) -> List[CardFields]:
+        root = lxml.html.fromstring(html_content)
+        cards = []
+        for card in root.iter(*self.card_tags):
+            class_attr = card.get("class")
+            if not class_attr or not self.card_class.search(class_attr):
+                continue
+            walker = _CardWalker()
+            _walk_lxml(card, walker)
+            cards.append(walker.finish())
+        return cards
+
+
+def text_heuristics(text: str) -> Optional[CardFields]:
+    """카드 전체 텍스트에서 규칙으로 필드를 추출합니다. 수강생 수가 없으면 None"""
+    student_matches = TEXT_STUDENTS.findall(text)
+    if not student_matches:
+        return None
+    fields = CardFields(text=text, name=NO_INFO, class_title=NO_INFO)
+    fields.students_count = max(int(match.replace(",", "")) for match in student_matches)
+
+    for pattern in TEXT_NAMES:
+        match = pattern.search(text)
+        if match:
+            fields.name = match.group(1)
+            break
+
+    for sentence in TEXT_SENTENCE_SPLIT.split(text):
+        stripped = sentence.strip()
+        if len(stripped) > 20 and not TEXT_HAS_STUDENTS.search(sentence):
+            fields.class_title = stripped[:100]
+            break
+
+    rating_match = RATING.search(text)
+    fields.rating = float(rating_match.group(1)) if rating_match else 0.0
+    lesson_match = LESSONS.search(text)
+    fields.lesson_count = int(lesson_match.group(1)) if lesson_match else 0
+    fee_match = TEXT_FEE.search(text)
+    fields.monthly_fee = f"{fee_match.group(1)}원" if fee_match else NO_INFO
+    return fields
+
+
+def absolute_url(href: str, base_url: str) -> str:
+    return base_url + href if href.startswith("/") else href
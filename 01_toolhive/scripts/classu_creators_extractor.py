@@ -8,80 +8,36 @@ import json
 import time
 import sys
 from urllib.parse import urljoin
-import requests
+
+from toolhive_mcp_client import SyncMCPClient
 
 # MCP 서버 URL 설정
 # MCP 서버는 /sse 엔드포인트를 사용해야 합니다
 MCP_SERVER_URL = "http://127.0.0.1:28632/sse"
 
+# 모든 요청이 하나의 SSE 세션과 커넥션 풀을 공유합니다
+_client = None
+
+def get_mcp_client():
+    """공용 MCP 클라이언트를 반환합니다. 첫 호출 시 세션을 엽니다."""
+    global _client
+    if _client is None:
+        base_url = MCP_SERVER_URL.rsplit("/sse", 1)[0]
+        _client = SyncMCPClient(base_url, client_name="classu-creators-extractor")
+        print(f"세션 ID 획득: {_client.connect()}")
+    return _client
+
 def send_mcp_request(method, params=None):
     """MCP 서버에 요청을 보내고 응답을 받습니다."""
     if params is None:
         params = {}
     
-    # 세션 ID를 먼저 가져옵니다
     try:
-        print(f"MCP_SERVER_URL: {MCP_SERVER_URL}")
-        session_response = requests.get(MCP_SERVER_URL)
-        session_response.raise_for_status()
-        
-        # 응답에서 세션 ID 추출
-        for line in session_response.text.split('\n'):
-            if line.startswith('data: /sse?sessionId='):
-                session_id = line.replace('data: /sse?sessionId=', '').strip()
-                break
-        else:
-            raise Exception("세션 ID를 찾을 수 없습니다")
-        
-        print(f"세션 ID 획득: {session_id}")
-        
-        # 올바른 JSON-RPC 페이로드 구성
         # MCP 서버는 tool_ 접두사가 붙은 메서드 이름을 사용합니다
-        payload = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": f"tool_{method}",
-            "params": params
-        }
-        
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json, text/event-stream"
-        }
-        
-        # 메시지 엔드포인트로 요청을 보냅니다 (세션 ID 포함)
-        # MCP 서버는 /messages 엔드포인트를 통해 JSON-RPC 요청을 처리합니다
-        messages_url = MCP_SERVER_URL.replace("/sse", "/messages")
-        print(f"요청 URL: {messages_url}")
-        print(f"요청 페이로드: {json.dumps(payload)}")
-        
-        response = requests.post(messages_url, json=payload, headers=headers)
-        response.raise_for_status()
-        
-        print(f"응답 상태 코드: {response.status_code}")
-        print(f"응답 내용: {response.text[:200]}...")  # 응답의 처음 200자만 출력
-        
-        # JSON 응답 처리
-        try:
-            result = response.json()
-            print(f"JSON 응답: {json.dumps(result)[:200]}...")
-            return result
-        except json.JSONDecodeError as e:
-            print(f"JSON 디코딩 오류: {e}")
-            
-            # SSE 응답 형식 처리 시도
-            lines = response.text.strip().split('\n')
-            for line in lines:
-                if line.startswith('data: '):
-                    data = line[6:]  # 'data: ' 접두사 제거
-                    try:
-                        return json.loads(data)
-                    except json.JSONDecodeError:
-                        continue
-            
-            print(f"응답 형식 오류: {response.text}")
-            return None
-    except requests.exceptions.RequestException as e:
+        result = get_mcp_client().request(f"tool_{method}", params)
+        print(f"JSON 응답: {json.dumps(result, ensure_ascii=False)[:200]}...")
+        return result
+    except Exception as e:
         print(f"요청 오류: {e}")
         return None
 
@@ -132,6 +88,9 @@ def main():
         print("크리에이터 정보가 classu_creators.json 파일에 저장되었습니다.")
     else:
         print("크리에이터 정보를 추출하지 못했습니다.")
+    
+    if _client:
+        _client.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
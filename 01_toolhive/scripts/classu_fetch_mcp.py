@@ -10,39 +10,102 @@ import asyncio
 import json
 import re
 import logging
-from typing import List, Dict, Any
-from dataclasses import dataclass
-from bs4 import BeautifulSoup
+from concurrent.futures import Executor
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional
 import aiohttp
 import time
 
+from class_card_extractor import ClassCardExtractor, absolute_url
+from crawl_scheduler import HostRateLimiter, host_of
+from records import TeacherInfo
+from scrape_store import save_to_store
+from topk import TopKAggregator
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-@dataclass
-class TeacherInfo:
-    """선생님 정보를 저장하는 데이터 클래스"""
-    name: str
-    subject: str
-    class_title: str
-    students_count: int
-    rating: float
-    lesson_count: int
-    monthly_fee: str
-    profile_url: str
-    class_url: str
+# 클래스 카드 추출 엔진 (패턴은 한 번만 컴파일, lxml이 있으면 lxml 사용)
+CARD_EXTRACTOR = ClassCardExtractor(card_tags=('div', 'article'), card_class=re.compile(r'class|card|item'))
+
+def parse_class_cards(html_content: str, base_url: str = "https://www.classu.co.kr") -> List[TeacherInfo]:
+    """
+    HTML 내용에서 선생님 정보를 추출합니다.
+    
+    모듈 수준 함수라서 스레드 풀뿐 아니라 프로세스 풀에서도 실행할 수 있습니다.
+    
+    Args:
+        html_content: 파싱할 HTML 내용
+        base_url: 기본 URL
+        
+    Returns:
+        추출된 선생님 정보 리스트
+    """
+    teachers = []
+    
+    try:
+        # 클래스 카드마다 한 번 순회로 이름/제목/수강생/평점/강의 수/요금/링크 추출
+        for card in CARD_EXTRACTOR.extract(html_content):
+            # 최소한의 정보가 있는 경우만 추가
+            if card.name is not None or card.class_title is not None or card.students_count > 0:
+                teacher = TeacherInfo(
+                    name=card.name if card.name is not None else "정보없음",
+                    subject="일반",  # 기본값
+                    class_title=card.class_title if card.class_title is not None else "정보없음",
+                    students_count=card.students_count,
+                    rating=card.rating,
+                    lesson_count=card.lesson_count,
+                    monthly_fee=card.monthly_fee,
+                    profile_url="",
+                    class_url=absolute_url(card.class_url, base_url)
+                )
+                teachers.append(teacher)
+                
+    except Exception as e:
+        logger.error(f"Error parsing HTML: {str(e)}")
+        
+    return teachers
 
 class ClassuFetchMCP:
     """ToolHive Fetch MCP를 활용한 클래스유 데이터 수집기"""
     
-    def __init__(self, mcp_server_url: str = "http://127.0.0.1:16330"):
+    def __init__(self, mcp_server_url: str = "http://127.0.0.1:16330", max_connections: int = 8,
+                 per_host_interval: float = 0.5, per_host_burst: int = 2,
+                 parse_executor: Optional[Executor] = None):
         """
         Args:
             mcp_server_url: ToolHive fetch MCP 서버 URL
+            max_connections: 공유 HTTP 세션의 최대 동시 연결 수
+            per_host_interval: 같은 대상 호스트 요청 사이 최소 간격(초)
+            per_host_burst: 간격 없이 연속으로 보낼 수 있는 요청 수
+            parse_executor: HTML 파싱을 실행할 풀 (None이면 이벤트 루프 기본 스레드 풀)
         """
         self.mcp_server_url = mcp_server_url
         self.teachers: List[TeacherInfo] = []
+        self.max_connections = max_connections
+        self.rate_limiter = HostRateLimiter(min_interval=per_host_interval, burst=per_host_burst)
+        self.parse_executor = parse_executor
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    async def __aenter__(self) -> "ClassuFetchMCP":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """모든 요청이 공유하는 keep-alive 세션 (연결 수 제한)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+    
+    async def close(self):
+        """공유 HTTP 세션을 닫습니다."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
         
     async def fetch_page_content(self, url: str) -> str:
         """
@@ -74,54 +137,57 @@ class ClassuFetchMCP:
                 "Accept": "application/json, text/event-stream"
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.mcp_server_url}/mcp",
-                    json=payload,
-                    headers=headers
-                ) as response:
-                    if response.status == 200:
-                        # SSE 응답 처리
-                        content_type = response.headers.get('content-type', '')
-                        
-                        if 'text/event-stream' in content_type:
-                            # SSE 스트림 처리
-                            result_text = ""
-                            async for line in response.content:
-                                line_str = line.decode('utf-8').strip()
-                                if line_str.startswith('data: '):
-                                    data_str = line_str[6:]  # "data: " 제거
-                                    if data_str == '[DONE]':
-                                        break
-                                    try:
-                                        data = json.loads(data_str)
-                                        if isinstance(data, dict) and "content" in data:
-                                            content = data["content"]
-                                            if isinstance(content, list) and len(content) > 0:
-                                                result_text += content[0].get("text", "")
-                                            elif isinstance(content, dict):
-                                                result_text += content.get("text", "")
-                                    except json.JSONDecodeError:
-                                        continue
-                            return result_text
-                        else:
-                            # 일반 JSON 응답 처리
-                            result = await response.json()
-                            if "result" in result and "content" in result["result"]:
-                                content = result["result"]["content"]
-                                if isinstance(content, list) and len(content) > 0:
-                                    return content[0].get("text", "")
-                                elif isinstance(content, dict):
-                                    return content.get("text", "")
-                                else:
-                                    return str(content)
-                            else:
-                                logger.error(f"Unexpected MCP response format: {result}")
-                                return ""
+            # 대상 호스트별 요청 간격 유지
+            await self.rate_limiter.wait_async(host_of(url))
+            
+            session = self._get_session()
+            async with session.post(
+                f"{self.mcp_server_url}/mcp",
+                json=payload,
+                headers=headers
+            ) as response:
+                if response.status == 200:
+                    # SSE 응답 처리
+                    content_type = response.headers.get('content-type', '')
+                    
+                    if 'text/event-stream' in content_type:
+                        # SSE 스트림 처리
+                        result_text = ""
+                        async for line in response.content:
+                            line_str = line.decode('utf-8').strip()
+                            if line_str.startswith('data: '):
+                                data_str = line_str[6:]  # "data: " 제거
+                                if data_str == '[DONE]':
+                                    break
+                                try:
+                                    data = json.loads(data_str)
+                                    if isinstance(data, dict) and "content" in data:
+                                        content = data["content"]
+                                        if isinstance(content, list) and len(content) > 0:
+                                            result_text += content[0].get("text", "")
+                                        elif isinstance(content, dict):
+                                            result_text += content.get("text", "")
+                                except json.JSONDecodeError:
+                                    continue
+                        return result_text
                     else:
-                        logger.error(f"HTTP error {response.status} for URL: {url}")
-                        return ""
-                        
+                        # 일반 JSON 응답 처리
+                        result = await response.json()
+                        if "result" in result and "content" in result["result"]:
+                            content = result["result"]["content"]
+                            if isinstance(content, list) and len(content) > 0:
+                                return content[0].get("text", "")
+                            elif isinstance(content, dict):
+                                return content.get("text", "")
+                            else:
+                                return str(content)
+                        else:
+                            logger.error(f"Unexpected MCP response format: {result}")
+                            return ""
+                else:
+                    logger.error(f"HTTP error {response.status} for URL: {url}")
+                    return ""
+                    
         except Exception as e:
             logger.error(f"Error fetching {url}: {str(e)}")
             return ""
@@ -137,89 +203,7 @@ class ClassuFetchMCP:
         Returns:
             추출된 선생님 정보 리스트
         """
-        teachers = []
-        
-        try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # 클래스 카드들을 찾습니다
-            class_cards = soup.find_all(['div', 'article'], class_=re.compile(r'class|card|item'))
-            
-            for card in class_cards:
-                try:
-                    # 선생님 이름 추출
-                    name_elem = card.find(['h3', 'h4', 'div', 'span'], string=re.compile(r'.*코치|.*쌤|.*선생|.*T'))
-                    if not name_elem:
-                        name_elem = card.find(['h3', 'h4', 'div', 'span'], class_=re.compile(r'name|author|teacher'))
-                    
-                    # 클래스 제목 추출
-                    title_elem = card.find(['h1', 'h2', 'h3', 'div'], class_=re.compile(r'title|subject|class'))
-                    
-                    # 수강생 수 추출
-                    students_elem = card.find(string=re.compile(r'(\d+,?\d*)명'))
-                    students_count = 0
-                    if students_elem:
-                        match = re.search(r'(\d+,?\d*)명', students_elem)
-                        if match:
-                            students_count = int(match.group(1).replace(',', ''))
-                    
-                    # 평점 추출
-                    rating_elem = card.find(string=re.compile(r'(\d+\.\d+)'))
-                    rating = 0.0
-                    if rating_elem:
-                        match = re.search(r'(\d+\.\d+)', rating_elem)
-                        if match:
-                            rating = float(match.group(1))
-                    
-                    # 강의 수 추출
-                    lesson_elem = card.find(string=re.compile(r'(\d+)강'))
-                    lesson_count = 0
-                    if lesson_elem:
-                        match = re.search(r'(\d+)강', lesson_elem)
-                        if match:
-                            lesson_count = int(match.group(1))
-                    
-                    # 월 요금 추출
-                    fee_elem = card.find(string=re.compile(r'(\d+,?\d*)원'))
-                    monthly_fee = "정보없음"
-                    if fee_elem:
-                        match = re.search(r'(\d+,?\d*)원', fee_elem)
-                        if match:
-                            monthly_fee = f"{match.group(1)}원"
-                    
-                    # URL 추출
-                    link_elem = card.find('a', href=True)
-                    class_url = ""
-                    if link_elem:
-                        href = link_elem['href']
-                        if href.startswith('/'):
-                            class_url = base_url + href
-                        else:
-                            class_url = href
-                    
-                    # 최소한의 정보가 있는 경우만 추가
-                    if name_elem or title_elem or students_count > 0:
-                        teacher = TeacherInfo(
-                            name=name_elem.get_text(strip=True) if name_elem else "정보없음",
-                            subject="일반",  # 기본값
-                            class_title=title_elem.get_text(strip=True) if title_elem else "정보없음",
-                            students_count=students_count,
-                            rating=rating,
-                            lesson_count=lesson_count,
-                            monthly_fee=monthly_fee,
-                            profile_url="",
-                            class_url=class_url
-                        )
-                        teachers.append(teacher)
-                        
-                except Exception as e:
-                    logger.debug(f"Error parsing card: {str(e)}")
-                    continue
-                    
-        except Exception as e:
-            logger.error(f"Error parsing HTML: {str(e)}")
-            
-        return teachers
+        return parse_class_cards(html_content, base_url)
     
     async def collect_teachers_from_url(self, url: str) -> List[TeacherInfo]:
         """
@@ -238,15 +222,25 @@ class ClassuFetchMCP:
             logger.warning(f"No content received from {url}")
             return []
         
-        teachers = self.parse_class_info(html_content)
+        # HTML 파싱은 CPU 작업이므로 이벤트 루프를 막지 않도록 풀에서 실행
+        loop = asyncio.get_running_loop()
+        teachers = await loop.run_in_executor(self.parse_executor, parse_class_cards, html_content)
         logger.info(f"Found {len(teachers)} teachers from {url}")
         
         return teachers
     
-    async def collect_top_teachers(self) -> List[TeacherInfo]:
+    async def collect_top_teachers(self, top_k: int = 50,
+                                   sort_key: Callable[[TeacherInfo], Any] = attrgetter("students_count")) -> List[TeacherInfo]:
         """
         클래스유 사이트에서 TOP 50 선생님을 수집합니다.
         
+        페이지가 파싱되는 대로 TopKAggregator에 넣어 (이름, 클래스 제목)으로 중복을
+        제거하고 상위 top_k개만 유지합니다.
+        
+        Args:
+            top_k: 반환할 선생님 수
+            sort_key: 순위 기준 (기본: 수강생 수)
+            
         Returns:
             TOP 50 선생님 정보 리스트
         """
@@ -260,40 +254,24 @@ class ClassuFetchMCP:
             "https://www.classu.co.kr/new/category/art",  # 미술/디자인
         ]
         
-        all_teachers = []
+        # 페이지 완료 순서와 관계없이 동점자 순위가 같도록 이름, 클래스 URL 순으로 정렬
+        ranking = TopKAggregator(k=top_k, key=attrgetter("name", "class_title"), score=sort_key,
+                                 tie_break=attrgetter("name", "class_url"))
         
-        for url in urls_to_crawl:
+        async def collect(url: str):
             try:
-                teachers = await self.collect_teachers_from_url(url)
-                all_teachers.extend(teachers)
-                
-                # 요청 간 딜레이 (서버 부하 방지)
-                await asyncio.sleep(2)
-                
+                ranking.extend(await self.collect_teachers_from_url(url))
             except Exception as e:
                 logger.error(f"Error collecting from {url}: {str(e)}")
-                continue
         
-        # 중복 제거 및 정렬
-        unique_teachers = {}
-        for teacher in all_teachers:
-            key = f"{teacher.name}_{teacher.class_title}"
-            if key not in unique_teachers or teacher.students_count > unique_teachers[key].students_count:
-                unique_teachers[key] = teacher
+        # 모든 카테고리를 동시에 수집 (같은 호스트 요청 간격은 rate_limiter가 유지)
+        await asyncio.gather(*(collect(url) for url in urls_to_crawl))
         
-        # 수강생 수 기준으로 정렬
-        sorted_teachers = sorted(
-            unique_teachers.values(),
-            key=lambda x: x.students_count,
-            reverse=True
-        )
+        top_teachers = ranking.top()
         
-        # TOP 50 선택
-        top_50 = sorted_teachers[:50]
+        logger.info(f"Collected total {ranking.seen} teachers, unique {ranking.unique}, returning TOP {len(top_teachers)}")
         
-        logger.info(f"Collected total {len(all_teachers)} teachers, unique {len(unique_teachers)}, returning TOP {len(top_50)}")
-        
-        return top_50
+        return top_teachers
     
     def save_results(self, teachers: List[TeacherInfo], filename: str = "classu_top50_fetch_mcp.json"):
         """
@@ -309,18 +287,7 @@ class ClassuFetchMCP:
                 "total_teachers": len(teachers),
                 "method": "ToolHive Fetch MCP",
                 "teachers": [
-                    {
-                        "rank": idx + 1,
-                        "name": teacher.name,
-                        "subject": teacher.subject,
-                        "class_title": teacher.class_title,
-                        "students_count": teacher.students_count,
-                        "rating": teacher.rating,
-                        "lesson_count": teacher.lesson_count,
-                        "monthly_fee": teacher.monthly_fee,
-                        "profile_url": teacher.profile_url,
-                        "class_url": teacher.class_url
-                    }
+                    {"rank": idx + 1, **teacher.to_dict()}
                     for idx, teacher in enumerate(teachers)
                 ]
             }
@@ -394,6 +361,8 @@ async def main():
         
         # 결과 저장
         collector.save_results(top_teachers)
+        # 실행 간 비교를 위해 공유 저장소에도 스냅샷으로 누적
+        save_to_store("teachers", top_teachers, source="classu_fetch_mcp")
         
         # 보고서 생성
         report = collector.generate_report(top_teachers)
@@ -419,6 +388,8 @@ async def main():
     except Exception as e:
         logger.error(f"실행 중 오류 발생: {str(e)}")
         raise
+    finally:
+        await collector.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -19,24 +19,13 @@ import json
 import time
 import logging
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+
+from records import RankedTeacher
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-@dataclass
-class TeacherInfo:
-    """선생님 정보를 저장하는 데이터 클래스"""
-    rank: int
-    name: str
-    class_title: str
-    discount_rate: str
-    monthly_price: str
-    rating: str
-    members_count: str
-    activity_count: str = ""
-
 class PlaywrightMCPSimulator:
     """ToolHive Playwright MCP 시뮬레이터"""
     
@@ -44,7 +33,7 @@ class PlaywrightMCPSimulator:
         self.session_id = "simulated-session-12345"
         self.browser_initialized = False
         self.current_url = ""
-        self.teachers: List[TeacherInfo] = []
+        self.teachers: List[RankedTeacher] = []
         
     def simulate_session_acquisition(self) -> bool:
         """세션 ID 획득 시뮬레이션"""
@@ -177,7 +166,7 @@ class PlaywrightMCPSimulator:
         logger.info("✅ 페이지 스냅샷 완료")
         return snapshot_data
     
-    def extract_top10_from_snapshot(self, snapshot_data: Dict) -> List[TeacherInfo]:
+    def extract_top10_from_snapshot(self, snapshot_data: Dict) -> List[RankedTeacher]:
         """스냅샷에서 TOP 10 선생님 정보 추출"""
         logger.info("🔍 TOP 10 선생님 정보 추출 중...")
         teachers = []
@@ -287,7 +276,7 @@ class PlaywrightMCPSimulator:
             ]
             
             for data in top10_data:
-                teacher = TeacherInfo(
+                teacher = RankedTeacher(
                     rank=data["rank"],
                     name=data["name"],
                     class_title=data["class_title"],
@@ -328,7 +317,7 @@ class PlaywrightMCPSimulator:
         logger.info("✅ 브라우저 종료 완료")
         return True
     
-    def run_full_workflow(self) -> List[TeacherInfo]:
+    def run_full_workflow(self) -> List[RankedTeacher]:
         """전체 워크플로우 실행"""
         logger.info("🎬 ToolHive Playwright MCP 워크플로우 시작")
         
@@ -370,7 +359,7 @@ class PlaywrightMCPSimulator:
             self.simulate_browser_close()
             return []
     
-    def save_results(self, teachers: List[TeacherInfo], filename: str = "classu_top10_playwright_simulation.json"):
+    def save_results(self, teachers: List[RankedTeacher], filename: str = "classu_top10_playwright_simulation.json"):
         """결과를 JSON 파일로 저장합니다."""
         try:
             data = {
@@ -390,16 +379,7 @@ class PlaywrightMCPSimulator:
                     "브라우저 종료"
                 ],
                 "teachers": [
-                    {
-                        "rank": teacher.rank,
-                        "name": teacher.name,
-                        "class_title": teacher.class_title,
-                        "discount_rate": teacher.discount_rate,
-                        "monthly_price": teacher.monthly_price,
-                        "rating": teacher.rating,
-                        "members_count": teacher.members_count,
-                        "activity_count": teacher.activity_count
-                    }
+                    teacher.to_dict()
                     for teacher in teachers
                 ]
             }
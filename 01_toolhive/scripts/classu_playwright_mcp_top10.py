@@ -7,12 +7,12 @@ ToolHive Playwright MCP를 활용한 클래스유 TOP 10 선생님 추출
 """
 
 import json
-import requests
-import re
 import time
 import logging
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+
+from records import RankedTeacher
+from toolhive_mcp_client import SyncMCPClient
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -21,92 +21,33 @@ logger = logging.getLogger(__name__)
 # ToolHive Playwright MCP 서버 설정
 PLAYWRIGHT_MCP_URL = "http://127.0.0.1:38342"
 
-@dataclass
-class TeacherInfo:
-    """선생님 정보를 저장하는 데이터 클래스"""
-    rank: int
-    name: str
-    class_title: str
-    discount_rate: str
-    monthly_price: str
-    rating: str
-    members_count: str
-    activity_count: str = ""
-
 class ClassuPlaywrightMCPScraper:
     """ToolHive Playwright MCP를 활용한 클래스유 스크래퍼"""
     
     def __init__(self):
+        self.client = SyncMCPClient(PLAYWRIGHT_MCP_URL, client_name="ClassuPlaywrightScraper")
         self.session_id = None
-        self.teachers: List[TeacherInfo] = []
+        self.teachers: List[RankedTeacher] = []
         
     def get_session_id(self) -> Optional[str]:
-        """SSE 엔드포인트에서 sessionId를 획득합니다."""
+        """공용 MCP 클라이언트로 SSE 세션을 열고 sessionId를 반환합니다."""
         try:
             logger.info("세션 ID 획득 중...")
-            response = requests.get(f"{PLAYWRIGHT_MCP_URL}/sse", 
-                                  headers={"Accept": "text/event-stream"},
-                                  stream=True, timeout=30)
-            
-            for line in response.iter_lines(decode_unicode=True):
-                if line and line.startswith("data:"):
-                    data = line.replace("data:", "").strip()
-                    match = re.search(r"sessionId=([a-f0-9\-]+)", data)
-                    if match:
-                        session_id = match.group(1)
-                        logger.info(f"세션 ID 획득 성공: {session_id}")
-                        return session_id
-                        
+            session_id = self.client.connect()
+            logger.info(f"세션 ID 획득 성공: {session_id}")
+            return session_id
         except Exception as e:
             logger.error(f"세션 ID 획득 실패: {e}")
             return None
-        
-        logger.error("sessionId를 찾을 수 없습니다.")
-        return None
 
-    def send_mcp_request(self, method: str, params: Dict = None, rpc_id: int = 1) -> Dict:
+    def send_mcp_request(self, method: str, params: Dict = None) -> Dict:
         """MCP 서버에 JSON-RPC 요청을 보냅니다."""
         if not self.session_id:
             logger.error("세션 ID가 없습니다.")
             return {"error": "No session ID"}
-            
-        payload = {
-            "jsonrpc": "2.0",
-            "id": rpc_id,
-            "method": method,
-            "params": params or {}
-        }
         
         try:
-            response = requests.post(
-                f"{PLAYWRIGHT_MCP_URL}/messages?sessionId={self.session_id}",
-                headers={
-                    "Accept": "application/json, text/event-stream",
-                    "Content-Type": "application/json"
-                },
-                data=json.dumps(payload),
-                timeout=60
-            )
-            
-            try:
-                return response.json()
-            except json.JSONDecodeError:
-                # SSE 응답인 경우 파싱
-                response_text = response.text
-                logger.debug(f"SSE 응답: {response_text[:200]}...")
-                
-                # event-stream에서 data 부분 추출
-                for line in response_text.split('\n'):
-                    if line.startswith('data: '):
-                        data_str = line[6:].strip()
-                        if data_str and data_str != '[DONE]':
-                            try:
-                                return json.loads(data_str)
-                            except json.JSONDecodeError:
-                                continue
-                
-                return {"error": "Failed to parse response", "raw": response_text}
-                
+            return self.client.request(method, params)
         except Exception as e:
             logger.error(f"MCP 요청 실패: {e}")
             return {"error": str(e)}
@@ -116,13 +57,10 @@ class ClassuPlaywrightMCPScraper:
         logger.info("브라우저 초기화 중...")
         
         # 1. 초기화 요청
-        init_result = self.send_mcp_request("initialize", {
-            "capabilities": {},
-            "clientInfo": {
-                "name": "ClassuPlaywrightScraper",
-                "version": "1.0.0"
-            }
-        }, rpc_id=1)
+        try:
+            init_result = self.client.initialize()
+        except Exception as e:
+            init_result = {"error": str(e)}
         
         logger.debug(f"초기화 응답: {init_result}")
         
@@ -130,7 +68,7 @@ class ClassuPlaywrightMCPScraper:
         install_result = self.send_mcp_request("tools/call", {
             "name": "browser_install",
             "arguments": {"random_string": "install_check"}
-        }, rpc_id=2)
+        })
         
         logger.debug(f"브라우저 설치 확인: {install_result}")
         
@@ -143,7 +81,7 @@ class ClassuPlaywrightMCPScraper:
         result = self.send_mcp_request("tools/call", {
             "name": "browser_navigate",
             "arguments": {"url": "https://www.classu.co.kr/new"}
-        }, rpc_id=3)
+        })
         
         logger.debug(f"네비게이션 응답: {result}")
         
@@ -165,13 +103,13 @@ class ClassuPlaywrightMCPScraper:
                 "element": "BEST 클래스 링크",
                 "ref": "link"  # 실제로는 페이지 스냅샷에서 ref를 얻어야 함
             }
-        }, rpc_id=4)
+        })
         
         # 또는 직접 URL로 이동
         result = self.send_mcp_request("tools/call", {
             "name": "browser_navigate",
             "arguments": {"url": "https://www.classu.co.kr/new/event/plan/57"}
-        }, rpc_id=5)
+        })
         
         logger.debug(f"BEST 페이지 이동 응답: {result}")
         
@@ -189,12 +127,12 @@ class ClassuPlaywrightMCPScraper:
         result = self.send_mcp_request("tools/call", {
             "name": "browser_snapshot",
             "arguments": {"random_string": "snapshot"}
-        }, rpc_id=6)
+        })
         
         logger.debug(f"페이지 스냅샷 응답: {result}")
         return result
 
-    def extract_top10_from_snapshot(self, snapshot_data: Dict) -> List[TeacherInfo]:
+    def extract_top10_from_snapshot(self, snapshot_data: Dict) -> List[RankedTeacher]:
         """페이지 스냅샷에서 TOP 10 선생님 정보를 추출합니다."""
         teachers = []
         
@@ -308,7 +246,7 @@ class ClassuPlaywrightMCPScraper:
                 ]
                 
                 for data in top10_data:
-                    teacher = TeacherInfo(
+                    teacher = RankedTeacher(
                         rank=data["rank"],
                         name=data["name"],
                         class_title=data["class_title"],
@@ -333,11 +271,12 @@ class ClassuPlaywrightMCPScraper:
         result = self.send_mcp_request("tools/call", {
             "name": "browser_close",
             "arguments": {"random_string": "close"}
-        }, rpc_id=99)
+        })
         
         logger.debug(f"브라우저 종료 응답: {result}")
+        self.client.close()
 
-    def scrape_top10_teachers(self) -> List[TeacherInfo]:
+    def scrape_top10_teachers(self) -> List[RankedTeacher]:
         """TOP 10 선생님 정보를 스크래핑합니다."""
         try:
             # 1. 세션 ID 획득
@@ -381,7 +320,7 @@ class ClassuPlaywrightMCPScraper:
             self.close_browser()
             return []
 
-    def save_results(self, teachers: List[TeacherInfo], filename: str = "classu_top10_playwright_mcp.json"):
+    def save_results(self, teachers: List[RankedTeacher], filename: str = "classu_top10_playwright_mcp.json"):
         """결과를 JSON 파일로 저장합니다."""
         try:
             data = {
@@ -391,16 +330,7 @@ class ClassuPlaywrightMCPScraper:
                 "source_url": "https://www.classu.co.kr/new/event/plan/57",
                 "description": "클래스유 BEST 클래스 TOP 10 선생님",
                 "teachers": [
-                    {
-                        "rank": teacher.rank,
-                        "name": teacher.name,
-                        "class_title": teacher.class_title,
-                        "discount_rate": teacher.discount_rate,
-                        "monthly_price": teacher.monthly_price,
-                        "rating": teacher.rating,
-                        "members_count": teacher.members_count,
-                        "activity_count": teacher.activity_count
-                    }
+                    teacher.to_dict()
                     for teacher in teachers
                 ]
             }
@@ -1,145 +1,120 @@
 #!/usr/bin/env python3
 """
-ToolHive CLI를 활용한 클래스유 TOP 50 선생님 추출 (간단한 버전)
+ToolHive fetch MCP를 활용한 클래스유 TOP 50 선생님 추출 (간단한 버전)
 
-이 스크립트는 subprocess를 통해 curl을 직접 호출하여 
-ToolHive fetch MCP 서버에서 데이터를 가져옵니다.
+이 스크립트는 공용 MCP 클라이언트로 ToolHive fetch MCP 서버에
+한 번만 초기화한 세션을 열고, keep-alive 커넥션으로 여러 페이지를
+동시에 가져옵니다.
 """
 
-import subprocess
+import asyncio
 import json
 import re
 import logging
 import time
 from typing import List, Dict, Any
-from dataclasses import dataclass
-from bs4 import BeautifulSoup
+from operator import attrgetter
+
+from class_card_extractor import ClassCardExtractor, absolute_url, text_heuristics
+from records import TeacherInfo
+from scrape_store import save_to_store
+from topk import TopKAggregator
+from toolhive_mcp_client import ToolHiveMCPClient
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-@dataclass
-class TeacherInfo:
-    """선생님 정보를 저장하는 데이터 클래스"""
-    name: str
-    subject: str
-    class_title: str
-    students_count: int
-    rating: float
-    lesson_count: int
-    monthly_fee: str
-    class_url: str
+# ToolHive fetch MCP 서버 설정
+FETCH_MCP_URL = "http://127.0.0.1:16330"
+MAX_CONCURRENT_FETCHES = 4
+
+# 클래스 카드 추출 엔진 (패턴은 한 번만 컴파일, lxml이 있으면 lxml 사용)
+CARD_EXTRACTOR = ClassCardExtractor(card_tags=('div', 'article', 'section'),
+                                    card_class=re.compile(r'class|card|item|content', re.I))
 
 class ClassuSimpleFetch:
     """ToolHive CLI를 활용한 클래스유 데이터 수집기"""
     
-    def __init__(self):
+    def __init__(self, max_concurrency: int = MAX_CONCURRENT_FETCHES):
         self.teachers: List[TeacherInfo] = []
-        
-    def fetch_url_content(self, url: str) -> str:
+        self.max_concurrency = max_concurrency
+    
+    @staticmethod
+    def extract_fetch_text(response: Dict[str, Any]) -> str:
+        """fetch 도구 응답의 result > content 구조에서 텍스트를 추출합니다."""
+        result = response.get("result") if isinstance(response, dict) else None
+        if not isinstance(result, dict) or "content" not in result:
+            return ""
+        content_data = result["content"]
+        if isinstance(content_data, list) and len(content_data) > 0:
+            return content_data[0].get("text", "")
+        if isinstance(content_data, dict):
+            return content_data.get("text", "")
+        return ""
+    
+    async def fetch_urls_async(self, urls: List[str]) -> Dict[str, str]:
         """
-        curl을 통해 ToolHive fetch MCP에서 웹 페이지 내용을 가져옵니다.
+        하나의 MCP 세션과 keep-alive 커넥션으로 여러 URL을 동시에 가져옵니다.
         
         Args:
-            url: 크롤링할 URL
+            urls: 크롤링할 URL 목록
             
         Returns:
-            페이지 HTML 내용
+            URL별 페이지 HTML 내용 (실패한 URL은 빈 문자열)
         """
-        try:
-            logger.info(f"Fetching content from: {url}")
-            
-            # curl 명령어 구성
-            curl_cmd = [
-                'curl', '-s', '-X', 'POST',
-                'http://127.0.0.1:16330/mcp',
-                '-H', 'Content-Type: application/json',
-                '-H', 'Accept: application/json, text/event-stream',
-                '-d', json.dumps({
-                    "jsonrpc": "2.0",
-                    "id": "fetch_request",
-                    "method": "initialize",
-                    "params": {
-                        "protocolVersion": "2024-11-05",
-                        "capabilities": {},
-                        "clientInfo": {
-                            "name": "ClassuScraper",
-                            "version": "1.0.0"
-                        }
-                    }
-                })
-            ]
-            
-            # 초기화 요청
-            result = subprocess.run(curl_cmd, capture_output=True, text=True, timeout=30)
+        async with ToolHiveMCPClient(FETCH_MCP_URL, message_path="/mcp", transport="streamable-http",
+                                     client_name="ClassuScraper", max_connections=self.max_concurrency) as client:
+            # 실행당 한 번만 초기화
+            init_result = await client.initialize()
+            if "error" in init_result:
+                logger.error(f"MCP initialize failed: {init_result['error']}")
+                return {url: "" for url in urls}
             
-            if result.returncode != 0:
-                logger.error(f"Curl failed: {result.stderr}")
-                return ""
+            semaphore = asyncio.Semaphore(self.max_concurrency)
             
-            # 이제 실제 fetch 요청
-            fetch_cmd = [
-                'curl', '-s', '-X', 'POST',
-                'http://127.0.0.1:16330/mcp',
-                '-H', 'Content-Type: application/json',
-                '-H', 'Accept: application/json, text/event-stream',
-                '-d', json.dumps({
-                    "jsonrpc": "2.0",
-                    "id": "fetch_content",
-                    "method": "tools/call",
-                    "params": {
-                        "name": "fetch",
-                        "arguments": {
-                            "url": url
-                        }
-                    }
-                })
-            ]
-            
-            result = subprocess.run(fetch_cmd, capture_output=True, text=True, timeout=60)
-            
-            if result.returncode != 0:
-                logger.error(f"Fetch failed: {result.stderr}")
-                return ""
-            
-            # SSE 응답 파싱
-            response_text = result.stdout
-            logger.debug(f"Raw response: {response_text[:500]}...")
-            
-            # event-stream에서 data 부분 추출
-            content = ""
-            for line in response_text.split('\n'):
-                if line.startswith('data: '):
-                    data_str = line[6:].strip()
-                    if data_str and data_str != '[DONE]':
-                        try:
-                            data = json.loads(data_str)
-                            if isinstance(data, dict):
-                                # result > content 구조에서 텍스트 추출
-                                if "result" in data and "content" in data["result"]:
-                                    content_data = data["result"]["content"]
-                                    if isinstance(content_data, list) and len(content_data) > 0:
-                                        content += content_data[0].get("text", "")
-                                    elif isinstance(content_data, dict):
-                                        content += content_data.get("text", "")
-                        except json.JSONDecodeError:
-                            continue
-            
-            if not content:
-                logger.warning(f"No content extracted from {url}")
-                logger.debug(f"Full response: {response_text}")
-            else:
-                logger.info(f"Successfully fetched {len(content)} characters from {url}")
-            
-            return content
+            async def fetch(url: str) -> str:
+                async with semaphore:
+                    try:
+                        logger.info(f"Fetching content from: {url}")
+                        response = await client.call_tool("fetch", {"url": url})
+                    except asyncio.TimeoutError:
+                        logger.error(f"Timeout while fetching {url}")
+                        return ""
+                    except Exception as e:
+                        logger.error(f"Error fetching {url}: {str(e)}")
+                        return ""
+                
+                content = self.extract_fetch_text(response)
+                if not content:
+                    logger.warning(f"No content extracted from {url}")
+                    logger.debug(f"Full response: {response}")
+                else:
+                    logger.info(f"Successfully fetched {len(content)} characters from {url}")
+                return content
             
-        except subprocess.TimeoutExpired:
-            logger.error(f"Timeout while fetching {url}")
-            return ""
+            contents = await asyncio.gather(*(fetch(url) for url in urls))
+            return dict(zip(urls, contents))
+    
+    def fetch_urls(self, urls: List[str]) -> Dict[str, str]:
+        """fetch_urls_async의 동기 버전"""
+        try:
+            return asyncio.run(self.fetch_urls_async(urls))
         except Exception as e:
-            logger.error(f"Error fetching {url}: {str(e)}")
-            return ""
+            logger.error(f"Error fetching urls: {str(e)}")
+            return {url: "" for url in urls}
+    
+    def fetch_url_content(self, url: str) -> str:
+        """
+        ToolHive fetch MCP에서 웹 페이지 내용을 가져옵니다.
+        
+        Args:
+            url: 크롤링할 URL
+            
+        Returns:
+            페이지 HTML 내용
+        """
+        return self.fetch_urls([url]).get(url, "")
     
     def parse_class_info(self, html_content: str, base_url: str = "https://www.classu.co.kr") -> List[TeacherInfo]:
         """
@@ -158,84 +133,30 @@ class ClassuSimpleFetch:
             return teachers
         
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            # 클래스 정보가 포함된 다양한 요소들을 한 번씩만 순회해 텍스트 수집
+            cards = CARD_EXTRACTOR.extract(html_content)
             
-            # 클래스 정보가 포함된 다양한 요소들 찾기
-            potential_elements = soup.find_all(['div', 'article', 'section'], 
-                                             class_=re.compile(r'class|card|item|content', re.I))
+            logger.info(f"Found {len(cards)} potential class elements")
             
-            logger.info(f"Found {len(potential_elements)} potential class elements")
-            
-            for element in potential_elements:
+            for card in cards:
                 try:
-                    # 텍스트에서 패턴 매칭으로 정보 추출
-                    element_text = element.get_text()
-                    
-                    # 수강생 수 패턴 (가장 중요한 지표)
-                    student_matches = re.findall(r'(\d+,?\d*)\s*명', element_text)
-                    if not student_matches:
+                    # 텍스트에서 패턴 매칭으로 정보 추출 (수강생 수가 없으면 제외)
+                    fields = text_heuristics(card.text)
+                    if not fields or fields.students_count <= 0:
                         continue
                     
-                    students_count = max([int(match.replace(',', '')) for match in student_matches])
-                    
-                    # 선생님 이름 패턴
-                    name_patterns = [
-                        r'([가-힣]+(?:코치|쌤|선생|T\b))',
-                        r'([가-힣]{2,4})\s*(?:코치|쌤|선생)',
-                        r'(\b[가-힣]{2,4})\s+\d+,?\d*명'
-                    ]
-                    
-                    name = "정보없음"
-                    for pattern in name_patterns:
-                        match = re.search(pattern, element_text)
-                        if match:
-                            name = match.group(1)
-                            break
-                    
-                    # 클래스 제목 추출 (길고 설명적인 텍스트)
-                    sentences = re.split(r'[.!?]', element_text)
-                    class_title = "정보없음"
-                    for sentence in sentences:
-                        if len(sentence.strip()) > 20 and not re.search(r'\d+명', sentence):
-                            class_title = sentence.strip()[:100]
-                            break
-                    
-                    # 평점 추출
-                    rating_match = re.search(r'(\d+\.\d+)', element_text)
-                    rating = float(rating_match.group(1)) if rating_match else 0.0
-                    
-                    # 강의 수 추출
-                    lesson_match = re.search(r'(\d+)강', element_text)
-                    lesson_count = int(lesson_match.group(1)) if lesson_match else 0
-                    
-                    # 월 요금 추출
-                    fee_match = re.search(r'(\d+,?\d*)\s*원', element_text)
-                    monthly_fee = f"{fee_match.group(1)}원" if fee_match else "정보없음"
-                    
-                    # URL 추출
-                    link = element.find('a', href=True)
-                    class_url = ""
-                    if link:
-                        href = link['href']
-                        if href.startswith('/'):
-                            class_url = base_url + href
-                        else:
-                            class_url = href
-                    
-                    # 최소 조건 확인 (수강생 수가 있으면 추가)
-                    if students_count > 0:
-                        teacher = TeacherInfo(
-                            name=name,
-                            subject="일반",
-                            class_title=class_title,
-                            students_count=students_count,
-                            rating=rating,
-                            lesson_count=lesson_count,
-                            monthly_fee=monthly_fee,
-                            class_url=class_url
-                        )
-                        teachers.append(teacher)
-                        logger.debug(f"Added teacher: {name} - {students_count} students")
+                    teacher = TeacherInfo(
+                        name=fields.name,
+                        subject="일반",
+                        class_title=fields.class_title,
+                        students_count=fields.students_count,
+                        rating=fields.rating,
+                        lesson_count=fields.lesson_count,
+                        monthly_fee=fields.monthly_fee,
+                        class_url=absolute_url(card.class_url, base_url)
+                    )
+                    teachers.append(teacher)
+                    logger.debug(f"Added teacher: {fields.name} - {fields.students_count} students")
                         
                 except Exception as e:
                     logger.debug(f"Error parsing element: {str(e)}")
@@ -259,41 +180,27 @@ class ClassuSimpleFetch:
             "https://www.classu.co.kr/new/event/plan/65",  # BEST 클래스
         ]
         
-        all_teachers = []
+        # (이름, 수강생 수)로 중복을 제거하며 수강생 수 상위 50명만 유지
+        ranking = TopKAggregator(k=50, key=attrgetter("name", "students_count"))
+        
+        # 모든 URL을 한 세션에서 동시에 가져옴
+        contents = self.fetch_urls(urls_to_crawl)
         
         for url in urls_to_crawl:
             try:
-                html_content = self.fetch_url_content(url)
+                html_content = contents.get(url, "")
                 if html_content:
                     teachers = self.parse_class_info(html_content)
-                    all_teachers.extend(teachers)
+                    ranking.extend(teachers)
                     logger.info(f"Found {len(teachers)} teachers from {url}")
                 
-                # 요청 간 딜레이
-                time.sleep(3)
-                
             except Exception as e:
                 logger.error(f"Error collecting from {url}: {str(e)}")
                 continue
         
-        # 중복 제거 및 정렬
-        unique_teachers = {}
-        for teacher in all_teachers:
-            key = f"{teacher.name}_{teacher.students_count}"
-            if key not in unique_teachers or teacher.students_count > unique_teachers[key].students_count:
-                unique_teachers[key] = teacher
-        
-        # 수강생 수 기준으로 정렬
-        sorted_teachers = sorted(
-            unique_teachers.values(),
-            key=lambda x: x.students_count,
-            reverse=True
-        )
-        
-        # TOP 50 선택
-        top_50 = sorted_teachers[:50]
+        top_50 = ranking.top()
         
-        logger.info(f"Collected total {len(all_teachers)} teachers, unique {len(unique_teachers)}, returning TOP {len(top_50)}")
+        logger.info(f"Collected total {ranking.seen} teachers, unique {ranking.unique}, returning TOP {len(top_50)}")
         
         return top_50
     
@@ -311,17 +218,8 @@ class ClassuSimpleFetch:
                 "total_teachers": len(teachers),
                 "method": "ToolHive Fetch MCP + Simple Parsing",
                 "teachers": [
-                    {
-                        "rank": idx + 1,
-                        "name": teacher.name,
-                        "subject": teacher.subject,
-                        "class_title": teacher.class_title,
-                        "students_count": teacher.students_count,
-                        "rating": teacher.rating,
-                        "lesson_count": teacher.lesson_count,
-                        "monthly_fee": teacher.monthly_fee,
-                        "class_url": teacher.class_url
-                    }
+                    # 카드 텍스트에는 프로필 링크가 없으므로 profile_url은 저장하지 않음
+                    {"rank": idx + 1, **teacher.to_dict(skip=("profile_url",))}
                     for idx, teacher in enumerate(teachers)
                 ]
             }
@@ -351,6 +249,8 @@ def main():
         
         # 결과 저장
         collector.save_results(top_teachers)
+        # 실행 간 비교를 위해 공유 저장소에도 스냅샷으로 누적
+        save_to_store("teachers", top_teachers, source="classu_simple_fetch")
         
         # 콘솔에 요약 출력
         print("\n" + "="*60)
@@ -14,25 +14,14 @@ import re
 import time
 import logging
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
-from bs4 import BeautifulSoup
+
+from html_parsing import make_soup
+from records import RankedTeacher
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-@dataclass
-class TeacherInfo:
-    """선생님 정보를 저장하는 데이터 클래스"""
-    rank: int
-    name: str
-    class_title: str
-    discount_rate: str
-    monthly_price: str
-    rating: str
-    members_count: str
-    activity_count: str = ""
-
 class ClassuTop10Scraper:
     """클래스유 TOP 10 선생님 스크래퍼 (Fallback 버전)"""
     
@@ -41,7 +30,7 @@ class ClassuTop10Scraper:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36'
         })
-        self.teachers: List[TeacherInfo] = []
+        self.teachers: List[RankedTeacher] = []
         
     def fetch_page_content(self, url: str) -> str:
         """웹 페이지 내용을 가져옵니다."""
@@ -58,12 +47,12 @@ class ClassuTop10Scraper:
             logger.error(f"페이지 가져오기 실패: {e}")
             return ""
 
-    def parse_best_page_content(self, html_content: str) -> List[TeacherInfo]:
+    def parse_best_page_content(self, html_content: str) -> List[RankedTeacher]:
         """BEST 페이지 HTML에서 TOP 10 선생님 정보를 추출합니다."""
         teachers = []
         
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = make_soup(html_content)
             logger.info("HTML 파싱 시작")
             
             # 페이지 제목 확인
@@ -207,9 +196,9 @@ class ClassuTop10Scraper:
             except Exception as e:
                 logger.warning(f"실제 HTML 파싱 실패, 하드코딩된 데이터 사용: {e}")
             
-            # 하드코딩된 TOP 10 데이터를 TeacherInfo 객체로 변환
+            # 하드코딩된 TOP 10 데이터를 RankedTeacher 객체로 변환
             for data in top10_data:
-                teacher = TeacherInfo(
+                teacher = RankedTeacher(
                     rank=data["rank"],
                     name=data["name"],
                     class_title=data["class_title"],
@@ -228,7 +217,7 @@ class ClassuTop10Scraper:
             
         return teachers
 
-    def scrape_top10_teachers(self) -> List[TeacherInfo]:
+    def scrape_top10_teachers(self) -> List[RankedTeacher]:
         """TOP 10 선생님 정보를 스크래핑합니다."""
         try:
             # BEST 클래스 페이지 URL
@@ -250,7 +239,7 @@ class ClassuTop10Scraper:
             logger.error(f"스크래핑 중 오류 발생: {e}")
             return []
 
-    def save_results(self, teachers: List[TeacherInfo], filename: str = "classu_top10_fallback.json"):
+    def save_results(self, teachers: List[RankedTeacher], filename: str = "classu_top10_fallback.json"):
         """결과를 JSON 파일로 저장합니다."""
         try:
             data = {
@@ -261,16 +250,7 @@ class ClassuTop10Scraper:
                 "description": "클래스유 BEST 클래스 TOP 10 선생님",
                 "note": "브라우저에서 실제 확인한 데이터를 기반으로 추출",
                 "teachers": [
-                    {
-                        "rank": teacher.rank,
-                        "name": teacher.name,
-                        "class_title": teacher.class_title,
-                        "discount_rate": teacher.discount_rate,
-                        "monthly_price": teacher.monthly_price,
-                        "rating": teacher.rating,
-                        "members_count": teacher.members_count,
-                        "activity_count": teacher.activity_count
-                    }
+                    teacher.to_dict()
                     for teacher in teachers
                 ]
             }
@@ -12,8 +12,10 @@ import re
 import time
 import logging
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
-from bs4 import BeautifulSoup
+
+from html_parsing import BS4_FEATURES, make_soup
+from records import RankedTeacher
+from sse_decoder import iter_jsonrpc_messages
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -22,24 +24,12 @@ logger = logging.getLogger(__name__)
 # ToolHive Fetch MCP 서버 설정 (여러 포트 시도)
 FETCH_MCP_PORTS = [16330, 44322, 28632]
 
-@dataclass
-class TeacherInfo:
-    """선생님 정보를 저장하는 데이터 클래스"""
-    rank: int
-    name: str
-    class_title: str
-    discount_rate: str
-    monthly_price: str
-    rating: str
-    members_count: str
-    activity_count: str = ""
-
 class ClassuFetchMCPScraper:
     """ToolHive Fetch MCP를 활용한 클래스유 스크래퍼"""
     
     def __init__(self):
         self.mcp_url = None
-        self.teachers: List[TeacherInfo] = []
+        self.teachers: List[RankedTeacher] = []
         
     def find_working_mcp_server(self) -> Optional[str]:
         """작동하는 Fetch MCP 서버를 찾습니다."""
@@ -94,39 +84,33 @@ class ClassuFetchMCPScraper:
                 'Accept': 'application/json, text/event-stream'
             }
             
-            # MCP 서버에 요청
+            # MCP 서버에 요청 (SSE 응답은 스트리밍으로 읽음)
             response = requests.post(
                 f"{self.mcp_url}/mcp",
                 headers=headers,
                 data=json.dumps(payload),
-                timeout=30
+                timeout=30,
+                stream=True
             )
             
             logger.debug(f"MCP 응답 상태: {response.status_code}")
             
             if response.status_code == 200:
-                # SSE 응답 파싱
-                response_text = response.text
-                logger.debug(f"원시 응답: {response_text[:500]}...")
+                if response.headers.get('content-type', '').startswith('text/event-stream'):
+                    messages = iter_jsonrpc_messages(response.iter_content(chunk_size=65536))
+                else:
+                    messages = [response.json()]
                 
-                # event-stream에서 data 부분 추출
-                content = ""
-                for line in response_text.split('\n'):
-                    if line.startswith('data: '):
-                        data_str = line[6:].strip()
-                        if data_str and data_str != '[DONE]':
-                            try:
-                                data = json.loads(data_str)
-                                if isinstance(data, dict):
-                                    # result > content 구조에서 텍스트 추출
-                                    if "result" in data and "content" in data["result"]:
-                                        content_data = data["result"]["content"]
-                                        if isinstance(content_data, list) and len(content_data) > 0:
-                                            content += content_data[0].get("text", "")
-                                        elif isinstance(content_data, dict):
-                                            content += content_data.get("text", "")
-                            except json.JSONDecodeError:
-                                continue
+                # result > content 구조에서 텍스트 추출
+                content_parts = []
+                for data in messages:
+                    if isinstance(data, dict) and "result" in data and "content" in data["result"]:
+                        content_data = data["result"]["content"]
+                        if isinstance(content_data, list) and len(content_data) > 0:
+                            content_parts.append(content_data[0].get("text", ""))
+                        elif isinstance(content_data, dict):
+                            content_parts.append(content_data.get("text", ""))
+                content = "".join(content_parts)
                 
                 logger.info(f"가져온 콘텐츠 길이: {len(content)} 문자")
                 return content
@@ -138,7 +122,7 @@ class ClassuFetchMCPScraper:
             logger.error(f"MCP fetch 오류: {e}")
             return ""
 
-    def parse_best_page_content(self, html_content: str) -> List[TeacherInfo]:
+    def parse_best_page_content(self, html_content: str) -> List[RankedTeacher]:
         """BEST 페이지 HTML에서 TOP 10 선생님 정보를 추출합니다."""
         teachers = []
         
@@ -147,8 +131,8 @@ class ClassuFetchMCPScraper:
             return teachers
         
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            logger.info("BeautifulSoup으로 HTML 파싱 시작")
+            soup = make_soup(html_content)
+            logger.info(f"BeautifulSoup({BS4_FEATURES})으로 HTML 파싱 시작")
             
             # 클래스 카드들을 찾기 위한 다양한 선택자 시도
             selectors = [
@@ -308,7 +292,7 @@ class ClassuFetchMCPScraper:
             
             # 하드코딩된 데이터 사용 (실제 환경에서는 HTML 파싱 결과 사용)
             for data in hardcoded_top10:
-                teacher = TeacherInfo(
+                teacher = RankedTeacher(
                     rank=data["rank"],
                     name=data["name"],
                     class_title=data["class_title"],
@@ -327,7 +311,7 @@ class ClassuFetchMCPScraper:
             
         return teachers
 
-    def scrape_top10_teachers(self) -> List[TeacherInfo]:
+    def scrape_top10_teachers(self) -> List[RankedTeacher]:
         """TOP 10 선생님 정보를 스크래핑합니다."""
         try:
             # 1. 작동하는 MCP 서버 찾기
@@ -353,7 +337,7 @@ class ClassuFetchMCPScraper:
             logger.error(f"스크래핑 중 오류 발생: {e}")
             return []
 
-    def save_results(self, teachers: List[TeacherInfo], filename: str = "classu_top10_fetch_mcp.json"):
+    def save_results(self, teachers: List[RankedTeacher], filename: str = "classu_top10_fetch_mcp.json"):
         """결과를 JSON 파일로 저장합니다."""
         try:
             data = {
@@ -363,16 +347,7 @@ class ClassuFetchMCPScraper:
                 "source_url": "https://www.classu.co.kr/new/event/plan/57",
                 "description": "클래스유 BEST 클래스 TOP 10 선생님",
                 "teachers": [
-                    {
-                        "rank": teacher.rank,
-                        "name": teacher.name,
-                        "class_title": teacher.class_title,
-                        "discount_rate": teacher.discount_rate,
-                        "monthly_price": teacher.monthly_price,
-                        "rating": teacher.rating,
-                        "members_count": teacher.members_count,
-                        "activity_count": teacher.activity_count
-                    }
+                    teacher.to_dict()
                     for teacher in teachers
                 ]
             }
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+수집 결과 컬럼형 내보내기 (Parquet / Arrow IPC)
+
+TeacherInfo / RankedTeacher / BlogPost / ScrapingResult 레코드를 타입이 지정된
+컬럼으로 저장합니다. 분석 쪽에서 같은 파일을 반복해서 읽을 때 JSON을 매번
+파싱하지 않아도 됩니다.
+
+- 문자열로 수집된 숫자("954명", "46,000원", "4.8")는 int / float 컬럼으로 변환
+- 날짜("2024-12-01")는 date32, 수집 시각은 timestamp, 카테고리는 dictionary 인코딩
+- 수집 중 write()로 넣으면 row_group_size건마다 한 row group(배치)씩 기록
+- 확장자로 형식 결정: .parquet → Parquet(zstd), .arrow / .feather → Arrow IPC 파일
+
+pyarrow가 설치되어 있어야 합니다 (pip install pyarrow).
+
+기존 JSON / NDJSON 결과 변환:
+    python columnar_export.py classu_top10_fallback.json classu_top10.parquet --kind ranked
+    python columnar_export.py tistory_blog_posts.jsonl.gz posts.parquet --kind post
+"""
+
+import argparse
+import datetime
+import json
+import re
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from result_sink import is_stream_path, iter_records
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+_NUMBER = re.compile(r"-?\d[\d,]*(?:\.\d+)?")
+ARROW_SUFFIXES = (".arrow", ".feather", ".ipc")
+
+
+def _require_pyarrow():
+    if not HAS_PYARROW:
+        raise RuntimeError("Parquet/Arrow 내보내기에는 pyarrow 패키지가 필요합니다 (pip install pyarrow)")
+
+
+# -----------------------------------------------------------------------------
+# 값 변환
+# -----------------------------------------------------------------------------
+
+def parse_int(value: Any) -> Optional[int]:
+    """정수 또는 "1,234명" / "활동 496회" / "64%" 같은 문자열의 첫 숫자"""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    match = _NUMBER.search(str(value))
+    return int(float(match.group(0).replace(",", ""))) if match else None
+
+
+def parse_float(value: Any) -> Optional[float]:
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = _NUMBER.search(str(value))
+    return float(match.group(0).replace(",", "")) if match else None
+
+
+def _to_date(value: Any) -> Optional[datetime.date]:
+    if not value:
+        return None
+    try:
+        return datetime.date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+def _to_timestamp(value: Any) -> Optional[datetime.datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.datetime.strptime(str(value), "%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return None
+
+
+def _to_str(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _to_bool(value: Any) -> Optional[bool]:
+    return None if value is None else bool(value)
+
+
+def _to_str_list(value: Any) -> List[str]:
+    return [str(item) for item in value] if value else []
+
+
+# 컬럼 정의: (이름, 타입 이름, 변환 함수)
+ColumnSpec = Tuple[str, str, Callable[[Any], Any]]
+
+SCHEMAS: Dict[str, List[ColumnSpec]] = {
+    "teacher": [
+        ("name", "string", _to_str),
+        ("subject", "category", _to_str),
+        ("class_title", "string", _to_str),
+        ("students_count", "int64", parse_int),
+        ("rating", "float64", parse_float),
+        ("lesson_count", "int32", parse_int),
+        ("monthly_fee", "int64", parse_int),      # "46,000원" → 46000 (정보없음 → null)
+        ("profile_url", "string", _to_str),
+        ("class_url", "string", _to_str),
+    ],
+    "ranked": [
+        ("rank", "int32", parse_int),
+        ("name", "string", _to_str),
+        ("class_title", "string", _to_str),
+        ("discount_rate", "int32", parse_int),    # "64%" → 64
+        ("monthly_price", "int64", parse_int),
+        ("rating", "float64", parse_float),
+        ("members_count", "int64", parse_int),
+        ("activity_count", "int64", parse_int),
+    ],
+    "post": [
+        ("title", "string", _to_str),
+        ("url", "string", _to_str),
+        ("category", "category", _to_str),
+        ("date", "date", _to_date),
+        ("content", "string", _to_str),
+        ("summary", "string", _to_str),
+        ("thumbnail", "string", _to_str),
+        ("tags", "string_list", _to_str_list),
+    ],
+    "result": [
+        ("target_name", "string", _to_str),
+        ("target_url", "string", _to_str),
+        ("title", "string", _to_str),
+        ("content", "string", _to_str),
+        ("error", "string", _to_str),
+        ("timestamp", "timestamp", _to_timestamp),
+        ("from_cache", "bool", _to_bool),
+    ],
+}
+
+# 레코드 클래스 이름 → 스키마
+KIND_BY_RECORD = {
+    "TeacherInfo": "teacher",
+    "RankedTeacher": "ranked",
+    "BlogPost": "post",
+    "ScrapingResult": "result",
+}
+
+
+def _arrow_type(name: str):
+    return {
+        "string": pa.string(),
+        "category": pa.dictionary(pa.int32(), pa.string()),
+        "int32": pa.int32(),
+        "int64": pa.int64(),
+        "float64": pa.float64(),
+        "bool": pa.bool_(),
+        "date": pa.date32(),
+        "timestamp": pa.timestamp("s"),
+        "string_list": pa.list_(pa.string()),
+    }[name]
+
+
+def arrow_schema(kind: str) -> "pa.Schema":
+    _require_pyarrow()
+    return pa.schema([pa.field(name, _arrow_type(type_name)) for name, type_name, _ in SCHEMAS[kind]])
+
+
+def _flatten(data: Mapping[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """중첩 dict를 밑줄로 이어 붙인 평면 dict로 만듭니다 (target.name → target_name)."""
+    flat = {}
+    for key, value in data.items():
+        if isinstance(value, Mapping):
+            flat.update(_flatten(value, f"{prefix}{key}_"))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def _to_row(record: Any) -> Dict[str, Any]:
+    return _flatten(record.to_dict() if hasattr(record, "to_dict") else record)
+
+
+# -----------------------------------------------------------------------------
+# 쓰기
+# -----------------------------------------------------------------------------
+
+class ColumnarWriter:
+    """레코드를 컬럼 버퍼에 모았다가 row group 단위로 기록하는 스레드 안전 writer"""
+
+    def __init__(self, path: str, kind: str, row_group_size: int = 10000, file_format: Optional[str] = None):
+        _require_pyarrow()
+        if kind not in SCHEMAS:
+            raise ValueError(f"알 수 없는 레코드 종류: {kind} (가능한 값: {', '.join(SCHEMAS)})")
+        self.path = path
+        self.kind = kind
+        self.row_group_size = max(1, row_group_size)
+        self.file_format = file_format or ("arrow" if path.lower().endswith(ARROW_SUFFIXES) else "parquet")
+        self.schema = arrow_schema(kind)
+        self.count = 0
+        self.row_groups = 0
+        self._columns = SCHEMAS[kind]
+        self._buffer: Dict[str, List[Any]] = {name: [] for name, _, _ in self._columns}
+        self._lock = threading.Lock()
+        if self.file_format == "arrow":
+            self._writer = pa.ipc.new_file(path, self.schema)
+        else:
+            self._writer = pq.ParquetWriter(path, self.schema, compression="zstd")
+
+    def write(self, record: Any) -> int:
+        """레코드(to_dict를 가진 객체 또는 dict) 하나를 버퍼에 넣고, 가득 차면 row group을 기록합니다."""
+        row = _to_row(record)
+        with self._lock:
+            for name, _, convert in self._columns:
+                self._buffer[name].append(convert(row.get(name)))
+            offset = self.count
+            self.count += 1
+            if len(self._buffer[self._columns[0][0]]) >= self.row_group_size:
+                self._flush()
+        return offset
+
+    def write_many(self, records: Iterable[Any]) -> int:
+        written = 0
+        for record in records:
+            self.write(record)
+            written += 1
+        return written
+
+    def _flush(self):
+        if not self._buffer[self._columns[0][0]]:
+            return
+        table = pa.Table.from_pydict(self._buffer, schema=self.schema)
+        if self.file_format == "arrow":
+            self._writer.write_table(table, max_chunksize=self.row_group_size)
+        else:
+            self._writer.write_table(table, row_group_size=self.row_group_size)
+        self.row_groups += 1
+        for values in self._buffer.values():
+            values.clear()
+
+    def flush(self):
+        """버퍼에 남은 레코드를 row group으로 기록합니다."""
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        with self._lock:
+            if self._writer is None:
+                return
+            self._flush()
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def export_records(path: str, records: Iterable[Any], kind: Optional[str] = None,
+                   row_group_size: int = 10000) -> int:
+    """레코드 목록을 한 번에 내보냅니다. kind가 없으면 첫 레코드의 클래스로 정합니다."""
+    iterator = iter(records)
+    first = next(iterator, None)
+    if kind is None:
+        if first is None:
+            raise ValueError("레코드가 없으면 kind를 지정해야 합니다.")
+        kind = KIND_BY_RECORD[type(first).__name__]
+    with ColumnarWriter(path, kind, row_group_size=row_group_size) as writer:
+        if first is not None:
+            writer.write(first)
+        writer.write_many(iterator)
+        return writer.count
+
+
+def _iter_input(path: str, items_key: Optional[str]) -> Iterator[Dict[str, Any]]:
+    """요약 JSON(최상위 배열 또는 items_key 배열) / NDJSON 스트림의 항목을 읽습니다."""
+    if is_stream_path(path):
+        yield from iter_records(path)
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        yield from data
+        return
+    if items_key is None:
+        items_key = next((key for key in ("teachers", "posts", "results") if key in data), None)
+    yield from data.get(items_key, []) if items_key else []
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="JSON / NDJSON 수집 결과를 Parquet 또는 Arrow 파일로 변환합니다.")
+    parser.add_argument("input", help="요약 JSON 또는 NDJSON 스트림 (.jsonl / .jsonl.gz / .jsonl.zst)")
+    parser.add_argument("output", help="출력 파일 (.parquet / .arrow)")
+    parser.add_argument("--kind", required=True, choices=sorted(SCHEMAS), help="레코드 종류")
+    parser.add_argument("--items-key", default=None, help="요약 JSON에서 항목 배열의 키 (기본: 자동)")
+    parser.add_argument("--row-group-size", type=int, default=10000, help="row group 당 레코드 수")
+    args = parser.parse_args()
+
+    written = export_records(args.output, _iter_input(args.input, args.items_key), kind=args.kind,
+                             row_group_size=args.row_group_size)
+    print(f"📦 {args.output}: {written}건 ({args.kind})")
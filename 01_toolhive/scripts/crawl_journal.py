@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+크롤링 체크포인트 저널
+
+URL마다 상태(in_flight / done / failed), 시도 횟수, 결과 스트림에서의 위치
+(output_offset)를 SQLite에 기록합니다. 수집 도중 브라우저가 죽거나 배포로
+프로세스가 내려가도 --resume으로 다시 실행하면 완료된 URL은 건너뛰고
+실패했거나 처리 중이던 URL만 다시 수집합니다.
+
+- 저장소: SQLite (WAL 모드, 상태가 바뀔 때마다 커밋)
+- job: 한 파일을 여러 스크립트가 함께 쓸 수 있도록 작업 이름으로 구분
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set
+
+IN_FLIGHT, DONE, FAILED = "in_flight", "done", "failed"
+
+
+class CrawlJournal:
+    """URL별 수집 상태를 기록하는 체크포인트 저널"""
+
+    def __init__(self, path: str = "crawl_journal.sqlite3", job: str = "default"):
+        self.path = path
+        self.job = job
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS tasks (
+                job TEXT NOT NULL,
+                url TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                output_offset INTEGER,
+                error TEXT,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (job, url)
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (job, status)")
+        self._db.commit()
+
+    def _execute(self, sql: str, params: tuple = ()):
+        with self._lock:
+            self._db.execute(sql, params)
+            self._db.commit()
+
+    def reset(self):
+        """이 작업의 기록을 지우고 처음부터 시작합니다."""
+        self._execute("DELETE FROM tasks WHERE job = ?", (self.job,))
+
+    def start(self, url: str):
+        """URL 처리를 시작했음을 기록하고 시도 횟수를 올립니다."""
+        self._execute(
+            "INSERT INTO tasks (job, url, status, attempts, updated_at) VALUES (?, ?, ?, 1, ?) "
+            "ON CONFLICT (job, url) DO UPDATE SET status = excluded.status, attempts = attempts + 1, "
+            "error = NULL, updated_at = excluded.updated_at",
+            (self.job, url, IN_FLIGHT, time.time())
+        )
+
+    def done(self, url: str, output_offset: Optional[int] = None):
+        """URL 처리 완료와 결과 스트림에서의 위치를 기록합니다."""
+        self._finish(url, DONE, output_offset, None)
+
+    def fail(self, url: str, error: str, output_offset: Optional[int] = None):
+        """URL 처리 실패를 기록합니다 (--resume 때 다시 시도)."""
+        self._finish(url, FAILED, output_offset, error)
+
+    def _finish(self, url: str, status: str, output_offset: Optional[int], error: Optional[str]):
+        self._execute(
+            "INSERT INTO tasks (job, url, status, attempts, output_offset, error, updated_at) "
+            "VALUES (?, ?, ?, 1, ?, ?, ?) "
+            "ON CONFLICT (job, url) DO UPDATE SET status = excluded.status, "
+            "output_offset = excluded.output_offset, error = excluded.error, updated_at = excluded.updated_at",
+            (self.job, url, status, output_offset, error, time.time())
+        )
+
+    def completed(self, written: Optional[int] = None) -> Set[str]:
+        """완료된 URL 집합
+
+        written에 결과 스트림에 실제로 남아 있는 레코드 수를 주면, 저널에는 완료로
+        기록됐지만 fsync 전에 죽어 결과가 사라진 URL은 완료로 보지 않습니다.
+        """
+        sql = "SELECT url FROM tasks WHERE job = ? AND status = ?"
+        params: tuple = (self.job, DONE)
+        if written is not None:
+            sql += " AND (output_offset IS NULL OR output_offset < ?)"
+            params += (written,)
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+        return {row[0] for row in rows}
+
+    def remaining(self, urls: Iterable[str], written: Optional[int] = None) -> List[str]:
+        """urls 중 아직 완료되지 않은 URL을 순서대로 반환합니다."""
+        done = self.completed(written)
+        return [url for url in urls if url not in done]
+
+    def offsets(self) -> Set[int]:
+        """URL별 마지막 결과가 결과 스트림에서 차지하는 위치 집합 (재시도 전 기록 제외용)"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT output_offset FROM tasks WHERE job = ? AND output_offset IS NOT NULL", (self.job,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def summary(self) -> Dict[str, int]:
+        """상태별 URL 수"""
+        with self._lock:
+            rows = self._db.execute("SELECT status, COUNT(*) FROM tasks WHERE job = ? GROUP BY status", (self.job,)).fetchall()
+        counts = {IN_FLIGHT: 0, DONE: 0, FAILED: 0}
+        counts.update(dict(rows))
+        return counts
+
+    def close(self):
+        with self._lock:
+            self._db.close()
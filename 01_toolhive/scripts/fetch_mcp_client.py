@@ -3,103 +3,66 @@
 ToolHive fetch MCP 서버를 사용하여 웹 콘텐츠를 가져오고 제목을 추출하는 클라이언트
 """
 
-import requests
 import json
-import re
-from bs4 import BeautifulSoup
 from typing import Optional, Dict, Any
 
+from html_parsing import extract_title
+from toolhive_mcp_client import SyncMCPClient
+
 FETCH_MCP_URL = "http://127.0.0.1:44322"
 
 class FetchMCPClient:
     def __init__(self, base_url: str = FETCH_MCP_URL):
         self.base_url = base_url
         self.session_id: Optional[str] = None
-        self.session = requests.Session()
+        self.client: Optional[SyncMCPClient] = None
         
     def get_session_id(self) -> Optional[str]:
         """SSE 엔드포인트에서 sessionId를 획득"""
-        try:
-            print("🔗 fetch MCP SSE 연결 시도...")
-            # fetch MCP는 다른 엔드포인트 패턴을 사용할 수 있음
-            endpoints_to_try = ["/mcp", "/sse", "/"]
-            
-            for endpoint in endpoints_to_try:
-                print(f"시도 중: {self.base_url}{endpoint}")
-                try:
-                    response = self.session.get(
-                        f"{self.base_url}{endpoint}", 
-                        headers={"Accept": "text/event-stream"},
-                        stream=True,
-                        timeout=5
-                    )
-                    
-                    print(f"응답 상태: {response.status_code}")
-                    
-                    if response.status_code == 200:
-                        for line in response.iter_lines(decode_unicode=True, chunk_size=1):
-                            if line and line.startswith("data:"):
-                                data = line.replace("data:", "").strip()
-                                print(f"📡 SSE 데이터: {data}")
-                                
-                                # sessionId 패턴 매칭
-                                match = re.search(r"sessionId=([a-f0-9\-]+)", data)
-                                if match:
-                                    self.session_id = match.group(1)
-                                    print(f"✅ 세션 ID 획득: {self.session_id}")
-                                    response.close()
-                                    return self.session_id
-                    response.close()
-                except Exception as e:
-                    print(f"엔드포인트 {endpoint} 실패: {e}")
-                    continue
-                        
-        except Exception as e:
-            print(f"❌ SSE 연결 실패: {e}")
-            return None
+        print("🔗 fetch MCP SSE 연결 시도...")
+        # fetch MCP는 다른 엔드포인트 패턴을 사용할 수 있음
+        endpoints_to_try = ["/mcp", "/sse", "/"]
+        
+        for endpoint in endpoints_to_try:
+            print(f"시도 중: {self.base_url}{endpoint}")
+            client = SyncMCPClient(self.base_url, sse_path=endpoint.rstrip("/"), message_path="/mcp",
+                                   client_name="fetch-test-client")
+            try:
+                self.session_id = client.connect()
+                self.client = client
+                print(f"✅ 세션 ID 획득: {self.session_id}")
+                return self.session_id
+            except Exception as e:
+                print(f"엔드포인트 {endpoint} 실패: {e}")
+                client.close()
+                continue
         
         print("❌ sessionId를 찾을 수 없습니다.")
         return None
     
-    def send_request(self, method: str, params: Dict[str, Any] = None, rpc_id: int = 1) -> Optional[Dict]:
+    def send_request(self, method: str, params: Dict[str, Any] = None) -> Optional[Dict]:
         """fetch MCP 서버에 요청 전송"""
         if not self.session_id:
             print("❌ 세션 ID가 없습니다.")
             return None
-            
-        # fetch MCP는 다른 URL 패턴을 사용할 수 있음
-        url = f"{self.base_url}/mcp?sessionId={self.session_id}"
-        payload = {
-            "jsonrpc": "2.0",
-            "id": rpc_id,
-            "method": method,
-            "params": params or {}
-        }
-        
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json, text/event-stream"
-        }
         
         try:
-            print(f"📤 요청: {method} -> {url}")
-            print(f"📦 페이로드: {json.dumps(payload, indent=2)}")
-            
-            response = self.session.post(url, headers=headers, json=payload, timeout=30)
-            
-            print(f"📥 응답 상태: {response.status_code}")
-            print(f"📄 응답 내용: {response.text}")
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print(f"❌ HTTP 오류: {response.status_code}")
-                return None
+            print(f"📤 요청: {method} -> {self.client.client.message_url}")
+            result = self.client.request(method, params)
+            print(f"📄 응답 내용: {json.dumps(result, ensure_ascii=False)[:500]}")
+            return result
                 
         except Exception as e:
             print(f"❌ 요청 실패: {e}")
             return None
     
+    def close(self):
+        """SSE 연결과 커넥션 풀을 닫습니다."""
+        if self.client:
+            self.client.close()
+            self.client = None
+            self.session_id = None
+    
     def initialize(self) -> bool:
         """MCP 서버 초기화"""
         print("\n🔧 === fetch MCP 서버 초기화 ===")
@@ -155,10 +118,10 @@ class FetchMCPClient:
     def extract_title_from_html(self, html_content: str) -> Optional[str]:
         """HTML에서 제목 추출"""
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            title_tag = soup.find('title')
-            if title_tag:
-                return title_tag.get_text().strip()
+            # DOM을 만들지 않고 <title>만 바로 찾음
+            title = extract_title(html_content)
+            if title is not None:
+                return title
             else:
                 print("❌ HTML에서 <title> 태그를 찾을 수 없습니다.")
                 return None
@@ -215,6 +178,8 @@ def main():
         print(f"\n🎉 최종 결과: {classu_title}")
     else:
         print("\n❌ 클래스유 사이트 제목 추출 실패")
+    
+    client.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+HTML 파서 백엔드 선택 계층
+
+설치된 패키지 중 가장 빠른 파서를 골라 사용합니다.
+- selectolax (C, Lexbor/Modest): CSS 선택자 한 개로 텍스트만 필요할 때
+- lxml (C, libxml2): BeautifulSoup 트리가 필요할 때의 백엔드
+- html.parser: 위 패키지가 없을 때의 순수 파이썬 기본값
+
+<title>만 필요한 경우에는 DOM을 만들지 않고 <head> 안에서 정규식으로 바로 찾습니다.
+"""
+
+import html
+import importlib.util
+import re
+from typing import Optional
+
+from bs4 import BeautifulSoup
+
+try:
+    from selectolax.parser import HTMLParser as SelectolaxParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
+# BeautifulSoup "lxml" 백엔드 사용 가능 여부 (모듈을 불러오지 않고 확인)
+HAS_LXML = importlib.util.find_spec("lxml") is not None
+
+# BeautifulSoup에 넘길 파서 이름
+BS4_FEATURES = "lxml" if HAS_LXML else "html.parser"
+
+_TITLE = re.compile(r"<title\b[^>]*>(.*?)</title\s*>", re.IGNORECASE | re.DOTALL)
+_HEAD_END = re.compile(r"</head\s*>|<body\b", re.IGNORECASE)
+
+
+def parser_backend() -> str:
+    """select_text가 사용할 백엔드 이름"""
+    if HAS_SELECTOLAX:
+        return "selectolax"
+    return BS4_FEATURES
+
+
+def make_soup(html_content: str) -> BeautifulSoup:
+    """가장 빠른 사용 가능 백엔드로 BeautifulSoup 트리를 만듭니다."""
+    return BeautifulSoup(html_content, BS4_FEATURES)
+
+
+def _inside_raw_block(prefix: str) -> bool:
+    """prefix 끝이 닫히지 않은 <script> / <svg> / 주석 안인지 확인합니다."""
+    lower = prefix.lower()
+    return (lower.count("<script") > lower.count("</script")
+            or lower.count("<svg") > lower.count("</svg")
+            or prefix.count("<!--") > prefix.count("-->"))
+
+
+def _parse_title(html_content: str) -> Optional[str]:
+    """파서로 문서 제목(<head>의 <title>)을 찾습니다."""
+    if HAS_SELECTOLAX:
+        node = SelectolaxParser(html_content).css_first("head > title")
+        return node.text().strip() if node is not None else None
+    element = make_soup(html_content).select_one("head > title")
+    return element.get_text().strip() if element is not None else None
+
+
+def extract_title(html_content: str) -> Optional[str]:
+    """문서의 <title> 텍스트를 반환합니다 (엔티티 디코딩, 앞뒤 공백 제거).
+
+    <head> 안의 <title>은 DOM 없이 정규식으로 찾고, <head> 경계를 찾을 수 없거나
+    일치한 위치가 스크립트 문자열 / 인라인 SVG / 주석 안이면 파서로 찾습니다.
+    """
+    if not html_content:
+        return None
+    head_end = _HEAD_END.search(html_content)
+    if head_end:
+        match = _TITLE.search(html_content, 0, head_end.start())
+        if not match:
+            return None
+        if not _inside_raw_block(html_content[:match.start()]):
+            return html.unescape(match.group(1)).strip()
+    return _parse_title(html_content)
+
+
+def select_text(html_content: str, selector: str) -> Optional[str]:
+    """CSS 선택자에 처음 일치하는 요소의 텍스트를 반환합니다. 없으면 None"""
+    if selector.strip().lower() == "title":
+        return extract_title(html_content)
+    if HAS_SELECTOLAX:
+        node = SelectolaxParser(html_content).css_first(selector)
+        return node.text().strip() if node is not None else None
+    element = make_soup(html_content).select_one(selector)
+    return element.get_text().strip() if element is not None else None
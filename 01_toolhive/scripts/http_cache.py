@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+HTTP 조건부 요청 디스크 캐시
+
+URL별로 ETag / Last-Modified와 응답 본문을 디스크에 저장하고,
+재수집 시 If-None-Match / If-Modified-Since를 보내 304 응답이면
+캐시된 본문을 그대로 사용합니다. 전체 크기가 max_bytes를 넘으면
+가장 오래 사용하지 않은 항목부터 삭제합니다 (LRU).
+
+- 인덱스: SQLite (cache_dir/index.sqlite3)
+- 본문: cache_dir/<URL의 SHA-256>.body
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import requests
+
+
+@dataclass
+class CachedResponse:
+    """캐시를 거친 응답"""
+    url: str
+    status_code: int
+    content: bytes
+    encoding: Optional[str]
+    from_cache: bool = False
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+
+class HTTPCache:
+    """ETag/Last-Modified 기반 조건부 요청 캐시 (크기 기준 LRU 삭제)"""
+
+    def __init__(self, cache_dir: str = ".http_cache", max_bytes: int = 200 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.cache_dir / "index.sqlite3"), check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                encoding TEXT,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL,
+                meta TEXT
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries (last_access)")
+        self._db.commit()
+        self.stats = {"hits": 0, "misses": 0, "bytes_saved": 0}
+
+    def _body_path(self, url: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.body"
+
+    def _lookup(self, url: str) -> Optional[tuple]:
+        with self._lock:
+            return self._db.execute(
+                "SELECT etag, last_modified, encoding, size, meta FROM entries WHERE url = ?", (url,)
+            ).fetchone()
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """캐시 항목이 있으면 조건부 요청 헤더를 반환합니다."""
+        row = self._lookup(url)
+        if not row or not self._body_path(url).exists():
+            return {}
+        etag, last_modified = row[0], row[1]
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def load(self, url: str) -> Optional[CachedResponse]:
+        """캐시된 응답을 읽고 최근 사용 시각을 갱신합니다."""
+        row = self._lookup(url)
+        body_path = self._body_path(url)
+        if not row or not body_path.exists():
+            return None
+        with self._lock:
+            self._db.execute("UPDATE entries SET last_access = ? WHERE url = ?", (time.time(), url))
+            self._db.commit()
+        return CachedResponse(
+            url=url,
+            status_code=200,
+            content=body_path.read_bytes(),
+            encoding=row[2],
+            from_cache=True,
+            meta=json.loads(row[4]) if row[4] else {}
+        )
+
+    def store(self, url: str, response: requests.Response, meta: Optional[Dict[str, Any]] = None):
+        """검증자(ETag/Last-Modified)가 있는 200 응답만 저장합니다."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code != 200 or not (etag or last_modified):
+            return
+        content = response.content
+        if len(content) > self.max_bytes:
+            return
+        self._body_path(url).write_bytes(content)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (url, etag, last_modified, encoding, size, last_access, meta) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, response.encoding, len(content), time.time(),
+                 json.dumps(meta, ensure_ascii=False) if meta else None)
+            )
+            self._db.commit()
+        self._evict()
+
+    def update_meta(self, url: str, meta: Dict[str, Any]):
+        """파싱 결과처럼 본문에서 파생된 값을 항목에 저장해 304 때 재사용합니다."""
+        with self._lock:
+            self._db.execute("UPDATE entries SET meta = ? WHERE url = ?",
+                             (json.dumps(meta, ensure_ascii=False), url))
+            self._db.commit()
+
+    def _evict(self):
+        """전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다."""
+        with self._lock:
+            total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            evicted = []
+            for url, size in self._db.execute("SELECT url, size FROM entries ORDER BY last_access"):
+                if total <= self.max_bytes:
+                    break
+                evicted.append(url)
+                total -= size
+            self._db.executemany("DELETE FROM entries WHERE url = ?", [(url,) for url in evicted])
+            self._db.commit()
+        for url in evicted:
+            self._body_path(url).unlink(missing_ok=True)
+
+    def get(self, session: requests.Session, url: str, **kwargs) -> CachedResponse:
+        """조건부 GET을 보내고, 304면 캐시 본문을, 200이면 새 본문을 저장해 반환합니다."""
+        base_headers = kwargs.pop("headers", None) or {}
+        response = session.get(url, headers={**base_headers, **self.conditional_headers(url)}, **kwargs)
+
+        if response.status_code == 304:
+            cached = self.load(url)
+            if cached:
+                with self._lock:
+                    self.stats["hits"] += 1
+                    self.stats["bytes_saved"] += len(cached.content)
+                return cached
+            # 304 사이에 항목이 삭제된 경우 조건 없이 다시 받음
+            response = session.get(url, headers=base_headers, **kwargs)
+
+        response.raise_for_status()
+        with self._lock:
+            self.stats["misses"] += 1
+        self.store(url, response)
+        return CachedResponse(
+            url=url,
+            status_code=response.status_code,
+            content=response.content,
+            encoding=response.encoding
+        )
+
+    def close(self):
+        with self._lock:
+            self._db.close()
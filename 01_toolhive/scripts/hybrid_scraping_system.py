@@ -9,37 +9,50 @@ Desktop Commander의 MCP 브라우저 기능과 Python 라이브러리를 조합
 실용적인 스크래핑 솔루션을 제공합니다.
 """
 
+import argparse
 import asyncio
-import json
 import time
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Any, Iterator, Optional
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 
-@dataclass
-class ScrapingTarget:
-    """스크래핑 대상 사이트 정보"""
-    name: str
-    url: str
-    title_selector: str = "title"
-    description: str = ""
+from columnar_export import ColumnarWriter
+from crawl_journal import CrawlJournal
+from crawl_scheduler import CrawlScheduler, host_of
+from html_parsing import select_text
+from http_cache import HTTPCache
+from records import ScrapingResult, ScrapingTarget
+from result_sink import ResultSink, iter_offsets, rebuild_summary, write_summary
+from scrape_store import save_to_store
 
-@dataclass 
-class ScrapingResult:
-    """스크래핑 결과"""
-    target: ScrapingTarget
-    title: Optional[str] = None
-    content: Optional[str] = None
-    error: Optional[str] = None
-    timestamp: Optional[str] = None
+RESULT_STREAM = "toolhive_scraping_results.jsonl"
+JOURNAL_FILE = "toolhive_scraping_journal.sqlite3"
 
 class ToolHiveScrapingSystem:
     """ToolHive MCP + Python 하이브리드 스크래핑 시스템"""
     
-    def __init__(self):
+    def __init__(self, cache_dir: str = ".http_cache", cache_max_bytes: int = 200 * 1024 * 1024,
+                 pool_size: int = 16, sink: Optional[ResultSink] = None,
+                 journal: Optional[CrawlJournal] = None, exporter: Optional[ColumnarWriter] = None):
+        # 결과 스트림이 없을 때만 메모리에 결과를 모음 (있으면 스트림에서 다시 읽음)
         self.results: List[ScrapingResult] = []
+        # 이번 실행 결과가 스트림에서 시작하는 위치
+        self.run_start = 0
         self.mcp_available = False
+        # 결과가 나올 때마다 한 줄씩 기록하는 스트림 (중단돼도 기록된 결과는 남음)
+        self.sink = sink
+        # URL별 진행 상태 체크포인트 (--resume 시 완료된 대상은 건너뜀)
+        self.journal = journal
+        # Parquet/Arrow 내보내기 (row group 단위로 수집 중에 기록)
+        self.exporter = exporter
+        
+        # keep-alive 커넥션을 재사용하는 공용 세션 + 조건부 요청 캐시
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.cache = HTTPCache(cache_dir, max_bytes=cache_max_bytes)
         
     def check_mcp_availability(self) -> bool:
         """MCP 브라우저 기능 사용 가능 여부 확인"""
@@ -89,28 +102,29 @@ class ToolHiveScrapingSystem:
             )
     
     def scrape_with_requests(self, target: ScrapingTarget) -> ScrapingResult:
-        """Python requests + BeautifulSoup을 사용한 폴백 스크래핑"""
+        """Python requests + HTML 파서(selectolax/lxml/html.parser)를 사용한 폴백 스크래핑"""
         print(f"🐍 Python으로 스크래핑: {target.name} ({target.url})")
         
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(target.url, headers=headers, timeout=10)
-            response.raise_for_status()
+            response = self.cache.get(self.session, target.url, timeout=10)
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # 304로 받은 본문은 이전에 추출한 제목을 그대로 사용 (재파싱 생략)
+            if response.from_cache and response.meta.get("title_selector") == target.title_selector:
+                title = response.meta.get("title")
+            else:
+                # 제목 추출 ("title" 선택자는 DOM 없이 바로 추출)
+                title = select_text(response.text, target.title_selector)
+                self.cache.update_meta(target.url, {"title_selector": target.title_selector, "title": title})
             
-            # 제목 추출
-            title_element = soup.select_one(target.title_selector)
-            title = title_element.get_text().strip() if title_element else None
+            if response.from_cache:
+                print(f"♻️ 변경 없음 (304), 캐시 사용: {target.url}")
             
             return ScrapingResult(
                 target=target,
                 title=title,
                 content=response.text[:1000],  # 처음 1000자만 저장
-                timestamp=time.strftime("%Y-%m-%d %H:%M:%S")
+                timestamp=time.strftime("%Y-%m-%d %H:%M:%S"),
+                from_cache=response.from_cache
             )
             
         except Exception as e:
@@ -142,40 +156,88 @@ class ToolHiveScrapingSystem:
         
         return result
     
-    def scrape_multiple(self, targets: List[ScrapingTarget]) -> List[ScrapingResult]:
-        """다중 사이트 스크래핑"""
-        print(f"🚀 대규모 스크래핑 시작: {len(targets)}개 사이트")
-        
-        results = []
-        for i, target in enumerate(targets, 1):
-            print(f"\n📊 진행률: {i}/{len(targets)}")
-            result = self.scrape_single(target)
-            results.append(result)
-            self.results.append(result)
-            
-            # 요청 간 지연 (서버 부하 방지)
-            if i < len(targets):
-                time.sleep(1)
+    def scrape_multiple(self, targets: List[ScrapingTarget], max_concurrency: int = 8,
+                        per_host_interval: float = 1.0, resume: bool = False) -> List[ScrapingResult]:
+        """다중 사이트 스크래핑
+        
+        서로 다른 호스트는 최대 max_concurrency개까지 병렬로 처리하고,
+        같은 호스트에는 per_host_interval초 간격을 지킵니다 (서버 부하 방지).
+        resume=True면 저널에 완료로 기록된 대상은 건너뛰고 실패/처리 중이던 대상만 다시 수집합니다.
+        결과 스트림이 있으면 결과를 메모리에 모으지 않고 빈 목록을 반환합니다 (iter_run_results 사용).
+        """
+        if self.journal:
+            if resume:
+                done_urls = self.journal.completed(self.sink.count if self.sink else None)
+                skipped = sum(1 for t in targets if t.url in done_urls)
+                targets = [t for t in targets if t.url not in done_urls]
+                print(f"⏯️ 이어서 수집: 완료된 {skipped}개 건너뜀, {len(targets)}개 남음")
+            else:
+                self.journal.reset()
+        
+        self.run_start = self.sink.count if self.sink else 0
+        print(f"🚀 대규모 스크래핑 시작: {len(targets)}개 사이트 (동시 실행: {max_concurrency})")
+        
+        scheduler = CrawlScheduler(max_concurrency=max_concurrency, per_host_interval=per_host_interval)
+        
+        def scrape(target: ScrapingTarget) -> ScrapingResult:
+            if self.journal:
+                self.journal.start(target.url)
+            return self.scrape_single(target)
+        
+        def report(done: int, target: ScrapingTarget, result: ScrapingResult):
+            offset = self.sink.write(result) if self.sink else None
+            if self.exporter:
+                self.exporter.write(result)
+            if self.journal:
+                if result.error:
+                    self.journal.fail(target.url, result.error, offset)
+                else:
+                    self.journal.done(target.url, offset)
+            print(f"\n📊 진행률: {done}/{len(targets)} ({target.name})")
+        
+        results = scheduler.run(targets, scrape, key=lambda t: host_of(t.url), on_result=report,
+                                collect=self.sink is None)
+        self.results.extend(results)
         
         return results
     
+    def iter_run_results(self) -> Iterator[ScrapingResult]:
+        """이번 실행의 결과를 하나씩 반환합니다 (스트림이 있으면 스트림에서 다시 읽음)."""
+        if not self.sink:
+            yield from self.results
+            return
+        self.sink.sync()
+        for offset, data in iter_offsets(self.sink.path):
+            if offset >= self.run_start:
+                yield ScrapingResult.from_dict(data)
+    
+    @staticmethod
+    def summary_item(data: Dict[str, Any]) -> Dict[str, Any]:
+        """ScrapingResult.to_dict() 형태를 요약 파일 항목으로 바꿉니다 (본문 제외)."""
+        return {
+            "target_name": data["target"]["name"],
+            "target_url": data["target"]["url"],
+            "title": data.get("title"),
+            "error": data.get("error"),
+            "timestamp": data.get("timestamp"),
+            "from_cache": data.get("from_cache", False)
+        }
+    
     def save_results(self, filename: str = "scraping_results.json"):
-        """결과를 JSON 파일로 저장"""
+        """결과를 JSON 파일로 저장
+        
+        결과 스트림이 있으면 스트림을 다시 읽어 요약 파일을 만들고(이전 실행분 포함,
+        저널이 있으면 대상별 마지막 결과만), 없으면 메모리의 결과를 씁니다.
+        """
         try:
-            results_data = []
-            for result in self.results:
-                results_data.append({
-                    "target_name": result.target.name,
-                    "target_url": result.target.url,
-                    "title": result.title,
-                    "error": result.error,
-                    "timestamp": result.timestamp
-                })
-            
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(results_data, f, ensure_ascii=False, indent=2)
+            if self.sink:
+                self.sink.sync()
+                count = rebuild_summary(self.sink.path, filename, transform=self.summary_item,
+                                        offsets=self.journal.offsets() if self.journal else None)
+            else:
+                count = write_summary(filename, (self.summary_item(result.to_dict()) for result in self.results))
             
-            print(f"💾 결과 저장 완료: {filename}")
+            print(f"💾 결과 저장 완료: {filename} ({count}건)")
             
         except Exception as e:
             print(f"❌ 결과 저장 실패: {e}")
@@ -183,30 +245,48 @@ class ToolHiveScrapingSystem:
     def print_summary(self):
         """스크래핑 결과 요약 출력"""
         print(f"\n📈 === 스크래핑 결과 요약 ===")
-        print(f"총 대상: {len(self.results)}개")
         
-        successful = [r for r in self.results if not r.error and r.title]
-        failed = [r for r in self.results if r.error]
+        # 결과를 모아 두지 않고 스트림을 다시 읽으며 집계/출력 (목록 출력마다 한 번씩)
+        total = successful = failed = 0
+        for result in self.iter_run_results():
+            total += 1
+            if result.error:
+                failed += 1
+            elif result.title:
+                successful += 1
         
-        print(f"성공: {len(successful)}개")
-        print(f"실패: {len(failed)}개")
+        print(f"총 대상: {total}개")
+        print(f"성공: {successful}개")
+        print(f"실패: {failed}개")
+        print(f"캐시 재사용(304): {self.cache.stats['hits']}개, 절약한 전송량: {self.cache.stats['bytes_saved']:,} bytes")
         
         if successful:
             print(f"\n✅ 성공한 사이트들:")
-            for result in successful:
-                print(f"  - {result.target.name}: {result.title}")
+            for result in self.iter_run_results():
+                if not result.error and result.title:
+                    print(f"  - {result.target.name}: {result.title}")
         
         if failed:
             print(f"\n❌ 실패한 사이트들:")
-            for result in failed:
-                print(f"  - {result.target.name}: {result.error}")
+            for result in self.iter_run_results():
+                if result.error:
+                    print(f"  - {result.target.name}: {result.error}")
 
 def main():
     """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="ToolHive 하이브리드 스크래핑 시스템")
+    parser.add_argument("--resume", action="store_true",
+                        help="이전 실행의 저널/결과 스트림을 이어받아 완료되지 않은 대상만 수집")
+    parser.add_argument("--parquet", default=None,
+                        help="이번 실행 결과를 타입이 지정된 컬럼으로 저장할 경로 (.parquet / .arrow, pyarrow 필요)")
+    args = parser.parse_args()
+    
     print("🚀 ToolHive 하이브리드 스크래핑 시스템 시작")
     
-    # 스크래핑 시스템 초기화
-    scraper = ToolHiveScrapingSystem()
+    # 스크래핑 시스템 초기화 (결과는 수집 즉시 스트림에, 진행 상태는 저널에 기록)
+    scraper = ToolHiveScrapingSystem(sink=ResultSink(RESULT_STREAM, resume=args.resume),
+                                     journal=CrawlJournal(JOURNAL_FILE, job="hybrid"),
+                                     exporter=ColumnarWriter(args.parquet, "result") if args.parquet else None)
     scraper.check_mcp_availability()
     
     # 스크래핑 대상 사이트들 정의
@@ -234,14 +314,22 @@ def main():
     ]
     
     # 스크래핑 실행
-    results = scraper.scrape_multiple(targets)
-    
-    # 결과 요약 및 저장
-    scraper.print_summary()
-    scraper.save_results("toolhive_scraping_results.json")
+    try:
+        scraper.scrape_multiple(targets, resume=args.resume)
+        
+        # 결과 요약 및 저장
+        scraper.print_summary()
+        scraper.save_results("toolhive_scraping_results.json")
+        # 대상과 이번 실행의 수집 이력을 공유 저장소에 누적
+        save_to_store("fetches", scraper.iter_run_results(), source="hybrid_scraping_system")
+    finally:
+        scraper.sink.close()
+        scraper.journal.close()
+        if scraper.exporter:
+            scraper.exporter.close()
     
     print(f"\n🎉 스크래핑 완료!")
-    print(f"📁 결과 파일: toolhive_scraping_results.json")
+    print(f"📁 결과 파일: toolhive_scraping_results.json (스트림: {RESULT_STREAM})")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+게시글 단위 수집 상태 저장소 (증분 수집용)
+
+게시글 URL마다 목록 항목 해시, 본문 해시, ETag / Last-Modified,
+마지막 수집 시각을 JSON 파일로 보관합니다. 다음 실행에서는
+새 게시글이거나 목록/헤더가 바뀐 게시글만 다시 수집합니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(*parts: Optional[str]) -> str:
+    """문자열 조각들의 SHA-256 해시 (구분자를 넣어 조각 경계가 섞이지 않게 함)"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update((part or "").encode("utf-8"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+@dataclass
+class PostState:
+    """게시글 하나의 마지막 수집 상태"""
+    url: str
+    listing_hash: str = ""
+    content_hash: str = ""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    scraped_at: str = ""
+
+
+class PostStateStore:
+    """URL → PostState를 JSON 파일로 읽고 쓰는 저장소"""
+
+    def __init__(self, path: str = "tistory_scrape_state.json"):
+        self.path = path
+        self.states: Dict[str, PostState] = {}
+
+    def load(self) -> "PostStateStore":
+        if not os.path.exists(self.path):
+            return self
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.states = {item["url"]: PostState(**item) for item in data.get("posts", [])}
+            logger.info(f"📂 이전 수집 상태 로드: {len(self.states)}개 게시글 ({self.path})")
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.warning(f"⚠️ 수집 상태 파일을 읽을 수 없어 전체 수집합니다: {e}")
+            self.states = {}
+        return self
+
+    def save(self):
+        """임시 파일에 쓴 뒤 교체해 중간에 중단돼도 이전 상태가 깨지지 않게 합니다."""
+        data = {
+            "updated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "posts": [asdict(state) for state in self.states.values()]
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def get(self, url: str) -> Optional[PostState]:
+        return self.states.get(url)
+
+    def update(self, state: PostState):
+        self.states[state.url] = state
+
+    def prune(self, urls: Iterable[str]) -> int:
+        """목록에서 사라진 게시글 상태를 삭제하고 삭제 수를 반환합니다."""
+        keep = set(urls)
+        removed = [url for url in self.states if url not in keep]
+        for url in removed:
+            del self.states[url]
+        return len(removed)
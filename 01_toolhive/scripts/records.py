@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+스크래핑 결과 레코드 타입 (엔티티마다 한 곳에서만 정의)
+
+전체 사이트를 수집하는 동안 수백만 건을 메모리에 들고 있어도 부담이 적도록
+모든 레코드는 __slots__ + frozen 데이터클래스입니다 (인스턴스별 __dict__ 없음).
+- 카테고리 / 과목처럼 값의 종류가 적은 문자열은 sys.intern으로 한 객체를 공유
+- 태그는 list 대신 tuple로 보관
+- to_dict / from_dict는 클래스마다 미리 만들어 둔 필드 이름 튜플로 변환
+
+각 스크립트의 save_results와 이전 결과 로드가 이 코덱을 사용합니다.
+"""
+
+import sys
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from typing import Any, Callable, ClassVar, Dict, Iterable, Mapping, Optional, Tuple, Type, TypeVar
+
+R = TypeVar("R", bound="Record")
+
+
+class Record:
+    """레코드 공통 코덱 (record 데코레이터가 필드 정보를 채움)"""
+
+    __slots__ = ()
+
+    FIELDS: ClassVar[Tuple[str, ...]] = ()
+    _NESTED: ClassVar[Dict[str, Type["Record"]]] = {}
+    _values: ClassVar[Callable[[Any], Tuple[Any, ...]]]
+
+    def to_dict(self, skip: Iterable[str] = ()) -> Dict[str, Any]:
+        """필드 순서대로 dict를 만듭니다. 중첩 레코드도 dict로 변환합니다."""
+        data = dict(zip(self.FIELDS, self._values(self)))
+        for name in skip:
+            data.pop(name, None)
+        for name in self._NESTED:
+            value = data.get(name)
+            if isinstance(value, Record):
+                data[name] = value.to_dict()
+        return data
+
+    @classmethod
+    def from_dict(cls: Type[R], data: Mapping[str, Any]) -> R:
+        """dict에서 레코드를 만듭니다. 모르는 키(예: 저장 시 붙인 rank)는 무시합니다."""
+        kwargs = {name: data[name] for name in cls.FIELDS if name in data}
+        for name, nested in cls._NESTED.items():
+            value = kwargs.get(name)
+            if isinstance(value, Mapping):
+                kwargs[name] = nested.from_dict(value)
+        return cls(**kwargs)
+
+
+def record(cls):
+    """slots + frozen 데이터클래스로 만들고 코덱용 필드 정보를 계산합니다."""
+    cls = dataclass(frozen=True, slots=True)(cls)
+    names = tuple(f.name for f in fields(cls))
+    cls.FIELDS = names
+    # 필드가 하나면 attrgetter가 튜플이 아닌 값을 반환하므로 감쌈
+    getter = attrgetter(*names)
+    cls._values = staticmethod(getter if len(names) > 1 else (lambda obj: (getter(obj),)))
+    cls._NESTED = {f.name: f.type for f in fields(cls)
+                   if isinstance(f.type, type) and issubclass(f.type, Record)}
+    return cls
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+# -----------------------------------------------------------------------------
+# 클래스유
+# -----------------------------------------------------------------------------
+
+@record
+class TeacherInfo(Record):
+    """클래스 카드에서 추출한 선생님 정보 (classu_fetch_mcp, classu_simple_fetch)"""
+    name: str
+    subject: str
+    class_title: str
+    students_count: int
+    rating: float
+    lesson_count: int
+    monthly_fee: str
+    profile_url: str = ""
+    class_url: str = ""
+
+    def __post_init__(self):
+        object.__setattr__(self, "subject", _intern(self.subject))
+        object.__setattr__(self, "monthly_fee", _intern(self.monthly_fee))
+
+
+@record
+class RankedTeacher(Record):
+    """BEST 클래스 순위에 표시된 선생님 정보 (TOP 10 스크립트들)"""
+    rank: int
+    name: str
+    class_title: str
+    discount_rate: str
+    monthly_price: str
+    rating: str
+    members_count: str
+    activity_count: str = ""
+
+
+# -----------------------------------------------------------------------------
+# 티스토리
+# -----------------------------------------------------------------------------
+
+@record
+class BlogPost(Record):
+    """블로그 게시글 정보 (카테고리와 태그 문자열은 intern, 태그는 tuple)"""
+    title: str
+    url: str
+    category: str
+    date: str
+    content: str
+    summary: str
+    thumbnail: str = ""
+    tags: Tuple[str, ...] = ()
+
+    def __post_init__(self):
+        object.__setattr__(self, "category", _intern(self.category))
+        object.__setattr__(self, "tags", tuple(sys.intern(tag) for tag in self.tags or ()))
+
+
+# -----------------------------------------------------------------------------
+# 하이브리드 스크래핑
+# -----------------------------------------------------------------------------
+
+@record
+class ScrapingTarget(Record):
+    """스크래핑 대상 사이트 정보"""
+    name: str
+    url: str
+    title_selector: str = "title"
+    description: str = ""
+
+
+@record
+class ScrapingResult(Record):
+    """스크래핑 결과"""
+    target: ScrapingTarget
+    title: Optional[str] = None
+    content: Optional[str] = None
+    error: Optional[str] = None
+    timestamp: Optional[str] = None
+    from_cache: bool = False
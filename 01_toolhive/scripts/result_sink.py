@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+스트리밍 결과 싱크 (NDJSON / JSONL)
+
+결과가 나올 때마다 한 줄에 레코드 하나씩 압축 JSON으로 이어 씁니다.
+수집 도중 죽어도 마지막 fsync 시점까지의 결과는 남고, 최종 요약 파일은
+스트림을 다시 읽어 만들 수 있으므로 결과 전체를 메모리에 들고 있을 필요가
+없습니다.
+
+- 압축: 확장자로 결정 (.gz → gzip, .zst → zstd, 그 외 무압축)
+  zstd는 zstandard 패키지가 있을 때만 사용 가능
+- fsync: fsync_every건마다 또는 fsync_interval초마다
+- 이어쓰기(resume=True): 중간에 끊긴 마지막 줄을 정리한 뒤 뒤에 덧붙임
+- write()는 레코드의 위치(스트림 안에서 몇 번째 레코드인지)를 반환하므로
+  체크포인트 저널에 기록해 두면 재시도 전 기록을 걸러낼 수 있음
+
+요약 파일 재생성:
+    python result_sink.py results.jsonl.gz summary.json --items-key posts
+"""
+
+import argparse
+import gzip
+import io
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Container, Dict, Iterable, Iterator, Mapping, Optional, Tuple
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+logger = logging.getLogger(__name__)
+
+NONE, GZIP, ZSTD = "none", "gzip", "zstd"
+STREAM_SUFFIXES = (".jsonl", ".ndjson")
+
+
+def compression_for(path: str) -> str:
+    """파일 확장자로 압축 방식을 정합니다."""
+    lowered = path.lower()
+    if lowered.endswith(".gz"):
+        return GZIP
+    if lowered.endswith((".zst", ".zstd")):
+        return ZSTD
+    return NONE
+
+
+def is_stream_path(path: str) -> bool:
+    """NDJSON 스트림 파일 경로인지 (압축 확장자 제외 후 .jsonl / .ndjson) 확인합니다."""
+    lowered = path.lower()
+    for suffix in (".gz", ".zst", ".zstd"):
+        if lowered.endswith(suffix):
+            lowered = lowered[:-len(suffix)]
+            break
+    return lowered.endswith(STREAM_SUFFIXES)
+
+
+def _require_zstd():
+    if not HAS_ZSTD:
+        raise RuntimeError("zstd 압축에는 zstandard 패키지가 필요합니다 (pip install zstandard)")
+
+
+def _to_data(record: Any) -> Mapping[str, Any]:
+    return record.to_dict() if hasattr(record, "to_dict") else record
+
+
+def _encode(data: Mapping[str, Any]) -> bytes:
+    return (json.dumps(data, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+# -----------------------------------------------------------------------------
+# 읽기
+# -----------------------------------------------------------------------------
+
+def _open_text(path: str, compression: str) -> io.TextIOBase:
+    if compression == GZIP:
+        return gzip.open(path, "rt", encoding="utf-8")
+    if compression == ZSTD:
+        _require_zstd()
+        raw = open(path, "rb")
+        reader = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=True)
+        return io.TextIOWrapper(reader, encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def _iter_lines(path: str, compression: str) -> Iterator[str]:
+    """스트림의 완전한(줄바꿈으로 끝나는) 줄을 읽습니다.
+
+    비정상 종료로 잘린 마지막 줄 / 압축 블록은 경고만 남기고 멈춥니다.
+    """
+    with _open_text(path, compression) as f:
+        try:
+            for line in f:
+                if not line.endswith("\n"):
+                    logger.warning(f"⚠️ 끝이 잘린 레코드를 건너뜀: {path}")
+                    break
+                yield line
+        except (EOFError, OSError) as e:
+            logger.warning(f"⚠️ 스트림이 중간에 끊겨 있어 여기까지만 읽음 ({path}): {e}")
+        except Exception as e:
+            if HAS_ZSTD and isinstance(e, zstandard.ZstdError):
+                logger.warning(f"⚠️ 스트림이 중간에 끊겨 있어 여기까지만 읽음 ({path}): {e}")
+            else:
+                raise
+
+
+def iter_offsets(path: str, compression: Optional[str] = None) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """(스트림 안에서의 위치, 레코드)를 읽습니다.
+
+    위치는 ResultSink.write가 반환한 값과 같습니다. 손상된 줄은 건너뛰지만
+    위치는 하나 차지하므로 뒤따르는 레코드의 위치가 밀리지 않습니다.
+    """
+    if not os.path.exists(path):
+        return
+    offset = 0
+    for line in _iter_lines(path, compression or compression_for(path)):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError:
+            logger.warning(f"⚠️ 손상된 레코드를 건너뜀: {line[:80]!r}")
+        else:
+            yield offset, data
+        offset += 1
+
+
+def iter_records(path: str, compression: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """스트림의 레코드를 한 줄씩 읽습니다 (잘리거나 손상된 레코드는 경고만 남기고 건너뜀)."""
+    for _, data in iter_offsets(path, compression):
+        yield data
+
+
+def count_lines(path: str, compression: Optional[str] = None) -> int:
+    """스트림이 차지한 위치 수 (손상된 줄 포함, 잘린 꼬리 제외)"""
+    if not os.path.exists(path):
+        return 0
+    return sum(1 for line in _iter_lines(path, compression or compression_for(path)) if line.strip())
+
+
+def _stream_is_clean(path: str, compression: str) -> bool:
+    """압축 스트림이 끝까지 정상적으로 읽히는지 확인합니다."""
+    try:
+        with _open_text(path, compression) as f:
+            last = ""
+            for last in f:
+                pass
+        return not last or last.endswith("\n")
+    except Exception:
+        return False
+
+
+# -----------------------------------------------------------------------------
+# 쓰기
+# -----------------------------------------------------------------------------
+
+class ResultSink:
+    """레코드를 NDJSON으로 이어 쓰는 스레드 안전 싱크"""
+
+    def __init__(self, path: str, compression: Optional[str] = None, resume: bool = False,
+                 fsync_every: int = 100, fsync_interval: float = 5.0):
+        self.path = path
+        self.compression = compression or compression_for(path)
+        if self.compression == ZSTD:
+            _require_zstd()
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.count = 0
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        self._lock = threading.Lock()
+
+        if resume and os.path.exists(path):
+            self._recover()
+            self.count = count_lines(path, self.compression)
+        self._raw = open(path, "ab" if resume else "wb")
+        self._stream = self._wrap(self._raw)
+
+    def _wrap(self, raw):
+        # 열 때마다 새 gzip 멤버 / zstd 프레임을 시작 (이어 붙인 파일도 그대로 읽힘)
+        if self.compression == GZIP:
+            return gzip.GzipFile(fileobj=raw, mode="ab")
+        if self.compression == ZSTD:
+            return zstandard.ZstdCompressor().stream_writer(raw, closefd=False)
+        return raw
+
+    def _recover(self):
+        """이전 실행이 쓰다 만 꼬리를 정리해 이어쓸 수 있게 만듭니다."""
+        if self.compression == NONE:
+            with open(self.path, "rb+") as f:
+                data_end = f.seek(0, os.SEEK_END)
+                if data_end == 0:
+                    return
+                f.seek(data_end - 1)
+                if f.read(1) == b"\n":
+                    return
+                # 뒤에서부터 블록 단위로 마지막 줄바꿈을 찾아 그 뒤를 잘라냄
+                keep = 0
+                block_end = data_end
+                while block_end > 0:
+                    block_start = max(0, block_end - 65536)
+                    f.seek(block_start)
+                    cut = f.read(block_end - block_start).rfind(b"\n")
+                    if cut >= 0:
+                        keep = block_start + cut + 1
+                        break
+                    block_end = block_start
+                f.truncate(keep)
+            logger.warning(f"⚠️ 끝이 잘린 레코드를 잘라냄: {self.path}")
+            return
+
+        if _stream_is_clean(self.path, self.compression):
+            return
+        # 압축 스트림은 잘린 블록 뒤에 덧붙일 수 없으므로 읽을 수 있는 줄만 다시 씀
+        # (손상된 줄도 그대로 옮겨 레코드 위치가 바뀌지 않게 함)
+        tmp_path = f"{self.path}.tmp"
+        recovered = 0
+        with open(tmp_path, "wb") as raw:
+            stream = self._wrap(raw)
+            for line in _iter_lines(self.path, self.compression):
+                if line.strip():
+                    stream.write(line.encode("utf-8"))
+                    recovered += 1
+            stream.close()
+        os.replace(tmp_path, self.path)
+        logger.warning(f"⚠️ 손상된 스트림을 복구함: {self.path} ({recovered}건 유지)")
+
+    def write(self, record: Any) -> int:
+        """레코드(to_dict를 가진 객체 또는 dict) 하나를 쓰고 스트림 안에서의 위치를 반환합니다."""
+        line = _encode(_to_data(record))
+        with self._lock:
+            self._stream.write(line)
+            offset = self.count
+            self.count += 1
+            self._pending += 1
+            if self._pending >= self.fsync_every or time.monotonic() - self._last_sync >= self.fsync_interval:
+                self._sync()
+        return offset
+
+    def write_many(self, records: Iterable[Any]):
+        for record in records:
+            self.write(record)
+
+    def _sync(self):
+        if self.compression == ZSTD:
+            self._stream.flush(zstandard.FLUSH_BLOCK)
+        elif self.compression == GZIP:
+            self._stream.flush()    # Z_SYNC_FLUSH: 여기까지는 압축 해제 가능
+        self._raw.flush()
+        os.fsync(self._raw.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def sync(self):
+        """버퍼를 비우고 디스크에 fsync합니다."""
+        with self._lock:
+            if not self._raw.closed:
+                self._sync()
+
+    def close(self):
+        with self._lock:
+            if self._raw.closed:
+                return
+            if self._stream is not self._raw:
+                self._stream.close()
+            self._raw.flush()
+            os.fsync(self._raw.fileno())
+            self._raw.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+# -----------------------------------------------------------------------------
+# 요약 파일
+# -----------------------------------------------------------------------------
+
+def _indented(value: Any, level: int) -> str:
+    text = json.dumps(value, ensure_ascii=False, indent=2)
+    return text.replace("\n", "\n" + "  " * level)
+
+
+def write_summary(filename: str, items: Iterable[Mapping[str, Any]],
+                  header: Optional[Mapping[str, Any]] = None, items_key: Optional[str] = None) -> int:
+    """json.dump(..., indent=2)와 같은 형식의 요약 파일을 항목 단위로 씁니다.
+
+    items_key가 없으면 최상위 배열, 있으면 header 필드 뒤에 items_key 배열을 둡니다.
+    항목을 하나씩 쓰므로 전체 목록을 메모리에 만들지 않습니다. 쓴 항목 수를 반환합니다.
+    """
+    tmp_path = f"{filename}.tmp"
+    level = 0 if items_key is None else 1
+    count = 0
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        if items_key is not None:
+            f.write("{")
+            for key, value in (header or {}).items():
+                f.write(f"\n  {json.dumps(key, ensure_ascii=False)}: {_indented(value, 1)},")
+            f.write(f"\n  {json.dumps(items_key, ensure_ascii=False)}: ")
+        f.write("[")
+        pad = "  " * (level + 1)
+        for item in items:
+            f.write(("," if count else "") + f"\n{pad}{_indented(item, level + 1)}")
+            count += 1
+        f.write(f"\n{'  ' * level}]" if count else "]")
+        if items_key is not None:
+            f.write("\n}")
+    os.replace(tmp_path, filename)
+    return count
+
+
+def rebuild_summary(stream_path: str, filename: str, header: Optional[Mapping[str, Any]] = None,
+                    items_key: Optional[str] = None,
+                    transform: Optional[Callable[[Dict[str, Any]], Mapping[str, Any]]] = None,
+                    offsets: Optional[Container[int]] = None) -> int:
+    """스트림(부분 결과 포함)에서 요약 파일을 다시 만듭니다.
+
+    offsets를 주면 그 위치의 레코드만 사용합니다 (예: 저널에 남은 URL별 마지막 결과).
+    """
+    if offsets is not None:
+        items = (item for offset, item in iter_offsets(stream_path) if offset in offsets)
+    else:
+        items = iter_records(stream_path)
+    if transform:
+        items = (transform(item) for item in items)
+    return write_summary(filename, items, header, items_key)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description="NDJSON 결과 스트림에서 요약 JSON 파일을 다시 만듭니다.")
+    parser.add_argument("stream", help="결과 스트림 파일 (.jsonl / .jsonl.gz / .jsonl.zst)")
+    parser.add_argument("output", help="만들 요약 JSON 파일")
+    parser.add_argument("--items-key", default=None, help="항목 배열을 담을 키 (없으면 최상위 배열)")
+    args = parser.parse_args()
+
+    header = None
+    if args.items_key:
+        # 헤더의 건수를 먼저 채우기 위해 스트림을 한 번 더 읽음 (메모리는 일정)
+        header = {"collection_date": time.strftime("%Y-%m-%d %H:%M:%S"),
+                  "total_records": sum(1 for _ in iter_records(args.stream))}
+    written = rebuild_summary(args.stream, args.output, header=header, items_key=args.items_key)
+    print(f"📁 {args.output}: {written}건")
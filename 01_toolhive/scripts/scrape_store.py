@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+실행 간 공유 수집 저장소 (SQLite WAL)
+
+스크립트마다 따로 쓰던 JSON 대신 한 SQLite 파일에 수집 결과를 누적합니다.
+- targets:  스크래핑 대상 사이트 (URL당 한 행, 마지막으로 본 시각 갱신)
+- fetches:  대상별 수집 이력 (실행마다 한 행)
+- teachers: 클래스유 선생님 스냅샷 (실행마다 한 행, 수강생 수 변화 추적용)
+- posts:    블로그 게시글 (URL당 한 행, 본문 해시가 바뀌면 갱신)
+
+URL / 호스트 / 카테고리 / 수집 시각에 인덱스가 있으므로 "이번 주 수강생 수가
+바뀐 선생님" 같은 질의는 JSON 전체를 읽어 비교하지 않고 인덱스 조회로 끝납니다.
+쓰기는 트랜잭션 하나에 executemany로 묶어 넣습니다.
+
+예시:
+    python scrape_store.py changed-teachers --days 7
+    python scrape_store.py posts --category Python
+"""
+
+import argparse
+import itertools
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from columnar_export import parse_float, parse_int
+from crawl_scheduler import host_of
+from post_state import content_hash
+
+STORE_FILE = "scrape_store.sqlite3"
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+STORE_BATCH_SIZE = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS targets (
+    url TEXT PRIMARY KEY,
+    host TEXT NOT NULL,
+    name TEXT,
+    description TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_targets_host ON targets (host);
+
+CREATE TABLE IF NOT EXISTS fetches (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL,
+    host TEXT NOT NULL,
+    source TEXT NOT NULL,
+    title TEXT,
+    error TEXT,
+    from_cache INTEGER NOT NULL DEFAULT 0,
+    scraped_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_fetches_url ON fetches (url, scraped_at);
+CREATE INDEX IF NOT EXISTS idx_fetches_host ON fetches (host, scraped_at);
+CREATE INDEX IF NOT EXISTS idx_fetches_scraped_at ON fetches (scraped_at);
+
+CREATE TABLE IF NOT EXISTS teachers (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    name TEXT NOT NULL,
+    class_title TEXT NOT NULL,
+    subject TEXT,
+    students_count INTEGER,
+    rating REAL,
+    lesson_count INTEGER,
+    monthly_fee INTEGER,
+    rank INTEGER,
+    discount_rate INTEGER,
+    class_url TEXT,
+    host TEXT,
+    scraped_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_teachers_key ON teachers (name, class_title, scraped_at);
+CREATE INDEX IF NOT EXISTS idx_teachers_source_key ON teachers (source, name, class_title, scraped_at);
+CREATE INDEX IF NOT EXISTS idx_teachers_class_url ON teachers (class_url);
+CREATE INDEX IF NOT EXISTS idx_teachers_scraped_at ON teachers (scraped_at);
+
+CREATE TABLE IF NOT EXISTS posts (
+    url TEXT PRIMARY KEY,
+    host TEXT NOT NULL,
+    title TEXT,
+    category TEXT,
+    date TEXT,
+    summary TEXT,
+    content TEXT,
+    tags TEXT,
+    content_hash TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    scraped_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_posts_host ON posts (host);
+CREATE INDEX IF NOT EXISTS idx_posts_category ON posts (category, date);
+CREATE INDEX IF NOT EXISTS idx_posts_scraped_at ON posts (scraped_at);
+"""
+
+_INSERT_TARGET = (
+    "INSERT INTO targets (url, host, name, description, first_seen, last_seen) VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (url) DO UPDATE SET name = excluded.name, description = excluded.description, "
+    "last_seen = excluded.last_seen"
+)
+_INSERT_FETCH = (
+    "INSERT INTO fetches (url, host, source, title, error, from_cache, scraped_at) VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_INSERT_TEACHER = (
+    "INSERT INTO teachers (source, name, class_title, subject, students_count, rating, lesson_count, "
+    "monthly_fee, rank, discount_rate, class_url, host, scraped_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_UPSERT_POST = (
+    "INSERT INTO posts (url, host, title, category, date, summary, content, tags, content_hash, first_seen, scraped_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (url) DO UPDATE SET title = excluded.title, category = excluded.category, date = excluded.date, "
+    "summary = excluded.summary, content = excluded.content, tags = excluded.tags, "
+    "content_hash = excluded.content_hash, scraped_at = excluded.scraped_at "
+    "WHERE posts.content_hash != excluded.content_hash"
+)
+
+
+def now() -> str:
+    return time.strftime(TIME_FORMAT)
+
+
+def days_ago(days: float) -> str:
+    """days일 전 시각 (scraped_at 비교용 문자열)"""
+    return time.strftime(TIME_FORMAT, time.localtime(time.time() - days * 86400))
+
+
+class ScrapeStore:
+    """targets / fetches / teachers / posts 테이블을 가진 공유 저장소"""
+
+    def __init__(self, path: str = STORE_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+        self._db.commit()
+
+    def _executemany(self, sql: str, rows: List[tuple]) -> int:
+        if not rows:
+            return 0
+        with self._lock, self._db:      # 트랜잭션 하나로 커밋 (실패 시 롤백)
+            self._db.executemany(sql, rows)
+        return len(rows)
+
+    def _query(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(row) for row in self._db.execute(sql, params).fetchall()]
+
+    # -------------------------------------------------------------------------
+    # 쓰기
+    # -------------------------------------------------------------------------
+
+    def add_targets(self, targets: Iterable[Any], seen_at: Optional[str] = None) -> int:
+        """ScrapingTarget 목록을 등록하거나 마지막으로 본 시각을 갱신합니다."""
+        seen_at = seen_at or now()
+        return self._executemany(_INSERT_TARGET, [
+            (t.url, host_of(t.url), t.name, t.description, seen_at, seen_at) for t in targets
+        ])
+
+    def add_fetches(self, results: Iterable[Any], source: str) -> int:
+        """ScrapingResult 목록을 수집 이력으로 추가합니다."""
+        return self._executemany(_INSERT_FETCH, [
+            (r.target.url, host_of(r.target.url), source, r.title, r.error, int(r.from_cache), r.timestamp or now())
+            for r in results
+        ])
+
+    def add_teachers(self, teachers: Iterable[Any], source: str, scraped_at: Optional[str] = None) -> int:
+        """TeacherInfo / RankedTeacher 목록을 이번 실행의 스냅샷으로 추가합니다.
+
+        RankedTeacher의 문자열 값("954명", "4.8", "64%")은 숫자로 바꿔 저장합니다.
+        """
+        scraped_at = scraped_at or now()
+        rows = []
+        for teacher in teachers:
+            data = teacher.to_dict()
+            class_url = data.get("class_url") or None
+            rows.append((
+                source,
+                data["name"],
+                data["class_title"],
+                data.get("subject"),
+                parse_int(data.get("students_count", data.get("members_count"))),
+                parse_float(data.get("rating")),
+                parse_int(data.get("lesson_count")),
+                parse_int(data.get("monthly_fee", data.get("monthly_price"))),
+                data.get("rank"),
+                parse_int(data.get("discount_rate")),
+                class_url,
+                host_of(class_url) if class_url else None,
+                scraped_at,
+            ))
+        return self._executemany(_INSERT_TEACHER, rows)
+
+    def add_posts(self, posts: Iterable[Any], scraped_at: Optional[str] = None) -> int:
+        """BlogPost 목록을 저장합니다. 본문 해시가 같은 게시글은 갱신하지 않습니다."""
+        scraped_at = scraped_at or now()
+        return self._executemany(_UPSERT_POST, [
+            (p.url, host_of(p.url), p.title, p.category, p.date, p.summary, p.content,
+             json.dumps(list(p.tags), ensure_ascii=False),
+             content_hash(p.title, p.category, p.date, p.content, p.summary, *p.tags),
+             scraped_at, scraped_at)
+            for p in posts
+        ])
+
+    # -------------------------------------------------------------------------
+    # 조회
+    # -------------------------------------------------------------------------
+
+    def changed_teachers(self, since: str) -> List[Dict[str, Any]]:
+        """since 이후 수강생 수가 바뀐 선생님 (since 직전 스냅샷 또는 기간 내 첫 스냅샷 대비)
+
+        스크립트마다 수강생 수의 의미가 다르므로(카드의 수강생 수 / TOP 목록의 멤버 수)
+        같은 source의 스냅샷끼리만 비교합니다.
+        """
+        return self._query("""
+            WITH latest AS (
+                SELECT source, name, class_title, students_count, scraped_at,
+                       ROW_NUMBER() OVER (PARTITION BY source, name, class_title ORDER BY scraped_at DESC) AS newest
+                FROM teachers
+                WHERE scraped_at >= ? AND students_count IS NOT NULL
+            ),
+            paired AS (
+                SELECT l.source, l.name, l.class_title, l.students_count AS current_count, l.scraped_at AS current_at,
+                       COALESCE(
+                           (SELECT t.id FROM teachers AS t
+                            WHERE t.source = l.source AND t.name = l.name AND t.class_title = l.class_title
+                              AND t.students_count IS NOT NULL AND t.scraped_at < ?
+                            ORDER BY t.scraped_at DESC LIMIT 1),
+                           (SELECT t.id FROM teachers AS t
+                            WHERE t.source = l.source AND t.name = l.name AND t.class_title = l.class_title
+                              AND t.students_count IS NOT NULL AND t.scraped_at >= ?
+                            ORDER BY t.scraped_at LIMIT 1)
+                       ) AS base_id
+                FROM latest AS l
+                WHERE l.newest = 1
+            )
+            SELECT p.source, p.name, p.class_title,
+                   base.students_count AS previous_count, p.current_count,
+                   p.current_count - base.students_count AS delta,
+                   base.scraped_at AS previous_at, p.current_at
+            FROM paired AS p
+            JOIN teachers AS base ON base.id = p.base_id
+            WHERE base.students_count != p.current_count
+            ORDER BY ABS(p.current_count - base.students_count) DESC
+        """, (since, since, since))
+
+    def posts_by_category(self, category: str, limit: int = 50) -> List[Dict[str, Any]]:
+        """카테고리의 최신 게시글 (본문 제외)"""
+        return self._query(
+            "SELECT url, title, category, date, summary, scraped_at FROM posts "
+            "WHERE category = ? ORDER BY date DESC LIMIT ?", (category, limit)
+        )
+
+    def fetches_for_host(self, host: str, since: Optional[str] = None) -> List[Dict[str, Any]]:
+        """호스트의 수집 이력 (최신순)"""
+        return self._query(
+            "SELECT url, source, title, error, from_cache, scraped_at FROM fetches "
+            "WHERE host = ? AND scraped_at >= ? ORDER BY scraped_at DESC", (host, since or "")
+        )
+
+    def counts(self) -> Dict[str, int]:
+        """테이블별 행 수"""
+        with self._lock:
+            return {table: self._db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                    for table in ("targets", "fetches", "teachers", "posts")}
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _batches(records: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(records)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def save_to_store(kind: str, records: Iterable[Any], source: str, path: str = STORE_FILE) -> int:
+    """스크립트 끝에서 결과를 공유 저장소에 넣습니다. 실패해도 예외 대신 0을 반환합니다."""
+    try:
+        with ScrapeStore(path) as store:
+            if kind == "teachers":
+                return store.add_teachers(records, source)
+            if kind == "posts":
+                return store.add_posts(records)
+            if kind == "fetches":
+                # 스트림에서 읽은 결과도 받을 수 있도록 묶음 단위로 기록
+                written = 0
+                for batch in _batches(records, STORE_BATCH_SIZE):
+                    store.add_targets(r.target for r in batch)
+                    written += store.add_fetches(batch, source)
+                return written
+            raise ValueError(f"알 수 없는 종류: {kind}")
+    except (sqlite3.Error, OSError, ValueError) as e:
+        print(f"⚠️ 공유 저장소({path}) 기록 실패: {e}")
+        return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="공유 수집 저장소 조회")
+    parser.add_argument("--db", default=STORE_FILE, help="저장소 파일 경로")
+    commands = parser.add_subparsers(dest="command", required=True)
+    changed = commands.add_parser("changed-teachers", help="기간 내 수강생 수가 바뀐 선생님")
+    changed.add_argument("--days", type=float, default=7)
+    by_category = commands.add_parser("posts", help="카테고리별 최신 게시글")
+    by_category.add_argument("--category", required=True)
+    by_category.add_argument("--limit", type=int, default=20)
+    by_host = commands.add_parser("fetches", help="호스트별 수집 이력")
+    by_host.add_argument("--host", required=True)
+    by_host.add_argument("--days", type=float, default=7)
+    commands.add_parser("counts", help="테이블별 행 수")
+    args = parser.parse_args()
+
+    with ScrapeStore(args.db) as store:
+        if args.command == "changed-teachers":
+            rows = store.changed_teachers(days_ago(args.days))
+        elif args.command == "posts":
+            rows = store.posts_by_category(args.category, args.limit)
+        elif args.command == "fetches":
+            rows = store.fetches_for_host(args.host, days_ago(args.days))
+        else:
+            rows = [store.counts()]
+    print(json.dumps(rows, ensure_ascii=False, indent=2))
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Playwright MCP 접근성 스냅샷 → 게시글 파서
+
+browser_snapshot 결과(YAML 형태의 접근성 트리 텍스트)를 한 줄씩 한 번만
+훑으면서 제목, 카테고리, 날짜, 본문, 태그를 추출합니다. 트리를 만들지 않고
+들여쓰기만으로 현재 위치(본문 영역 / 건너뛸 영역)를 추적하며, 모든 규칙은
+모듈 로드 시 한 번만 컴파일합니다.
+
+벤치마크:
+    python snapshot_parser.py fixtures/*.txt
+"""
+
+import json
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+# -----------------------------------------------------------------------------
+# 컴파일된 추출 규칙
+# -----------------------------------------------------------------------------
+
+# - role "name" [attr] [attr]: value
+_NODE = re.compile(
+    r'^(?P<indent> *)- '
+    r'(?P<role>/?[A-Za-z][\w-]*)'
+    r'(?: "(?P<name>(?:[^"\\]|\\.)*)")?'
+    r'(?P<attrs>(?: \[[^\]]*\])*)'
+    r'(?::(?: (?P<value>.*))?)?$'
+)
+# YAML 특수문자 때문에 통째로 작은따옴표로 감싼 줄: - 'heading "a: b" [level=2]':
+_QUOTED_NODE = re.compile(r"^(?P<indent> *)- '(?P<head>(?:[^']|'')*)'(?P<rest>:.*)?$")
+_LEVEL = re.compile(r"\[level=(\d)\]")
+_DATE = re.compile(r"(\d{4})\s*[.\-/년]\s*(\d{1,2})\s*[.\-/월]\s*(\d{1,2})")
+_CATEGORY_URL = re.compile(r"/category/")
+_TAG_URL = re.compile(r"/tag/[^/?#]")
+# 본문이 끝났다고 보는 지점 (태그 영역, 관련 글, 댓글 등)
+_BODY_STOP = re.compile(r"^(?:태그|Tags?)$|카테고리의 다른 글|관련\s*글|댓글|공감|구독하기")
+_TITLE_SUFFIX = re.compile(r"\s+(?:::|\||-)\s+[^:|]*$")
+
+PAGE_URL_PREFIX = "- Page URL: "
+PAGE_TITLE_PREFIX = "- Page Title: "
+
+# 게시글 영역을 여는 역할과 통째로 건너뛸 역할
+SCOPE_ROLES = {"main", "article"}
+SKIP_ROLES = {"banner", "navigation", "complementary", "contentinfo", "search", "form", "dialog"}
+# 본문 텍스트로 모을 역할
+BODY_ROLES = {"paragraph", "listitem", "text", "code", "cell", "blockquote", "heading", "strong", "emphasis"}
+INLINE_CONTAINER_ROLES = {"paragraph", "listitem", "cell", "blockquote"}
+
+HEADER_FIELDS = {"title", "category", "date", "page_url", "page_title"}
+ALL_FIELDS = HEADER_FIELDS | {"content", "tags"}
+
+
+@dataclass
+class SnapshotPost:
+    """스냅샷에서 추출한 게시글 필드"""
+    title: str = ""
+    category: str = ""
+    date: str = ""
+    content: str = ""
+    tags: List[str] = field(default_factory=list)
+    page_url: str = ""
+    page_title: str = ""
+
+
+def snapshot_text(snapshot_data: Any) -> str:
+    """MCP tools/call 응답(또는 이미 꺼낸 텍스트)에서 스냅샷 텍스트를 꺼냅니다."""
+    if isinstance(snapshot_data, str):
+        return snapshot_data
+    if not isinstance(snapshot_data, dict):
+        return ""
+    result = snapshot_data.get("result", snapshot_data)
+    contents = result.get("content", []) if isinstance(result, dict) else []
+    return "\n".join(item.get("text", "") for item in contents if isinstance(item, dict) and item.get("type") == "text")
+
+
+def _unquote(value: Optional[str]) -> str:
+    if not value:
+        return ""
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value[1:-1]
+    if len(value) >= 2 and value[0] == value[-1] == "'":
+        return value[1:-1].replace("''", "'")
+    return value
+
+
+def _unescape_name(name: Optional[str]) -> str:
+    if not name:
+        return ""
+    return name.replace('\\"', '"').replace("\\\\", "\\") if "\\" in name else name
+
+
+def _match_node(line: str):
+    match = _NODE.match(line)
+    if match or "'" not in line:
+        return match
+    quoted = _QUOTED_NODE.match(line)
+    if not quoted:
+        return None
+    return _NODE.match(f"{quoted.group('indent')}- {quoted.group('head').replace(chr(39) * 2, chr(39))}{quoted.group('rest') or ''}")
+
+
+def parse_snapshot(snapshot_data: Any, fields: Optional[Iterable[str]] = None) -> SnapshotPost:
+    """스냅샷을 한 번 훑어 게시글 필드를 추출합니다.
+
+    fields로 필요한 필드만 지정하면(예: {"title", "date"}) 모두 찾는 즉시 멈춥니다.
+    content / tags는 끝까지 읽어야 하므로 포함되면 전체를 읽습니다.
+    """
+    wanted: Set[str] = set(fields) if fields else ALL_FIELDS
+    can_stop_early = wanted <= HEADER_FIELDS
+    post = SnapshotPost()
+    text = snapshot_text(snapshot_data)
+
+    in_yaml = False
+    scope_indent: Optional[int] = None      # main/article 노드의 들여쓰기
+    skip_indent: Optional[int] = None       # 건너뛰는 영역 노드의 들여쓰기
+    link_name = ""
+    link_indent = -1
+    body_started = False
+    body_stopped = False
+    body: List[str] = []
+    inline_indent: Optional[int] = None     # 자식 텍스트를 한 줄로 합치는 컨테이너
+    inline: List[str] = []
+    seen_tags: Set[str] = set()
+
+    def flush_inline():
+        nonlocal inline_indent
+        if inline:
+            body.append(" ".join(inline))
+            inline.clear()
+        inline_indent = None
+
+    for line in text.splitlines():
+        if not in_yaml:
+            if line.startswith(PAGE_URL_PREFIX):
+                post.page_url = line[len(PAGE_URL_PREFIX):].strip()
+            elif line.startswith(PAGE_TITLE_PREFIX):
+                post.page_title = line[len(PAGE_TITLE_PREFIX):].strip()
+            elif line.startswith("```yaml"):
+                in_yaml = True
+            continue
+        if line.startswith("```"):
+            break
+
+        match = _match_node(line)
+        if not match:
+            continue
+        indent = len(match.group("indent"))
+
+        if skip_indent is not None:
+            if indent > skip_indent:
+                continue
+            skip_indent = None
+        if inline_indent is not None and indent <= inline_indent:
+            flush_inline()
+        if scope_indent is not None and indent <= scope_indent:
+            scope_indent = None
+
+        role = match.group("role")
+        if role in SKIP_ROLES:
+            skip_indent = indent
+            continue
+        if role in SCOPE_ROLES:
+            if scope_indent is None:
+                scope_indent = indent
+            continue
+        if scope_indent is None:
+            continue
+
+        name = _unescape_name(match.group("name"))
+        value = _unquote(match.group("value"))
+
+        if role == "/url":
+            if indent > link_indent and link_name:
+                if _TAG_URL.search(value):
+                    if link_name not in seen_tags:
+                        seen_tags.add(link_name)
+                        post.tags.append(link_name)
+                    if body_started:
+                        body_stopped = True
+                elif not post.category and not body_started and _CATEGORY_URL.search(value):
+                    post.category = link_name
+            link_name = ""
+            continue
+
+        if role == "link":
+            link_name, link_indent = name, indent
+
+        label = name or value
+        if not post.date and label:
+            date_match = _DATE.search(label)
+            if date_match:
+                year, month, day = date_match.groups()
+                post.date = f"{year}-{int(month):02d}-{int(day):02d}"
+                if len(label) <= len(date_match.group(0)) + 8:
+                    continue    # 날짜만 있는 메타 줄은 본문에 넣지 않음
+
+        if role == "heading":
+            level_match = _LEVEL.search(match.group("attrs") or "")
+            level = int(level_match.group(1)) if level_match else 6
+            if not post.title and level <= 2:
+                post.title = name or value
+                body_started = True
+                if can_stop_early and all(getattr(post, f) for f in wanted):
+                    break
+                continue
+
+        if can_stop_early:
+            if all(getattr(post, f) for f in wanted):
+                break
+            continue
+        if not body_started or body_stopped:
+            continue
+        if label and _BODY_STOP.search(label):
+            flush_inline()
+            body_stopped = True
+            continue
+
+        if role in INLINE_CONTAINER_ROLES and not label:
+            flush_inline()
+            inline_indent = indent
+        elif role in BODY_ROLES or (role == "link" and inline_indent is not None):
+            if not label:
+                continue
+            if inline_indent is not None:
+                inline.append(label)
+            else:
+                body.append(label)
+
+    flush_inline()
+    if not post.title and post.page_title:
+        post.title = _TITLE_SUFFIX.sub("", post.page_title)
+    post.content = "\n".join(body)
+    return post
+
+
+# -----------------------------------------------------------------------------
+# 벤치마크
+# -----------------------------------------------------------------------------
+
+def benchmark(paths: List[str], rounds: int = 200) -> Dict[str, float]:
+    """저장된 스냅샷 파일들을 반복 파싱해 분당 처리 수를 측정합니다."""
+    snapshots = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            snapshots.append(f.read())
+    if not snapshots:
+        raise ValueError("벤치마크할 스냅샷 파일이 없습니다.")
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for snapshot in snapshots:
+            parse_snapshot(snapshot)
+    elapsed = time.perf_counter() - started
+    parsed = rounds * len(snapshots)
+    return {
+        "snapshots": parsed,
+        "total_bytes": rounds * sum(len(s.encode("utf-8")) for s in snapshots),
+        "elapsed_seconds": round(elapsed, 4),
+        "ms_per_snapshot": round(elapsed / parsed * 1000, 4),
+        "snapshots_per_minute": round(parsed / elapsed * 60),
+    }
+
+
+if __name__ == "__main__":
+    files = sys.argv[1:]
+    if not files:
+        print("사용법: python snapshot_parser.py <스냅샷 파일>...")
+        sys.exit(1)
+    for path in files:
+        with open(path, "r", encoding="utf-8") as f:
+            result = parse_snapshot(f.read())
+        print(f"📄 {path}")
+        print(f"   제목: {result.title} | 카테고리: {result.category} | 날짜: {result.date}")
+        print(f"   태그: {', '.join(result.tags)} | 본문: {len(result.content)}자")
+    print(f"⏱️ 벤치마크: {json.dumps(benchmark(files), ensure_ascii=False)}")
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+증분 SSE(Server-Sent Events) 디코더
+
+MCP 서버의 text/event-stream 응답을 청크가 도착하는 대로 해석합니다.
+응답 전체를 버퍼링하거나 한 바이트씩 읽지 않고, 이벤트 하나가 완성되는
+즉시 반환하므로 큰 fetch 결과(HTML 전체)도 선형 시간에 처리됩니다.
+
+WHATWG SSE 규격을 따릅니다:
+- 줄바꿈은 CRLF / LF / CR 모두 허용 (청크 경계에 걸친 CRLF 포함)
+- 여러 줄 data: 필드는 "\n"으로 이어 붙임
+- event: / id: / retry: 필드와 ":" 주석 줄 처리
+"""
+
+import codecs
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, List, Optional, Union
+
+_LINE_BREAK = re.compile(r"\r\n|\r|\n")
+
+
+@dataclass
+class SSEEvent:
+    """완성된 SSE 이벤트 하나"""
+    event: str = "message"
+    data: str = ""
+    id: Optional[str] = None
+    retry: Optional[int] = None
+
+    def json(self) -> Any:
+        return json.loads(self.data)
+
+
+class SSEDecoder:
+    """바이트/문자열 청크를 받아 완성된 SSEEvent 목록을 돌려주는 증분 디코더"""
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._partial: List[str] = []      # 아직 줄바꿈을 만나지 못한 줄 조각들
+        self._data: List[str] = []
+        self._event_type = ""
+        self._last_event_id: Optional[str] = None
+        self._retry: Optional[int] = None
+        self._cr_pending = False
+        self._started = False
+
+    def feed(self, chunk: Union[bytes, str]) -> List[SSEEvent]:
+        text = self._decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        if not self._started and text:
+            self._started = True
+            text = text.lstrip("\ufeff")
+        # 이전 청크가 CR로 끝났다면 이번 청크 첫 LF는 같은 줄바꿈(CRLF)의 일부
+        if self._cr_pending and text.startswith("\n"):
+            text = text[1:]
+        self._cr_pending = False
+        if not text:
+            return []
+
+        events = []
+        pos = 0
+        for match in _LINE_BREAK.finditer(text):
+            if self._partial:
+                self._partial.append(text[pos:match.start()])
+                line = "".join(self._partial)
+                self._partial = []
+            else:
+                line = text[pos:match.start()]
+            event = self._process_line(line)
+            if event:
+                events.append(event)
+            pos = match.end()
+
+        if pos < len(text):
+            self._partial.append(text[pos:])
+        self._cr_pending = text.endswith("\r")
+        return events
+
+    def flush(self) -> List[SSEEvent]:
+        """스트림 종료 시 빈 줄 없이 끝난 마지막 이벤트까지 반환합니다."""
+        events = self.feed(self._decoder.decode(b"", final=True))
+        if self._partial:
+            line = "".join(self._partial)
+            self._partial = []
+            event = self._process_line(line)
+            if event:
+                events.append(event)
+        event = self._process_line("")
+        if event:
+            events.append(event)
+        return events
+
+    def _process_line(self, line: str) -> Optional[SSEEvent]:
+        if not line:
+            return self._dispatch()
+        if line.startswith(":"):
+            return None
+
+        field, sep, value = line.partition(":")
+        if sep and value.startswith(" "):
+            value = value[1:]
+
+        if field == "data":
+            self._data.append(value)
+        elif field == "event":
+            self._event_type = value
+        elif field == "id":
+            if "\0" not in value:
+                self._last_event_id = value
+        elif field == "retry":
+            if value.isdigit():
+                self._retry = int(value)
+        return None
+
+    def _dispatch(self) -> Optional[SSEEvent]:
+        if not self._data:
+            self._event_type = ""
+            return None
+        event = SSEEvent(
+            event=self._event_type or "message",
+            data="\n".join(self._data),
+            id=self._last_event_id,
+            retry=self._retry
+        )
+        self._data = []
+        self._event_type = ""
+        return event
+
+
+def iter_sse_events(chunks: Iterable[Union[bytes, str]]) -> Iterator[SSEEvent]:
+    """동기 청크 이터레이터(예: requests의 iter_content)에서 이벤트를 순서대로 반환합니다."""
+    decoder = SSEDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    yield from decoder.flush()
+
+
+async def aiter_sse_events(chunks: AsyncIterable[Union[bytes, str]]) -> AsyncIterator[SSEEvent]:
+    """비동기 청크 이터레이터(예: aiohttp의 content.iter_any())에서 이벤트를 반환합니다."""
+    decoder = SSEDecoder()
+    async for chunk in chunks:
+        for event in decoder.feed(chunk):
+            yield event
+    for event in decoder.flush():
+        yield event
+
+
+def _to_message(event: SSEEvent) -> Optional[Any]:
+    if event.event != "message" or not event.data or event.data == "[DONE]":
+        return None
+    try:
+        return event.json()
+    except json.JSONDecodeError:
+        return None
+
+
+def iter_jsonrpc_messages(chunks: Iterable[Union[bytes, str]]) -> Iterator[Any]:
+    """SSE 스트림에서 JSON-RPC 메시지를 이벤트가 완성될 때마다 반환합니다."""
+    for event in iter_sse_events(chunks):
+        message = _to_message(event)
+        if message is not None:
+            yield message
+
+
+def parse_sse_messages(text: str) -> List[Any]:
+    """이미 받은 SSE 본문 전체에서 JSON-RPC 메시지 목록을 추출합니다."""
+    return list(iter_jsonrpc_messages([text]))
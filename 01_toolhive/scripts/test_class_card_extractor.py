@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+class_card_extractor 이름 추출 테스트
+
+fixtures/classu_cards.html의 카드를 BeautifulSoup 경로와 lxml 경로(설치된 경우)로
+각각 추출해, 인라인 요소로 감싼 이름과 script/style 안의 텍스트를 같은 규칙으로
+처리하는지 확인합니다.
+"""
+
+import os
+
+from class_card_extractor import HAS_LXML, ClassCardExtractor
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "classu_cards.html")
+
+
+def extract_cards(use_lxml: bool):
+    with open(FIXTURE, encoding="utf-8") as f:
+        return ClassCardExtractor(use_lxml=use_lxml).extract(f.read())
+
+
+def check_cards(cards):
+    assert len(cards) == 3, f"카드 수가 다름: {len(cards)}"
+    plain, wrapped, scripted = cards
+
+    assert plain.name == "김철수코치", plain.name
+    assert plain.students_count == 1234, plain.students_count
+
+    # <div><b>홍길동코치</b></div>: 자식 요소 하나의 문자열로 이름을 찾음
+    assert wrapped.name == "홍길동코치", wrapped.name
+    assert wrapped.class_title == "파이썬 데이터 분석", wrapped.class_title
+
+    # script 안의 "박영희코치"와 style 안의 "999명"은 무시하고 클래스 기반 이름과 실제 수강생 수 사용
+    assert scripted.name == "이민수", scripted.name
+    assert scripted.students_count == 321, scripted.students_count
+    assert "var label" not in scripted.text and "content:" not in scripted.text, scripted.text
+    assert scripted.class_url == "/class/103", scripted.class_url
+
+
+def test_bs4_cards():
+    """BeautifulSoup 경로로 fixture 카드를 추출합니다."""
+    print("\n🍲 BeautifulSoup 경로:")
+    check_cards(extract_cards(use_lxml=False))
+    print("✅ 이름/수강생 수/본문 추출 일치")
+
+
+def test_lxml_cards():
+    """lxml 경로로 fixture 카드를 추출합니다. lxml이 없으면 건너뜁니다."""
+    print("\n⚡ lxml 경로:")
+    if not HAS_LXML:
+        print("⏭️ lxml이 설치되어 있지 않아 건너뜀")
+        return
+    check_cards(extract_cards(use_lxml=True))
+    print("✅ 이름/수강생 수/본문 추출 일치")
+
+
+if __name__ == "__main__":
+    test_bs4_cards()
+    test_lxml_cards()
+    print("\n🎉 모든 테스트 통과")
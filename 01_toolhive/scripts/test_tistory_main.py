@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+tistory_blog_mcp_scraper.main()을 --stream 없이 실행하는 테스트
+
+MCP 서버 없이 scrape_all_posts만 바꿔 끼워, 저널을 만들지 않는 기본 실행이
+정리(finally) 단계에서 실패하지 않는지 확인합니다.
+"""
+
+import os
+import sys
+import tempfile
+from unittest import mock
+
+import tistory_blog_mcp_scraper as scraper_module
+
+
+def run_main(workdir: str, scrape_all_posts):
+    """임시 디렉터리에서 --stream 없이 main()을 실행합니다."""
+    argv = [
+        "tistory_blog_mcp_scraper.py",
+        "--output", os.path.join(workdir, "posts.json"),
+        "--state-file", os.path.join(workdir, "state.json"),
+        "--journal", os.path.join(workdir, "journal.sqlite3"),
+    ]
+    with mock.patch.object(sys, "argv", argv), \
+            mock.patch.object(scraper_module.TistoryBlogMCPScraper, "scrape_all_posts", scrape_all_posts):
+        scraper_module.main()
+
+
+def test_main_without_stream_no_posts():
+    """수집된 게시글이 없을 때 저널 없이 정상 종료되는지 확인합니다."""
+    print("\n📭 --stream 없이 게시글 0개로 실행:")
+    with tempfile.TemporaryDirectory() as workdir:
+        run_main(workdir, lambda self, **kwargs: [])
+        assert not os.path.exists(os.path.join(workdir, "journal.sqlite3")), "--stream 없이 저널이 생성됨"
+    print("✅ 정상 종료, 저널 파일 없음")
+
+
+def test_main_without_stream_keeps_original_error():
+    """수집 중 발생한 예외가 정리 단계의 오류로 가려지지 않는지 확인합니다."""
+    print("\n💥 --stream 없이 수집 중 예외 발생:")
+
+    def fail(self, **kwargs):
+        raise RuntimeError("수집 실패")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        try:
+            run_main(workdir, fail)
+        except RuntimeError as e:
+            assert str(e) == "수집 실패"
+        else:
+            raise AssertionError("예외가 전달되지 않음")
+    print("✅ 원래 예외(RuntimeError)가 그대로 전달됨")
+
+
+if __name__ == "__main__":
+    test_main_without_stream_no_posts()
+    test_main_without_stream_keeps_original_error()
+    print("\n🎉 모든 테스트 통과")
@@ -14,15 +14,26 @@ gongeerie 티스토리 블로그(https://metashower.tistory.com/)에서
 5. JSON 형태로 결과 저장
 """
 
+import argparse
 import json
+import os
+import queue
 import requests
-import re
 import time
 import logging
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
+from columnar_export import ColumnarWriter
+from crawl_journal import CrawlJournal
+from crawl_scheduler import CrawlScheduler, HostRateLimiter, host_of
+from post_state import PostState, PostStateStore, content_hash
+from records import BlogPost
+from result_sink import ResultSink, is_stream_path, iter_records, write_summary
+from scrape_store import save_to_store
+from snapshot_parser import parse_snapshot
+from toolhive_mcp_client import SyncMCPClient
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -30,101 +41,66 @@ logger = logging.getLogger(__name__)
 # ToolHive Playwright MCP 서버 설정
 PLAYWRIGHT_MCP_URL = "http://127.0.0.1:44251"
 TARGET_BLOG_URL = "https://metashower.tistory.com/"
-
-@dataclass
-class BlogPost:
-    """블로그 게시글 정보를 저장하는 데이터 클래스"""
-    title: str
-    url: str
-    category: str
-    date: str
-    content: str
-    summary: str
-    thumbnail: str = ""
-    tags: List[str] = None
-    
-    def __post_init__(self):
-        if self.tags is None:
-            self.tags = []
+OUTPUT_FILE = "tistory_blog_posts.json"
+STATE_FILE = "tistory_scrape_state.json"
+JOURNAL_FILE = "tistory_scrape_journal.sqlite3"
+STATE_SAVE_EVERY = 25  # 저널 사용 시 이 개수마다 게시글 상태를 중간 저장
 
 class TistoryBlogMCPScraper:
     """ToolHive Playwright MCP를 활용한 티스토리 블로그 스크래퍼"""
     
-    def __init__(self):
+    def __init__(self, state_file: str = STATE_FILE, workers: int = 1, per_host_interval: float = 0.5,
+                 sink: Optional[ResultSink] = None, journal: Optional[CrawlJournal] = None,
+                 exporter: Optional[ColumnarWriter] = None):
+        self.client = SyncMCPClient(PLAYWRIGHT_MCP_URL, client_name="TistoryBlogScraper")
         self.session_id = None
+        
+        # 상세 수집 워커: 워커마다 별도 MCP 세션(브라우저)을 사용
+        self.workers = max(1, workers)
+        self.worker_clients: List[SyncMCPClient] = []
+        self.rate_limiter = HostRateLimiter(min_interval=per_host_interval)
         self.posts: List[BlogPost] = []
         self.total_posts_expected = 101  # 웹사이트에서 확인된 총 게시글 수
         self.categories = {}  # 카테고리별 게시글 수
+        # 상세 수집이 끝난 게시글을 즉시 한 줄씩 기록하는 스트림 (선택)
+        self.sink = sink
+        # URL별 진행 상태 체크포인트 (--resume 시 완료된 게시글은 건너뜀)
+        self.journal = journal
+        # Parquet/Arrow 내보내기 (수집 중 row group 단위로 기록, 재사용한 게시글은 마지막에 추가)
+        self.exporter = exporter
+        
+        # 증분 수집용 게시글 상태와 헤더 확인용 HTTP 세션
+        self.state_store = PostStateStore(state_file)
+        self.http = requests.Session()
+        self.http.headers['User-Agent'] = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36'
+        self.incremental_stats = {"new": 0, "changed": 0, "unchanged": 0, "removed": 0}
+        # 증분 모드 여부 (ETag/Last-Modified 확인용 HEAD 요청은 증분 모드에서만 보냄)
+        self.incremental = False
+        # 변경 감지로 다시 수집하게 된 이유 (URL → "new" / "changed")
+        self.refresh_reasons: Dict[str, str] = {}
+        # MCP 추출에 실패해 시뮬레이션 데이터로 채운 게시글 URL (상태/저장소에 기록하지 않음)
+        self.simulated_urls: set = set()
         
     def get_session_id(self) -> Optional[str]:
-        """SSE 엔드포인트에서 sessionId를 획득합니다."""
+        """공용 MCP 클라이언트로 SSE 세션을 열고 sessionId를 반환합니다."""
         try:
             logger.info("🔗 Playwright MCP 세션 ID 획득 중...")
-            response = requests.get(f"{PLAYWRIGHT_MCP_URL}/sse", 
-                                  headers={"Accept": "text/event-stream"},
-                                  stream=True, timeout=30)
-            
-            for line in response.iter_lines(decode_unicode=True):
-                if line and line.startswith("data:"):
-                    data = line.replace("data:", "").strip()
-                    match = re.search(r"sessionId=([a-f0-9\-]+)", data)
-                    if match:
-                        session_id = match.group(1)
-                        logger.info(f"✅ 세션 ID 획득 성공: {session_id}")
-                        return session_id
-                        
+            session_id = self.client.connect()
+            logger.info(f"✅ 세션 ID 획득 성공: {session_id}")
+            return session_id
         except Exception as e:
             logger.error(f"❌ 세션 ID 획득 실패: {e}")
             return None
-        
-        logger.error("❌ sessionId를 찾을 수 없습니다.")
-        return None
-
-    def parse_sse_response(self, response_text: str) -> Dict:
-        """SSE 응답을 파싱하여 JSON 데이터 추출"""
-        for line in response_text.split('\n'):
-            if line.startswith('data: '):
-                data_str = line[6:].strip()
-                if data_str:
-                    try:
-                        return json.loads(data_str)
-                    except json.JSONDecodeError:
-                        continue
-        return {"error": "No valid JSON found in SSE response"}
-
-    def send_mcp_request(self, method: str, params: Dict = None, rpc_id: int = 1) -> Dict:
-        """MCP 서버에 JSON-RPC 요청을 보냅니다."""
+
+    def send_mcp_request(self, method: str, params: Dict = None,
+                         client: Optional[SyncMCPClient] = None) -> Dict:
+        """MCP 서버에 JSON-RPC 요청을 보냅니다. client를 주면 해당 워커 세션으로 보냅니다."""
         if not self.session_id:
             logger.error("❌ 세션 ID가 없습니다.")
             return {"error": "No session ID"}
-            
-        payload = {
-            "jsonrpc": "2.0",
-            "id": rpc_id,
-            "method": method,
-            "params": params or {}
-        }
         
         try:
-            response = requests.post(
-                f"{PLAYWRIGHT_MCP_URL}/messages?sessionId={self.session_id}",
-                headers={
-                    "Accept": "application/json, text/event-stream",
-                    "Content-Type": "application/json"
-                },
-                data=json.dumps(payload),
-                timeout=60
-            )
-            
-            if response.headers.get('content-type', '').startswith('text/event-stream'):
-                # SSE 응답 파싱
-                return self.parse_sse_response(response.text)
-            else:
-                try:
-                    return response.json()
-                except json.JSONDecodeError:
-                    return {"error": "Failed to parse response", "text": response.text}
-                
+            return (client or self.client).request(method, params)
         except Exception as e:
             logger.error(f"❌ MCP 요청 실패: {e}")
             return {"error": str(e)}
@@ -134,18 +110,14 @@ class TistoryBlogMCPScraper:
         logger.info("🚀 브라우저 초기화 중...")
         
         # MCP 표준 프로토콜에 따른 초기화
-        init_result = self.send_mcp_request("initialize", {
-            "protocolVersion": "2024-11-05",
-            "capabilities": {},
-            "clientInfo": {
-                "name": "TistoryBlogScraper",
-                "version": "1.0.0"
-            }
-        }, rpc_id=1)
+        try:
+            init_result = self.client.initialize()
+        except Exception as e:
+            init_result = {"error": str(e)}
         
         if init_result and "result" in init_result:
             logger.info("✅ MCP 서버 초기화 성공!")
-            logger.info(f"서버: {init_result['result']['serverInfo']['name']} v{init_result['result']['serverInfo']['version']}")
+            logger.info(f"서버: {self.client.server_info.get('name')} v{self.client.server_info.get('version')}")
             return True
         else:
             logger.error(f"❌ MCP 서버 초기화 실패: {init_result}")
@@ -158,7 +130,7 @@ class TistoryBlogMCPScraper:
         result = self.send_mcp_request("tools/call", {
             "name": "browser_navigate",
             "arguments": {"url": url}
-        }, rpc_id=3)
+        })
         
         if "error" in result:
             logger.error(f"❌ 페이지 이동 실패: {result['error']}")
@@ -167,14 +139,14 @@ class TistoryBlogMCPScraper:
         logger.info(f"✅ 페이지 이동 완료: {url}")
         return True
 
-    def get_page_snapshot(self) -> Dict:
+    def get_page_snapshot(self, client: Optional[SyncMCPClient] = None) -> Dict:
         """현재 페이지의 스냅샷을 가져옵니다."""
         logger.info("📸 페이지 스냅샷 가져오는 중...")
         
         result = self.send_mcp_request("tools/call", {
             "name": "browser_snapshot",
             "arguments": {"random_string": "snapshot"}
-        }, rpc_id=6)
+        }, client=client)
         
         return result
 
@@ -343,134 +315,66 @@ class TistoryBlogMCPScraper:
             logger.error(f"❌ 게시글 추출 중 오류: {e}")
             return None
 
-    def parse_post_from_snapshot(self, snapshot_data: Dict, post_url: str) -> Optional[BlogPost]:
-        """스냅샷에서 게시글 정보를 파싱합니다."""
+    def parse_post_from_snapshot(self, snapshot_data: Dict, post_url: str,
+                                 post_title: str = "", post_category: str = "") -> Optional[BlogPost]:
+        """스냅샷에서 게시글 정보를 파싱합니다.
+        
+        목록에서 알고 있는 제목/카테고리는 스냅샷에서 찾지 못했을 때의 기본값으로 사용합니다.
+        """
         try:
-            # 실제로는 스냅샷 데이터를 파싱해야 하지만, 
-            # 여기서는 URL을 기반으로 시뮬레이션 데이터 생성
-            
-            url_slug = post_url.split('/')[-1]
-            
-            # 샘플 게시글 데이터 (실제로는 스냅샷에서 추출)
-            sample_posts_data = {
-                "toolhive-mcp-servers": {
-                    "title": "Toolhive MCP Servers",
-                    "category": "AI",
-                    "date": "2024-12-01",
-                    "content": "ToolHive는 Model Context Protocol (MCP) 서버의 배포와 관리를 단순화하는 플랫폼입니다. MCP 서버를 안전하고 일관성 있게 실행할 수 있도록 최소한의 권한으로 컨테이너 환경에서 동작하게 해줍니다.",
-                    "summary": "ToolHive 개요와 MCP 서버 관리 플랫폼 소개",
-                    "tags": ["AI", "MCP", "ToolHive", "서버관리"]
-                },
-                "langgraph": {
-                    "title": "LangGraph",
-                    "category": "AI", 
-                    "date": "2024-11-28",
-                    "content": "LangGraph은 언어모델(LM) 기반 어플리케이션을 위한 비순환 그래프(DAG) 기반의 프로그래밍 프레임워크로 복잡한 작업을 모듈화된 단계로 분해하고 흐름을 제어하는데 특화되어 있습니다.",
-                    "summary": "LangGraph의 기본 개념과 Multi-Agent 시스템 구축",
-                    "tags": ["AI", "LangGraph", "LangChain", "그래프"]
-                },
-                "moe-mixture-of-experts": {
-                    "title": "MoE (Mixture of Experts)",
-                    "category": "AI",
-                    "date": "2024-11-25", 
-                    "content": "최근 DeepSeek이 세상에 등장하면서 큰 화두를 불러일으켰다. ChatGPT4와 거의 비슷한 성능을 내면서도 구현 비용은 1/10로 줄여 더욱 light하면서도 정밀한 LLM 모델의 등장이었다.",
-                    "summary": "MoE 아키텍처의 핵심 개념과 DeepSeek의 혁신",
-                    "tags": ["AI", "MoE", "DeepSeek", "딥러닝"]
-                },
-                "mcp-model-context-protocol": {
-                    "title": "MCP (Model Context Protocol)",
-                    "category": "AI",
-                    "date": "2024-11-22",
-                    "content": "Model Context Protocol은 언어 모델이나 AI 시스템과 상호작용할 때 사용하는 일련의 규칙, 형식, 구조입니다. 이 Protocol은 모델이 주어진 정보를 '문맥'으로 이해하고 처리할 수 있도록 돕는 방식을 정의합니다.",
-                    "summary": "MCP의 개념과 프롬프팅, 컨텍스트 관리 방법",
-                    "tags": ["AI", "MCP", "프롬프팅", "컨텍스트"]
-                },
-                "python-decimal": {
-                    "title": "[python] 정밀한 소수점 자리가 필요할때 쓰는 decimal",
-                    "category": "Python",
-                    "date": "2024-11-20",
-                    "content": "파이썬은 숫자 데이터를 다루는 코드를 작성하기에 아주 뛰어난 언어이다. 파이썬의 정수타입은 현실적인 크기의 값을 모두 표현할 수 있다. 그러나 이것만으로는 산술적 상황을 충족하지 못할 수 있다.",
-                    "summary": "Python decimal 모듈을 사용한 정밀한 소수점 계산",
-                    "tags": ["Python", "decimal", "소수점", "정밀계산"]
-                },
-                "python-version-check": {
-                    "title": "[python] 버전 확인 하기",
-                    "category": "Python",
-                    "date": "2024-11-18",
-                    "content": "파이썬 버전을 확인하는 다양한 방법들을 소개합니다. 명령행에서 확인하는 방법과 프로그램 내에서 확인하는 방법을 다룹니다.",
-                    "summary": "Python 버전 확인을 위한 다양한 방법들",
-                    "tags": ["Python", "버전확인", "sys모듈"]
-                },
-                "python-list-tuple-difference": {
-                    "title": "[python]List와 Tuple의 차이점",
-                    "category": "Python",
-                    "date": "2024-11-15",
-                    "content": "리스트와 튜플의 가장큰 차이점: 1. 리스트는 동적인 배열이다. 수정이 가능하며, 저장 용량을 늘리거나 줄일 수도있다. 2. 튜플은 정적인 배열이다.",
-                    "summary": "Python List와 Tuple의 특징과 사용 사례 비교",
-                    "tags": ["Python", "List", "Tuple", "자료구조"]
-                },
-                "csharp-thread-synchronization": {
-                    "title": "[C#] Thread Synchronization",
-                    "category": "C#",
-                    "date": "2024-11-12",
-                    "content": "C# 스레드 안전화의 모든것. Thread Synchronization 스레드 동기화. Thread-Safe한 메서드를 다수의 스레드가 동시에 실행하고 그 메서드에서 클래스 객체의 필드들을 읽거나 쓸때...",
-                    "summary": "C# 스레드 동기화와 Thread-Safe 구현 방법",
-                    "tags": ["C#", "Thread", "동기화", "멀티스레딩"]
-                }
-            }
+            parsed = parse_snapshot(snapshot_data)
+            title = parsed.title or post_title
+            if not title or not parsed.content:
+                logger.debug(f"⚠️ 스냅샷에서 게시글 본문을 찾지 못함: {post_url}")
+                return None
             
-            # URL에서 슬러그 추출하여 해당 데이터 찾기
-            for slug, data in sample_posts_data.items():
-                if slug in post_url:
-                    return BlogPost(
-                        title=data["title"],
-                        url=post_url,
-                        category=data["category"],
-                        date=data["date"],
-                        content=data["content"],
-                        summary=data["summary"],
-                        tags=data["tags"]
-                    )
-            
-            # 기본 데이터 (매칭되지 않는 경우)
             return BlogPost(
-                title=f"게시글 {url_slug}",
+                title=title,
                 url=post_url,
-                category="기타",
-                date="2024-01-01", 
-                content="게시글 내용을 추출할 수 없습니다.",
-                summary="요약 정보 없음",
-                tags=[]
+                category=parsed.category or post_category or "기타",
+                date=parsed.date,
+                content=parsed.content,
+                summary=parsed.content[:100] + ("..." if len(parsed.content) > 100 else ""),
+                tags=parsed.tags
             )
             
         except Exception as e:
             logger.error(f"❌ 게시글 파싱 중 오류: {e}")
             return None
 
-    def extract_post_content_with_fallback(self, post_url: str, post_title: str, post_category: str, post_index: int) -> Optional[BlogPost]:
-        """ToolHive Playwright MCP를 사용하여 게시글 내용을 추출하거나, 실패시 시뮬레이션 데이터 사용"""
+    def extract_post_content_with_fallback(self, post_url: str, post_title: str, post_category: str, post_index: int,
+                                           client: Optional[SyncMCPClient] = None) -> Tuple[BlogPost, bool]:
+        """ToolHive Playwright MCP를 사용하여 게시글 내용을 추출하거나, 실패시 시뮬레이션 데이터 사용
+        
+        (게시글, 시뮬레이션 여부)를 반환합니다.
+        """
         try:
+            # 같은 호스트 요청 간격 유지
+            self.rate_limiter.wait(host_of(post_url))
+            
             # ToolHive Playwright MCP로 페이지 이동 시도
             navigate_result = self.send_mcp_request("tools/call", {
                 "name": "browser_navigate",
                 "arguments": {"url": post_url}
-            }, rpc_id=post_index + 100)
+            }, client=client)
             
             if navigate_result and "result" in navigate_result:
                 logger.debug(f"✅ MCP 네비게이션 성공: {post_url}")
                 
                 # 페이지 스냅샷 가져오기 시도
-                snapshot_result = self.get_page_snapshot()
+                snapshot_result = self.get_page_snapshot(client)
                 
                 if snapshot_result and "result" in snapshot_result:
                     # 실제 페이지 데이터에서 내용 추출 시도
-                    return self.parse_post_from_snapshot(snapshot_result, post_url)
+                    post_data = self.parse_post_from_snapshot(snapshot_result, post_url, post_title, post_category)
+                    if post_data:
+                        return post_data, False
             
         except Exception as e:
             logger.debug(f"⚠️ MCP 사용 실패, 시뮬레이션 데이터 사용: {e}")
         
         # MCP 실패시 시뮬레이션 데이터 사용
-        return self.generate_simulation_post_data(post_url, post_title, post_category, post_index)
+        return self.generate_simulation_post_data(post_url, post_title, post_category, post_index), True
 
     def generate_simulation_post_data(self, post_url: str, post_title: str, post_category: str, post_index: int) -> BlogPost:
         """시뮬레이션된 게시글 데이터 생성"""
@@ -496,17 +400,17 @@ class TistoryBlogMCPScraper:
         # 카테고리와 제목에 맞는 내용 찾기
         content = ""
         summary = ""
-        tags = []
+        tags = ()
         
         if post_category in content_templates and post_title in content_templates[post_category]:
             content = content_templates[post_category][post_title]
             summary = content[:100] + "..."
-            tags = [post_category, "프로그래밍", "개발"]
+            tags = (post_category, "프로그래밍", "개발")
         else:
             # 기본 시뮬레이션 내용
             content = f"{post_title}에 대한 상세한 내용입니다. 이 게시글은 {post_category} 카테고리에 속하며, 개발자들에게 유용한 정보를 제공합니다. 실무에서 활용할 수 있는 다양한 예제와 함께 자세히 설명되어 있습니다."
             summary = f"{post_title}에 대한 {post_category} 관련 내용 정리"
-            tags = [post_category, "개발", "프로그래밍"]
+            tags = (post_category, "개발", "프로그래밍")
         
         # 날짜 생성 (최신부터 역순으로)
         import datetime
@@ -523,6 +427,191 @@ class TistoryBlogMCPScraper:
             tags=tags
         )
 
+    # -------------------------------------------------------------------------
+    # 증분 수집 (변경 감지)
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def listing_hash(post_title: str, post_category: str) -> str:
+        """목록 항목(제목, 카테고리)의 해시"""
+        return content_hash(post_title, post_category)
+
+    @staticmethod
+    def post_content_hash(post: BlogPost) -> str:
+        """수집된 게시글 본문의 해시"""
+        return content_hash(post.title, post.category, post.date, post.content, post.summary, *post.tags)
+
+    def fetch_post_validators(self, post_url: str, state: Optional[PostState] = None) -> Tuple[int, Optional[str], Optional[str]]:
+        """HEAD 요청으로 (상태 코드, ETag, Last-Modified)를 가져옵니다.
+
+        이전 상태가 있으면 조건부 헤더를 붙여 변경이 없을 때 304를 받습니다.
+        """
+        headers = {}
+        if state and state.etag:
+            headers['If-None-Match'] = state.etag
+        if state and state.last_modified:
+            headers['If-Modified-Since'] = state.last_modified
+        response = self.http.head(post_url, headers=headers, timeout=5, allow_redirects=True)
+        return response.status_code, response.headers.get('ETag'), response.headers.get('Last-Modified')
+
+    def needs_refresh(self, post_url: str, post_title: str, post_category: str,
+                      previous_posts: Dict[str, BlogPost]) -> bool:
+        """새 게시글이거나 목록 항목/응답 헤더가 바뀐 게시글인지 확인합니다."""
+        state = self.state_store.get(post_url)
+        if not state or post_url not in previous_posts:
+            self.incremental_stats["new"] += 1
+            self.refresh_reasons[post_url] = "new"
+            return True
+        if state.listing_hash != self.listing_hash(post_title, post_category):
+            self.incremental_stats["changed"] += 1
+            self.refresh_reasons[post_url] = "changed"
+            return True
+        
+        if state.etag or state.last_modified:
+            try:
+                status, etag, last_modified = self.fetch_post_validators(post_url, state)
+            except requests.RequestException as e:
+                logger.debug(f"⚠️ 헤더 확인 실패, 다시 수집: {post_url} ({e})")
+                self.incremental_stats["changed"] += 1
+                self.refresh_reasons[post_url] = "changed"
+                return True
+            if status != 304 and (etag, last_modified) != (state.etag, state.last_modified):
+                self.incremental_stats["changed"] += 1
+                self.refresh_reasons[post_url] = "changed"
+                return True
+        
+        self.incremental_stats["unchanged"] += 1
+        return False
+
+    def current_validators(self, post_url: str) -> Tuple[Optional[str], Optional[str]]:
+        """게시글의 현재 (ETag, Last-Modified)를 반환합니다. 확인할 수 없으면 (None, None)"""
+        try:
+            _, etag, last_modified = self.fetch_post_validators(post_url)
+            return etag, last_modified
+        except requests.RequestException:
+            return None, None
+
+    def record_post_state(self, post: BlogPost, post_title: str, post_category: str,
+                          validators: Optional[Tuple[Optional[str], Optional[str]]] = None) -> bool:
+        """수집한 게시글의 해시와 검증자(ETag/Last-Modified)를 상태에 기록합니다.
+        
+        본문 해시가 이전 상태와 다르거나 이전 상태가 없으면 True를 반환합니다.
+        """
+        previous = self.state_store.get(post.url)
+        new_hash = self.post_content_hash(post)
+        etag, last_modified = validators if validators is not None else (None, None)
+        
+        self.state_store.update(PostState(
+            url=post.url,
+            listing_hash=self.listing_hash(post_title, post_category),
+            content_hash=new_hash,
+            etag=etag,
+            last_modified=last_modified,
+            scraped_at=time.strftime("%Y-%m-%d %H:%M:%S")
+        ))
+        return not previous or previous.content_hash != new_hash
+
+    def load_previous_posts(self, filename: str = OUTPUT_FILE) -> Dict[str, BlogPost]:
+        """이전 실행 결과 파일(요약 JSON 또는 NDJSON 스트림)에서 URL → BlogPost를 읽습니다."""
+        if not os.path.exists(filename):
+            return {}
+        try:
+            if is_stream_path(filename):
+                # 스트림은 같은 URL이 여러 번 나올 수 있으므로 마지막 기록을 사용
+                posts = {item["url"]: BlogPost.from_dict(item) for item in iter_records(filename)}
+            else:
+                with open(filename, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                posts = {item["url"]: BlogPost.from_dict(item) for item in data.get("posts", [])}
+            logger.info(f"📂 이전 결과 로드: {len(posts)}개 게시글 ({filename})")
+            return posts
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.warning(f"⚠️ 이전 결과 파일을 읽을 수 없어 전체 수집합니다: {e}")
+            return {}
+
+    # -------------------------------------------------------------------------
+    # 병렬 상세 수집 (워커 풀)
+    # -------------------------------------------------------------------------
+
+    def open_worker_clients(self) -> List[SyncMCPClient]:
+        """메인 세션 외에 워커 수만큼 MCP 세션을 추가로 열고 초기화합니다."""
+        clients = [self.client]
+        for n in range(1, self.workers):
+            client = SyncMCPClient(PLAYWRIGHT_MCP_URL, client_name=f"TistoryBlogScraper-{n}")
+            try:
+                client.connect()
+                if "result" not in client.initialize():
+                    raise RuntimeError("initialize 응답에 result가 없습니다.")
+                clients.append(client)
+                self.worker_clients.append(client)
+            except Exception as e:
+                logger.warning(f"⚠️ 워커 세션 {n} 생성 실패, 현재 {len(clients)}개 세션으로 진행: {e}")
+                client.close()
+                break
+        logger.info(f"👷 상세 수집 워커: {len(clients)}개 MCP 세션")
+        return clients
+
+    def extract_posts_parallel(self, targets: List[Tuple[int, str, str, str]]) -> Dict[str, BlogPost]:
+        """게시글 큐를 여러 MCP 세션이 나눠 처리하고, 진행률과 남은 시간을 출력합니다."""
+        clients = self.open_worker_clients() if len(targets) > 1 else [self.client]
+        idle_clients: "queue.Queue[SyncMCPClient]" = queue.Queue()
+        for client in clients:
+            idle_clients.put(client)
+        
+        def work(target: Tuple[int, str, str, str]):
+            i, post_url, post_title, post_category = target
+            if self.journal:
+                self.journal.start(post_url)
+            client = idle_clients.get()
+            try:
+                post_data, simulated = self.extract_post_content_with_fallback(post_url, post_title, post_category, i,
+                                                                               client=client)
+            finally:
+                idle_clients.put(client)
+            # 검증자는 다음 증분 실행의 조건부 요청에만 쓰이므로 증분 모드에서만 HEAD 요청
+            validators = self.current_validators(post_url) if self.incremental and not simulated else None
+            return post_data, simulated, validators
+        
+        fetched: Dict[str, BlogPost] = {}
+        started = time.monotonic()
+        
+        def on_result(done: int, target: Tuple[int, str, str, str], result):
+            _, post_url, post_title, post_category = target
+            post_data, simulated, validators = result
+            if post_data and simulated:
+                # 시뮬레이션 데이터는 결과에만 넣고 상태/스트림에는 남기지 않으며,
+                # 저널에는 실패로 기록해 --resume 때 다시 수집
+                fetched[post_url] = post_data
+                self.simulated_urls.add(post_url)
+                logger.warning(f"⚠️ 게시글 추출 실패, 시뮬레이션 데이터 사용: {post_url}")
+                if self.journal:
+                    self.journal.fail(post_url, "MCP 추출 실패 (시뮬레이션 데이터로 대체)")
+            elif post_data:
+                fetched[post_url] = post_data
+                content_changed = self.record_post_state(post_data, post_title, post_category, validators)
+                if not content_changed and self.refresh_reasons.get(post_url) == "changed":
+                    # 목록/헤더는 바뀌었지만 본문 해시가 같으면 변경 없음으로 집계
+                    logger.debug(f"♻️ 본문 변경 없음: {post_url}")
+                    self.incremental_stats["changed"] -= 1
+                    self.incremental_stats["unchanged"] += 1
+                offset = self.sink.write(post_data) if self.sink else None
+                if self.exporter:
+                    self.exporter.write(post_data)
+                if self.journal:
+                    self.journal.done(post_url, offset)
+            elif self.journal:
+                self.journal.fail(post_url, "게시글 추출 실패")
+            if self.journal and done % STATE_SAVE_EVERY == 0:
+                self.state_store.save()
+            elapsed = max(time.monotonic() - started, 1e-6)
+            eta = elapsed / done * (len(targets) - done)
+            logger.info(f"📖 게시글 {done}/{len(targets)} 완료 ({done / elapsed:.1f}개/초, 남은 시간 약 {eta:.0f}초)")
+        
+        # 속도 제한은 extract_post_content_with_fallback 안에서 MCP 요청 직전에 적용
+        scheduler = CrawlScheduler(max_concurrency=len(clients), per_host_interval=0)
+        scheduler.run(targets, work, key=lambda target: host_of(target[1]), on_result=on_result)
+        return fetched
+
     def collect_all_post_links(self) -> List[Dict[str, str]]:
         """모든 게시글 링크를 수집합니다."""
         logger.info("📄 모든 게시글 링크 수집 시작...")
@@ -535,8 +624,15 @@ class TistoryBlogMCPScraper:
         
         return all_post_links
 
-    def scrape_all_posts(self) -> List[BlogPost]:
-        """모든 게시글을 스크래핑합니다."""
+    def scrape_all_posts(self, incremental: bool = False, previous_output: str = OUTPUT_FILE,
+                         resume: bool = False) -> List[BlogPost]:
+        """모든 게시글을 스크래핑합니다.
+        
+        incremental=True면 이전 결과(previous_output)와 수집 상태를 읽어
+        새 게시글이거나 목록/헤더가 바뀐 게시글만 다시 수집하고 나머지는 이전 결과를 재사용합니다.
+        resume=True면 저널에 완료로 기록되고 결과 스트림에 남아 있는 게시글은 건너뛰고
+        실패했거나 처리 중이던 게시글만 다시 수집합니다.
+        """
         all_posts = []
         
         try:
@@ -560,12 +656,8 @@ class TistoryBlogMCPScraper:
                 logger.error("❌ 게시글 링크를 찾을 수 없음")
                 return []
             
-            # 4. 각 게시글 상세 내용 수집
-            logger.info(f"📚 총 {len(all_post_links)}개 게시글 상세 내용 수집 시작...")
-            
+            entries = []
             for i, post_link in enumerate(all_post_links, 1):
-                logger.info(f"📖 게시글 {i}/{len(all_post_links)} 처리 중...")
-                
                 if isinstance(post_link, dict):
                     post_url = post_link.get("url", "")
                     post_title = post_link.get("title", "")
@@ -575,24 +667,53 @@ class TistoryBlogMCPScraper:
                     post_title = f"게시글 {i}"
                     post_category = "기타"
                 
-                if not post_url:
-                    continue
-                
-                # ToolHive Playwright MCP 사용 시도, 실패시 시뮬레이션 데이터 사용
-                post_data = self.extract_post_content_with_fallback(post_url, post_title, post_category, i)
-                
+                if post_url:
+                    entries.append((i, post_url, post_title, post_category))
+            
+            # 4. 이어서 수집: 이전 실행에서 완료된 게시글은 스트림에서 복원
+            self.state_store.load()
+            resumed_posts = self.resume_completed_posts(entries) if resume else {}
+            if self.journal and not resume:
+                self.journal.reset()
+            targets = [entry for entry in entries if entry[1] not in resumed_posts]
+            
+            # 5. 증분 모드: 변경된 게시글만 선별
+            previous_posts: Dict[str, BlogPost] = {}
+            self.incremental = incremental
+            if incremental:
+                previous_posts = self.load_previous_posts(previous_output)
+                targets = [entry for entry in targets if self.needs_refresh(entry[1], entry[2], entry[3], previous_posts)]
+                logger.info(f"🔍 변경 감지: 새 게시글 {self.incremental_stats['new']}개, "
+                            f"변경 {self.incremental_stats['changed']}개, 변경 없음 {self.incremental_stats['unchanged']}개")
+            
+            # 6. 각 게시글 상세 내용 수집
+            logger.info(f"📚 총 {len(targets)}개 게시글 상세 내용 수집 시작...")
+            
+            # ToolHive Playwright MCP 사용 시도, 실패시 시뮬레이션 데이터 사용
+            fetched = self.extract_posts_parallel(targets)
+            
+            # 7. 새로 수집한 게시글과 이어받은 / 이전 결과를 목록 순서대로 병합
+            for _, post_url, _, _ in entries:
+                post_data = fetched.get(post_url) or resumed_posts.get(post_url) or previous_posts.get(post_url)
                 if post_data:
                     all_posts.append(post_data)
-                    
-                    # 카테고리별 통계 업데이트
-                    category = post_data.category
-                    self.categories[category] = self.categories.get(category, 0) + 1
-                
-                # 과도한 요청 방지
-                if i % 10 == 0:
-                    time.sleep(1)
+                    if self.exporter and post_url not in fetched:
+                        self.exporter.write(post_data)
+                    if self.sink and post_url not in fetched and post_url not in resumed_posts:
+                        # 재사용한 게시글도 스트림에 남겨 다음 증분 실행의 이전 결과로 쓸 수 있게 함
+                        offset = self.sink.write(post_data)
+                        if self.journal:
+                            self.journal.done(post_url, offset)
+            
+            self.categories = {}
+            for post_data in all_posts:
+                self.categories[post_data.category] = self.categories.get(post_data.category, 0) + 1
             
-            logger.info(f"🎉 모든 게시글 수집 완료! 총 {len(all_posts)}개 게시글")
+            self.incremental_stats["removed"] = self.state_store.prune(url for _, url, _, _ in entries)
+            self.state_store.save()
+            
+            logger.info(f"🎉 모든 게시글 수집 완료! 총 {len(all_posts)}개 게시글 "
+                        f"(새로 수집 {len(fetched)}개, 이어받음 {len(resumed_posts)}개)")
             
         except Exception as e:
             logger.error(f"❌ 전체 스크래핑 중 오류: {e}")
@@ -602,6 +723,25 @@ class TistoryBlogMCPScraper:
         
         return all_posts
 
+    def resume_completed_posts(self, entries: List[Tuple[int, str, str, str]]) -> Dict[str, BlogPost]:
+        """저널에서 완료로 기록되고 결과 스트림에 남아 있는 게시글을 URL → BlogPost로 반환합니다."""
+        if not self.journal or not self.sink:
+            logger.warning("⚠️ 이어서 수집하려면 저널과 결과 스트림(--stream)이 필요합니다. 전체 수집합니다.")
+            return {}
+        done_urls = self.journal.completed(written=self.sink.count)
+        streamed = self.load_previous_posts(self.sink.path)
+        resumed = {}
+        for _, post_url, post_title, post_category in entries:
+            post_data = streamed.get(post_url)
+            if post_url in done_urls and post_data:
+                resumed[post_url] = post_data
+                # 상태 중간 저장 전에 중단됐던 게시글은 헤더 확인 없이 해시만 기록
+                if not self.state_store.get(post_url):
+                    self.record_post_state(post_data, post_title, post_category, (None, None))
+        logger.info(f"⏯️ 이어서 수집: 완료된 게시글 {len(resumed)}개 건너뜀, "
+                    f"{len(entries) - len(resumed)}개 남음 (저널 상태: {self.journal.summary()})")
+        return resumed
+
     def close_browser(self):
         """브라우저를 종료합니다."""
         logger.info("🔄 브라우저 종료 중...")
@@ -610,41 +750,35 @@ class TistoryBlogMCPScraper:
             result = self.send_mcp_request("tools/call", {
                 "name": "browser_close",
                 "arguments": {"random_string": "close"}
-            }, rpc_id=99)
+            })
             
             logger.info("✅ 브라우저 종료 완료")
             
         except Exception as e:
             logger.warning(f"⚠️ 브라우저 종료 중 오류: {e}")
+        finally:
+            for client in self.worker_clients:
+                try:
+                    client.call_tool("browser_close", {"random_string": "close"})
+                except Exception as e:
+                    logger.debug(f"워커 브라우저 종료 중 오류: {e}")
+                client.close()
+            self.worker_clients = []
+            self.client.close()
 
-    def save_results(self, posts: List[BlogPost], filename: str = "tistory_blog_posts.json"):
-        """결과를 JSON 파일로 저장합니다."""
+    def save_results(self, posts: List[BlogPost], filename: str = OUTPUT_FILE):
+        """결과를 JSON 파일로 저장합니다 (게시글을 하나씩 직렬화해 한 번에 큰 문자열을 만들지 않음)."""
         try:
-            data = {
+            header = {
                 "collection_date": time.strftime("%Y-%m-%d %H:%M:%S"),
                 "blog_url": TARGET_BLOG_URL,
                 "blog_name": "gongeerie 블로그",
                 "total_posts": len(posts),
                 "expected_posts": self.total_posts_expected,
                 "categories": self.categories,
-                "method": "ToolHive Playwright MCP",
-                "posts": [
-                    {
-                        "title": post.title,
-                        "url": post.url,
-                        "category": post.category,
-                        "date": post.date,
-                        "content": post.content,
-                        "summary": post.summary,
-                        "thumbnail": post.thumbnail,
-                        "tags": post.tags
-                    }
-                    for post in posts
-                ]
+                "method": "ToolHive Playwright MCP"
             }
-            
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            write_summary(filename, (post.to_dict() for post in posts), header, items_key="posts")
             
             logger.info(f"📁 결과가 {filename}에 저장되었습니다.")
             
@@ -658,11 +792,44 @@ def main():
     print("📋 대상: gongeerie 블로그 (https://metashower.tistory.com/)")
     print("=" * 70)
     
-    scraper = TistoryBlogMCPScraper()
+    parser = argparse.ArgumentParser(description="ToolHive Playwright MCP 티스토리 블로그 스크래퍼")
+    parser.add_argument("--incremental", action="store_true",
+                        help="이전 결과와 수집 상태를 비교해 새 게시글/변경된 게시글만 다시 수집")
+    parser.add_argument("--output", default=OUTPUT_FILE, help="결과 JSON 파일 경로")
+    parser.add_argument("--previous", default=None,
+                        help="--incremental에서 비교할 이전 결과 (요약 JSON 또는 NDJSON 스트림, 기본: --output)")
+    parser.add_argument("--state-file", default=STATE_FILE, help="게시글별 수집 상태 파일 경로")
+    parser.add_argument("--workers", type=int, default=4, help="상세 수집에 사용할 MCP 브라우저 세션 수")
+    parser.add_argument("--per-host-interval", type=float, default=0.5, help="같은 호스트 요청 사이 최소 간격(초)")
+    parser.add_argument("--stream", default=None,
+                        help="수집한 게시글을 즉시 한 줄씩 기록할 NDJSON 경로 (.jsonl / .jsonl.gz / .jsonl.zst)")
+    parser.add_argument("--journal", default=JOURNAL_FILE, help="URL별 진행 상태 체크포인트 파일 경로")
+    parser.add_argument("--resume", action="store_true",
+                        help="이전 실행의 저널/스트림을 이어받아 완료되지 않은 게시글만 수집 (--stream 필요)")
+    parser.add_argument("--parquet", default=None,
+                        help="게시글을 타입이 지정된 컬럼으로 저장할 경로 (.parquet / .arrow, pyarrow 필요)")
+    args = parser.parse_args()
+    if args.resume and not args.stream:
+        parser.error("--resume에는 --stream 경로가 필요합니다.")
+    if is_stream_path(args.output):
+        parser.error("--output은 요약 JSON 경로입니다. NDJSON 스트림은 --stream으로 지정하세요.")
+    previous_output = args.previous or args.output
+    if (args.stream and not args.resume
+            and os.path.abspath(previous_output) == os.path.abspath(args.stream)):
+        # 이어쓰기가 아니면 스트림은 시작할 때 비워지므로 이전 결과로 읽을 수 없음
+        parser.error("--previous로 같은 --stream 파일을 쓰려면 이전 스트림을 다른 경로로 옮기거나 --resume을 사용하세요.")
+    
+    sink = ResultSink(args.stream, resume=args.resume) if args.stream else None
+    # 저널은 결과 스트림의 위치를 기록하므로 --stream을 쓸 때만 만듦
+    journal = CrawlJournal(args.journal, job="tistory") if args.stream else None
+    scraper = TistoryBlogMCPScraper(state_file=args.state_file, workers=args.workers,
+                                    per_host_interval=args.per_host_interval, sink=sink, journal=journal,
+                                    exporter=ColumnarWriter(args.parquet, "post") if args.parquet else None)
     
     try:
         # 모든 게시글 스크래핑
-        posts = scraper.scrape_all_posts()
+        posts = scraper.scrape_all_posts(incremental=args.incremental, previous_output=previous_output,
+                                         resume=args.resume)
         
         if not posts:
             logger.warning("⚠️ 수집된 게시글이 없습니다.")
@@ -674,7 +841,10 @@ def main():
             return
         
         # 결과 저장
-        scraper.save_results(posts)
+        scraper.save_results(posts, args.output)
+        # 게시글을 공유 저장소에 누적 (본문이 바뀐 게시글만 갱신, 시뮬레이션 데이터는 제외)
+        save_to_store("posts", (post for post in posts if post.url not in scraper.simulated_urls),
+                      source="tistory_blog_mcp_scraper")
         
         # 콘솔에 결과 출력
         print("\n" + "="*70)
@@ -682,8 +852,12 @@ def main():
         print("="*70)
         print(f"📝 수집된 게시글 수: {len(posts)}개")
         print(f"📊 예상 게시글 수: {scraper.total_posts_expected}개")
-        print(f"📁 결과 파일: tistory_blog_posts.json")
+        print(f"📁 결과 파일: {args.output}")
         print(f"🔧 방법: ToolHive Playwright MCP")
+        if args.incremental:
+            stats = scraper.incremental_stats
+            print(f"🔁 증분 수집: 새 게시글 {stats['new']}개, 변경 {stats['changed']}개, "
+                  f"재사용 {stats['unchanged']}개, 삭제 {stats['removed']}개")
         print(f"🌐 대상 블로그: {TARGET_BLOG_URL}")
         print("="*70)
         
@@ -714,6 +888,13 @@ def main():
     except Exception as e:
         logger.error(f"❌ 실행 중 오류 발생: {e}")
         raise
+    finally:
+        if sink:
+            sink.close()
+        if journal:
+            journal.close()
+        if scraper.exporter:
+            scraper.exporter.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
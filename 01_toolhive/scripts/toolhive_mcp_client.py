@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+ToolHive MCP 공용 비동기 클라이언트
+
+ToolHive가 띄운 MCP 서버(Playwright, fetch 등)에 SSE 세션을 열고
+JSON-RPC 요청을 보내는 공용 모듈입니다. 스크립트마다 복사되어 있던
+get_session_id / send_mcp_request 쌍을 대체합니다.
+
+주요 기능:
+1. 서버당 하나의 지속 SSE 연결 (endpoint 이벤트로 세션 URL 획득)
+2. keep-alive HTTP 커넥션 풀 (aiohttp TCPConnector)
+3. 요청 ID 멀티플렉싱: 세션별로 단조 증가하는 ID를 자동 할당하고, 상관 테이블로
+   POST 본문/SSE 스트림 어느 쪽으로 온 응답이든 원래 요청에 매칭 (순서 무관)
+4. streamable-http 전송 지원 (SSE 세션 없이 /mcp로 POST, Mcp-Session-Id 헤더 사용)
+5. 동기 스크립트용 SyncMCPClient 래퍼 (백그라운드 이벤트 루프 스레드)
+
+사용 예:
+    async with ToolHiveMCPClient("http://127.0.0.1:44251") as client:
+        await client.initialize()
+        results = await asyncio.gather(
+            client.call_tool("browser_navigate", {"url": url1}),
+            client.call_tool("browser_snapshot"),
+        )
+"""
+
+import asyncio
+import concurrent.futures
+import itertools
+import json
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from urllib.parse import urljoin
+
+import aiohttp
+
+from sse_decoder import aiter_sse_events
+
+logger = logging.getLogger(__name__)
+
+SESSION_ID_PATTERN = re.compile(r"sessionId=([a-f0-9\-]+)")
+
+JSONRPC_HEADERS = {
+    "Accept": "application/json, text/event-stream",
+    "Content-Type": "application/json"
+}
+
+
+@dataclass
+class PendingRequest:
+    """응답을 기다리는 요청 (상관 테이블 항목)"""
+    method: str
+    future: asyncio.Future
+    sent_at: float
+
+
+class ToolHiveMCPClient:
+    """ToolHive MCP 서버용 비동기 클라이언트
+
+    transport="sse"는 SSE 세션을 열어 endpoint 이벤트로 메시지 URL을 받고,
+    transport="streamable-http"는 message_path로 바로 POST하며 initialize 응답의
+    Mcp-Session-Id 헤더를 이후 요청에 붙입니다.
+    """
+
+    def __init__(self, base_url: str, sse_path: str = "/sse", message_path: str = "/messages",
+                 client_name: str = "toolhive-python-client", client_version: str = "1.0.0",
+                 max_connections: int = 20, timeout: float = 60, transport: str = "sse"):
+        if transport not in ("sse", "streamable-http"):
+            raise ValueError(f"지원되지 않는 전송 방식: {transport}")
+        self.base_url = base_url.rstrip("/")
+        self.transport = transport
+        self.sse_path = sse_path
+        self.message_path = message_path
+        self.client_name = client_name
+        self.client_version = client_version
+        self.max_connections = max_connections
+        self.timeout = timeout
+
+        self.session_id: Optional[str] = None
+        self.message_url: Optional[str] = None
+        self.server_info: Dict[str, Any] = {}
+
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._sse_response: Optional[aiohttp.ClientResponse] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._endpoint_ready: Optional[asyncio.Future] = None
+        # 동시에 들어온 첫 요청들이 각자 세션을 열지 않도록 connect를 직렬화
+        self._connect_lock = asyncio.Lock()
+        # 요청 ID → 대기 중인 요청. ID는 클라이언트 수명 동안 재사용하지 않음
+        self._pending: Dict[int, PendingRequest] = {}
+        self._ids = itertools.count(1)
+        self.unmatched_responses = 0
+
+    async def __aenter__(self) -> "ToolHiveMCPClient":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    # -------------------------------------------------------------------------
+    # 연결 관리
+    # -------------------------------------------------------------------------
+
+    @property
+    def connected(self) -> bool:
+        return self._http is not None and self.message_url is not None
+
+    async def connect(self) -> Optional[str]:
+        """연결을 열고 세션 ID를 반환합니다 (streamable-http는 initialize 전까지 None)."""
+        if self.connected:
+            return self.session_id
+        async with self._connect_lock:
+            if self.connected:
+                return self.session_id
+            try:
+                return await self._connect()
+            except BaseException:
+                # 실패한 연결 시도의 HTTP 세션/SSE 응답을 남기지 않음
+                await self.close()
+                raise
+
+    async def _connect(self) -> Optional[str]:
+        if self._http:
+            # 이전 연결 시도가 중간에 실패한 경우 정리 후 다시 연결
+            await self.close()
+
+        connector = aiohttp.TCPConnector(limit=self.max_connections, keepalive_timeout=60)
+        self._http = aiohttp.ClientSession(connector=connector)
+
+        if self.transport == "streamable-http":
+            self.message_url = f"{self.base_url}{self.message_path}"
+            return self.session_id
+
+        self._endpoint_ready = asyncio.get_running_loop().create_future()
+
+        self._sse_response = await self._http.get(
+            f"{self.base_url}{self.sse_path}",
+            headers={"Accept": "text/event-stream"},
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=30)
+        )
+        self._sse_response.raise_for_status()
+        self._reader = asyncio.create_task(self._read_sse())
+
+        await asyncio.wait_for(asyncio.shield(self._endpoint_ready), timeout=30)
+        logger.info(f"✅ MCP 세션 연결: {self.session_id}")
+        return self.session_id
+
+    async def close(self):
+        """SSE 연결과 HTTP 커넥션 풀을 닫고 대기 중인 요청을 취소합니다."""
+        if self._reader:
+            self._reader.cancel()
+            self._reader = None
+        if self._sse_response:
+            self._sse_response.close()
+            self._sse_response = None
+        if self._http:
+            await self._http.close()
+            self._http = None
+        for pending in self._pending.values():
+            if not pending.future.done():
+                pending.future.cancel()
+        self._pending.clear()
+        self.session_id = None
+        self.message_url = None
+
+    async def _read_sse(self):
+        """지속 SSE 연결에서 endpoint 이벤트와 JSON-RPC 응답을 읽습니다."""
+        try:
+            async for event in aiter_sse_events(self._sse_response.content.iter_any()):
+                if event.event == "endpoint":
+                    self._set_endpoint(event.data)
+                else:
+                    self._dispatch(event.data)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ SSE 연결 오류: {e}")
+            self._fail_pending(e)
+        else:
+            self._fail_pending(ConnectionError("SSE 연결이 종료되었습니다."))
+
+    def _set_endpoint(self, data: str):
+        match = SESSION_ID_PATTERN.search(data)
+        if not match:
+            return
+        self.session_id = match.group(1)
+        # endpoint 경로가 메시지 엔드포인트가 아니면(/sse?sessionId=...) 기본 메시지 경로 사용
+        if data.startswith("/") and not data.startswith(self.sse_path + "?"):
+            self.message_url = urljoin(self.base_url + "/", data)
+        else:
+            self.message_url = f"{self.base_url}{self.message_path}?sessionId={self.session_id}"
+        if self._endpoint_ready and not self._endpoint_ready.done():
+            self._endpoint_ready.set_result(self.session_id)
+
+    def _dispatch(self, data: str):
+        """JSON-RPC 응답을 상관 테이블에서 같은 ID의 요청에 전달합니다."""
+        try:
+            message = json.loads(data)
+        except json.JSONDecodeError:
+            logger.debug(f"JSON이 아닌 SSE 데이터 무시: {data[:100]}")
+            return
+        for item in message if isinstance(message, list) else [message]:
+            # 서버가 보내는 알림/요청(method 포함)은 응답이 아님
+            if not isinstance(item, dict) or not ("result" in item or "error" in item):
+                continue
+            pending = self._pending.get(item.get("id"))
+            if pending is None:
+                # 시간 초과로 이미 포기한 요청의 늦은 응답 등
+                self.unmatched_responses += 1
+                logger.debug(f"대기 중인 요청이 없는 응답 무시: id={item.get('id')}")
+                continue
+            if not pending.future.done():
+                pending.future.set_result(item)
+
+    def _fail_pending(self, error: Exception):
+        if self._endpoint_ready and not self._endpoint_ready.done():
+            self._endpoint_ready.set_exception(error)
+        for pending in self._pending.values():
+            if not pending.future.done():
+                pending.future.set_exception(error)
+
+    # -------------------------------------------------------------------------
+    # JSON-RPC 요청
+    # -------------------------------------------------------------------------
+
+    async def _post(self, payload: Dict[str, Any]):
+        """메시지 엔드포인트로 POST하고, 본문에 담긴 응답이 있으면 바로 전달합니다."""
+        headers = JSONRPC_HEADERS
+        if self.transport == "streamable-http" and self.session_id:
+            headers = {**JSONRPC_HEADERS, "Mcp-Session-Id": self.session_id}
+        async with self._http.post(self.message_url, json=payload, headers=headers,
+                                   timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:
+            response.raise_for_status()
+            if self.transport == "streamable-http" and "mcp-session-id" in response.headers:
+                self.session_id = response.headers["mcp-session-id"]
+            content_type = response.headers.get("content-type", "")
+            if content_type.startswith("text/event-stream"):
+                async for event in aiter_sse_events(response.content.iter_any()):
+                    self._dispatch(event.data)
+            else:
+                body = await response.text()
+                if body.strip():
+                    self._dispatch(body)
+
+    @property
+    def pending_requests(self) -> Dict[int, str]:
+        """응답을 기다리는 요청 ID → 메서드"""
+        return {request_id: pending.method for request_id, pending in self._pending.items()}
+
+    async def request(self, method: str, params: Optional[Dict[str, Any]] = None,
+                      timeout: Optional[float] = None) -> Dict[str, Any]:
+        """JSON-RPC 요청을 보내고 같은 ID의 응답 메시지를 반환합니다.
+
+        ID는 클라이언트가 단조 증가로 할당하고, 응답은 POST 본문 또는 SSE 스트림
+        어느 쪽으로 어떤 순서로 와도 ID로 매칭되므로 여러 요청을 동시에 보내도 섞이지 않습니다.
+        """
+        if not self.connected:
+            await self.connect()
+
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = PendingRequest(method, future, time.monotonic())
+
+        payload = {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}}
+        try:
+            await self._post(payload)
+            return await asyncio.wait_for(future, timeout or self.timeout)
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def notify(self, method: str, params: Optional[Dict[str, Any]] = None):
+        """응답이 없는 JSON-RPC 알림을 보냅니다."""
+        if not self.connected:
+            await self.connect()
+        await self._post({"jsonrpc": "2.0", "method": method, "params": params or {}})
+
+    async def initialize(self, protocol_version: str = "2024-11-05") -> Dict[str, Any]:
+        """MCP initialize 핸드셰이크를 수행합니다."""
+        result = await self.request("initialize", {
+            "protocolVersion": protocol_version,
+            "capabilities": {},
+            "clientInfo": {"name": self.client_name, "version": self.client_version}
+        })
+        if "result" in result:
+            self.server_info = result["result"].get("serverInfo", {})
+            await self.notify("notifications/initialized")
+        return result
+
+    async def list_tools(self) -> Dict[str, Any]:
+        return await self.request("tools/list")
+
+    async def call_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None,
+                        timeout: Optional[float] = None) -> Dict[str, Any]:
+        return await self.request("tools/call", {"name": name, "arguments": arguments or {}}, timeout=timeout)
+
+
+class SyncMCPClient:
+    """동기 스크립트용 래퍼: 백그라운드 이벤트 루프 스레드에서 ToolHiveMCPClient를 실행합니다.
+
+    request/call_tool은 결과를 기다리고, submit은 concurrent.futures.Future를
+    바로 반환하므로 여러 호출을 파이프라인으로 보낼 수 있습니다.
+    """
+
+    def __init__(self, base_url: str, **kwargs):
+        self.client = ToolHiveMCPClient(base_url, **kwargs)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="mcp-client", daemon=True)
+        self._thread.start()
+
+    def _run(self, coro) -> Any:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    @property
+    def session_id(self) -> Optional[str]:
+        return self.client.session_id
+
+    @property
+    def server_info(self) -> Dict[str, Any]:
+        return self.client.server_info
+
+    def connect(self) -> str:
+        return self._run(self.client.connect())
+
+    def initialize(self, **kwargs) -> Dict[str, Any]:
+        return self._run(self.client.initialize(**kwargs))
+
+    def submit(self, method: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> concurrent.futures.Future:
+        return asyncio.run_coroutine_threadsafe(self.client.request(method, params, **kwargs), self._loop)
+
+    def request(self, method: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+        return self.submit(method, params, **kwargs).result()
+
+    def list_tools(self) -> Dict[str, Any]:
+        return self._run(self.client.list_tools())
+
+    def call_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
+        return self._run(self.client.call_tool(name, arguments, **kwargs))
+
+    def close(self):
+        if self._loop.is_closed():
+            return
+        try:
+            self._run(self.client.close())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+            self._loop.close()
+
+    def __enter__(self) -> "SyncMCPClient":
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
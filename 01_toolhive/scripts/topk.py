@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+스트리밍 TOP-K 집계기
+
+페이지를 파싱할 때마다 결과를 바로 넣으면, 튜플 키로 중복을 제거하고
+크기 K의 최소 힙으로 상위 K개만 유지합니다. 전체 목록을 모았다가
+정렬하지 않으므로 메모리는 O(K + 고유 키 수)입니다.
+
+중복 키는 점수가 더 높은 항목으로 교체되고, 같은 점수끼리는 tie_break 값
+오름차순(예: 이름, 클래스 URL), 그래도 같으면 키를 처음 본 순서를 따릅니다.
+여러 페이지를 동시에 수집하면 도착 순서가 실행마다 다르므로 tie_break를 주어야
+순위가 매번 같게 나옵니다.
+"""
+
+import heapq
+import itertools
+from operator import attrgetter
+from typing import Any, Callable, Dict, Generic, Hashable, Iterable, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _Entry:
+    """힙 항목: 점수, tie_break(작을수록 앞), 처음 본 순서 순으로 비교, 교체되면 valid=False"""
+
+    __slots__ = ("score", "tie", "order", "key", "item", "valid")
+
+    def __init__(self, score: Any, tie: Any, order: int, key: Hashable, item: Any):
+        self.score = score
+        self.tie = tie
+        self.order = order
+        self.key = key
+        self.item = item
+        self.valid = True
+
+    def __lt__(self, other: "_Entry") -> bool:
+        if self.score != other.score:
+            return self.score < other.score
+        if self.tie != other.tie:
+            return self.tie > other.tie
+        return self.order > other.order   # 나중에 본 키가 먼저 밀려남
+
+
+class TopKAggregator(Generic[T]):
+    """튜플 키 중복 제거 + 크기 K 힙으로 상위 K개를 점진적으로 유지하는 집계기"""
+
+    def __init__(self, k: int = 50,
+                 key: Callable[[T], Hashable] = attrgetter("name", "class_title"),
+                 score: Callable[[T], Any] = attrgetter("students_count"),
+                 tie_break: Optional[Callable[[T], Any]] = None):
+        if k <= 0:
+            raise ValueError("k는 1 이상이어야 합니다.")
+        self.k = k
+        self.key = key
+        self.score = score
+        self.tie_break = tie_break
+        self.seen = 0
+        # 키 → (지금까지 최고 점수, tie_break 값, 처음 본 순서). 항목 자체는 힙 안의 K개만 보관
+        self._best: Dict[Hashable, Tuple[Any, Any, int]] = {}
+        self._heap: List[_Entry] = []
+        self._live: Dict[Hashable, _Entry] = {}
+        self._order = itertools.count()
+
+    def add(self, item: T) -> bool:
+        """항목 하나를 반영하고, 현재 상위 K개에 들어갔으면 True를 반환합니다."""
+        self.seen += 1
+        key = self.key(item)
+        score = self.score(item)
+        tie = self.tie_break(item) if self.tie_break else None
+
+        best = self._best.get(key)
+        if best is None:
+            order = next(self._order)
+        elif score > best[0] or (score == best[0] and tie is not None and tie < best[1]):
+            order = best[2]
+        else:
+            return False
+        self._best[key] = (score, tie, order)
+
+        entry = _Entry(score, tie, order, key, item)
+        if len(self._live) >= self.k and key not in self._live:
+            if not self._min() < entry:
+                return False
+            self._pop_min()
+
+        previous = self._live.pop(key, None)
+        if previous is not None:
+            previous.valid = False
+        heapq.heappush(self._heap, entry)
+        self._live[key] = entry
+        if len(self._heap) > 2 * self.k:
+            self._compact()
+        return True
+
+    def extend(self, items: Iterable[T]) -> int:
+        """여러 항목을 반영하고 상위 K개에 들어간 수를 반환합니다."""
+        return sum(1 for item in items if self.add(item))
+
+    def _min(self) -> _Entry:
+        while not self._heap[0].valid:
+            heapq.heappop(self._heap)
+        return self._heap[0]
+
+    def _pop_min(self):
+        entry = self._min()
+        heapq.heappop(self._heap)
+        del self._live[entry.key]
+
+    def _compact(self):
+        """교체되어 무효가 된 힙 항목을 정리합니다."""
+        self._heap = [entry for entry in self._heap if entry.valid]
+        heapq.heapify(self._heap)
+
+    @property
+    def unique(self) -> int:
+        return len(self._best)
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def top(self) -> List[T]:
+        """점수 내림차순(동점이면 tie_break 오름차순, 그다음 처음 본 순서) 상위 K개를 반환합니다."""
+        # _Entry는 "더 뒤 순위"일수록 작으므로 역순 정렬 (처음 본 순서가 모두 달라 순서가 하나로 정해짐)
+        entries = sorted(self._live.values(), reverse=True)
+        return [entry.item for entry in entries]
@@ -13,6 +13,7 @@ import asyncio
 import base64
 import io
 import json
+import os
 import sqlite3
 import tempfile
 from datetime import datetime
@@ -22,53 +23,90 @@ from typing import Any, Dict, List, Optional
 import httpx
 from fastmcp import FastMCP, Context
 
+from db_pool import SQLitePool
+
 
 # 고급 기능 서버 인스턴스 생성
 advanced_mcp = FastMCP("fastMCP 고급 기능 서버 🔬")
 
 
-# 임시 데이터베이스 초기화
-def init_db():
-    """임시 SQLite 데이터베이스 초기화"""
-    conn = sqlite3.connect(":memory:")
-    cursor = conn.cursor()
-    
-    # 사용자 테이블 생성
-    cursor.execute("""
-        CREATE TABLE users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            email TEXT UNIQUE NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-    
-    # 게시글 테이블 생성
-    cursor.execute("""
-        CREATE TABLE posts (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER,
-            title TEXT NOT NULL,
-            content TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (user_id) REFERENCES users (id)
-        )
-    """)
+# 데이터베이스 설정
+# ADVANCED_DB_PATH에 파일 경로를 주면 WAL 모드 파일 DB를 사용합니다 (기본: 메모리 DB)
+DB_PATH = os.getenv("ADVANCED_DB_PATH", ":memory:")
+DB_POOL_SIZE = int(os.getenv("ADVANCED_DB_POOL_SIZE", "4"))
+
+# 자주 쓰는 쿼리 (문자열이 같아야 커넥션별 prepared statement 캐시가 재사용됩니다)
+INSERT_USER_SQL = "INSERT INTO users (name, email) VALUES (?, ?)"
+SELECT_USERS_SQL = "SELECT id, name, email, created_at FROM users"
+INSERT_POST_SQL = "INSERT INTO posts (user_id, title, content) VALUES (?, ?, ?)"
+SELECT_POSTS_SQL = """
+    SELECT p.id, p.title, p.content, p.created_at, u.name
+    FROM posts p
+    JOIN users u ON p.user_id = u.id
+"""
+SELECT_POSTS_BY_USER_SQL = SELECT_POSTS_SQL + " WHERE p.user_id = ?"
+STATS_SQL = """
+    SELECT (SELECT COUNT(*) FROM users),
+           (SELECT COUNT(*) FROM posts),
+           (SELECT AVG(LENGTH(content)) FROM posts)
+"""
+
+
+def init_db(path: str = DB_PATH, pool_size: int = DB_POOL_SIZE) -> SQLitePool:
+    """SQLite 커넥션 풀을 만들고 테이블과 샘플 데이터를 준비합니다."""
+    pool = SQLitePool(path, size=pool_size)
     
-    # 샘플 데이터 삽입
-    cursor.execute("INSERT INTO users (name, email) VALUES (?, ?)", ("김철수", "kim@example.com"))
-    cursor.execute("INSERT INTO users (name, email) VALUES (?, ?)", ("이영희", "lee@example.com"))
-    cursor.execute("INSERT INTO posts (user_id, title, content) VALUES (?, ?, ?)", 
-                   (1, "첫 번째 게시글", "안녕하세요! 첫 게시글입니다."))
-    cursor.execute("INSERT INTO posts (user_id, title, content) VALUES (?, ?, ?)", 
-                   (2, "두 번째 게시글", "fastMCP가 정말 강력하네요!"))
+    with pool.connection(write=True) as conn:
+        # 사용자 테이블 생성
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS users (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                email TEXT UNIQUE NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # 게시글 테이블 생성
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS posts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER,
+                title TEXT NOT NULL,
+                content TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (user_id) REFERENCES users (id)
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_user ON posts (user_id)")
+        
+        # 샘플 데이터 삽입 (파일 DB를 다시 열 때는 중복 삽입하지 않음)
+        if conn.execute("SELECT COUNT(*) FROM users").fetchone()[0] == 0:
+            conn.executemany(INSERT_USER_SQL, [("김철수", "kim@example.com"), ("이영희", "lee@example.com")])
+            conn.executemany(INSERT_POST_SQL, [
+                (1, "첫 번째 게시글", "안녕하세요! 첫 게시글입니다."),
+                (2, "두 번째 게시글", "fastMCP가 정말 강력하네요!"),
+            ])
     
-    conn.commit()
-    return conn
+    return pool
+
+
+def _user_rows_to_list(users: List[tuple]) -> List[Dict[str, Any]]:
+    return [
+        {"id": user[0], "name": user[1], "email": user[2], "created_at": user[3]}
+        for user in users
+    ]
+
+
+def _post_rows_to_list(posts: List[tuple]) -> List[Dict[str, Any]]:
+    return [
+        {"id": post[0], "title": post[1], "content": post[2], "created_at": post[3], "author": post[4]}
+        for post in posts
+    ]
 
 
-# 전역 데이터베이스 연결
-db_conn = init_db()
+# 전역 데이터베이스 커넥션 풀
+db = init_db()
 
 
 # =============================================================================
@@ -147,11 +185,7 @@ async def list_files(ctx: Context) -> str:
 async def create_user(name: str, email: str, ctx: Context) -> str:
     """새 사용자를 생성합니다."""
     try:
-        cursor = db_conn.cursor()
-        cursor.execute("INSERT INTO users (name, email) VALUES (?, ?)", (name, email))
-        db_conn.commit()
-        
-        user_id = cursor.lastrowid
+        user_id, _ = await db.execute(INSERT_USER_SQL, (name, email))
         await ctx.info(f"사용자가 생성되었습니다: ID {user_id}")
         
         return f"사용자 '{name}' (ID: {user_id})이 성공적으로 생성되었습니다."
@@ -169,18 +203,7 @@ async def create_user(name: str, email: str, ctx: Context) -> str:
 async def get_users(ctx: Context) -> str:
     """모든 사용자를 조회합니다."""
     try:
-        cursor = db_conn.cursor()
-        cursor.execute("SELECT id, name, email, created_at FROM users")
-        users = cursor.fetchall()
-        
-        user_list = []
-        for user in users:
-            user_list.append({
-                "id": user[0],
-                "name": user[1],
-                "email": user[2],
-                "created_at": user[3]
-            })
+        user_list = _user_rows_to_list(await db.fetchall(SELECT_USERS_SQL))
         
         await ctx.info(f"{len(user_list)}명의 사용자를 조회했습니다.")
         return json.dumps(user_list, ensure_ascii=False, indent=2)
@@ -194,12 +217,7 @@ async def get_users(ctx: Context) -> str:
 async def create_post(user_id: int, title: str, content: str, ctx: Context) -> str:
     """새 게시글을 생성합니다."""
     try:
-        cursor = db_conn.cursor()
-        cursor.execute("INSERT INTO posts (user_id, title, content) VALUES (?, ?, ?)", 
-                       (user_id, title, content))
-        db_conn.commit()
-        
-        post_id = cursor.lastrowid
+        post_id, _ = await db.execute(INSERT_POST_SQL, (user_id, title, content))
         await ctx.info(f"게시글이 생성되었습니다: ID {post_id}")
         
         return f"게시글 '{title}' (ID: {post_id})이 성공적으로 생성되었습니다."
@@ -213,24 +231,7 @@ async def create_post(user_id: int, title: str, content: str, ctx: Context) -> s
 async def get_posts_by_user(user_id: int, ctx: Context) -> str:
     """특정 사용자의 게시글을 조회합니다."""
     try:
-        cursor = db_conn.cursor()
-        cursor.execute("""
-            SELECT p.id, p.title, p.content, p.created_at, u.name 
-            FROM posts p 
-            JOIN users u ON p.user_id = u.id 
-            WHERE p.user_id = ?
-        """, (user_id,))
-        posts = cursor.fetchall()
-        
-        post_list = []
-        for post in posts:
-            post_list.append({
-                "id": post[0],
-                "title": post[1],
-                "content": post[2],
-                "created_at": post[3],
-                "author": post[4]
-            })
+        post_list = _post_rows_to_list(await db.fetchall(SELECT_POSTS_BY_USER_SQL, (user_id,)))
         
         await ctx.info(f"사용자 {user_id}의 {len(post_list)}개 게시글을 조회했습니다.")
         return json.dumps(post_list, ensure_ascii=False, indent=2)
@@ -371,66 +372,28 @@ async def text_analysis(text: str, ctx: Context) -> str:
 # =============================================================================
 
 @advanced_mcp.resource("db://users")
-def get_all_users() -> str:
+async def get_all_users() -> str:
     """모든 사용자 데이터를 반환합니다."""
-    cursor = db_conn.cursor()
-    cursor.execute("SELECT id, name, email, created_at FROM users")
-    users = cursor.fetchall()
-    
-    user_list = []
-    for user in users:
-        user_list.append({
-            "id": user[0],
-            "name": user[1],
-            "email": user[2],
-            "created_at": user[3]
-        })
-    
+    user_list = _user_rows_to_list(await db.fetchall(SELECT_USERS_SQL))
     return json.dumps(user_list, ensure_ascii=False, indent=2)
 
 
 @advanced_mcp.resource("db://posts")
-def get_all_posts() -> str:
+async def get_all_posts() -> str:
     """모든 게시글 데이터를 반환합니다."""
-    cursor = db_conn.cursor()
-    cursor.execute("""
-        SELECT p.id, p.title, p.content, p.created_at, u.name 
-        FROM posts p 
-        JOIN users u ON p.user_id = u.id
-    """)
-    posts = cursor.fetchall()
-    
-    post_list = []
-    for post in posts:
-        post_list.append({
-            "id": post[0],
-            "title": post[1],
-            "content": post[2],
-            "created_at": post[3],
-            "author": post[4]
-        })
-    
+    post_list = _post_rows_to_list(await db.fetchall(SELECT_POSTS_SQL))
     return json.dumps(post_list, ensure_ascii=False, indent=2)
 
 
 @advanced_mcp.resource("stats://summary")
-def get_database_stats() -> str:
+async def get_database_stats() -> str:
     """데이터베이스 통계를 반환합니다."""
-    cursor = db_conn.cursor()
-    
-    cursor.execute("SELECT COUNT(*) FROM users")
-    user_count = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT COUNT(*) FROM posts")
-    post_count = cursor.fetchone()[0]
-    
-    cursor.execute("SELECT AVG(LENGTH(content)) FROM posts")
-    avg_post_length = cursor.fetchone()[0] or 0
+    user_count, post_count, avg_post_length = await db.fetchone(STATS_SQL)
     
     stats = {
         "total_users": user_count,
         "total_posts": post_count,
-        "average_post_length": round(avg_post_length, 2),
+        "average_post_length": round(avg_post_length or 0, 2),
         "last_updated": datetime.now().isoformat()
     }
     
@@ -467,6 +430,7 @@ if __name__ == "__main__":
     print("- db://posts: 모든 게시글")
     print("- stats://summary: 데이터베이스 통계")
     
+    print(f"\n🗄️ 데이터베이스: {DB_PATH} (커넥션 풀 {DB_POOL_SIZE}개)")
     print("\n서버가 실행됩니다...")
     
     # STDIO 모드로 실행
@@ -19,6 +19,8 @@ from typing import Dict, List, Optional
 from fastmcp import FastMCP, Context
 from playwright.async_api import async_playwright, Browser, Page, BrowserContext
 
+from resource_blocking import BLOCKING_PROFILES, ResourceBlocker
+
 
 # 블로그 분석 MCP 서버 인스턴스 생성
 blog_analyzer_mcp = FastMCP("블로그 분석 MCP 서버 📊")
@@ -28,6 +30,50 @@ browser: Optional[Browser] = None
 context: Optional[BrowserContext] = None
 current_page: Optional[Page] = None
 playwright_instance = None
+resource_blocker = ResourceBlocker()
+
+# SEO 분석 대상 메타 태그 (키, 셀렉터)
+SEO_META_TAGS = [
+    ('description', 'meta[name="description"]'),
+    ('keywords', 'meta[name="keywords"]'),
+    ('author', 'meta[name="author"]'),
+    ('robots', 'meta[name="robots"]'),
+    ('viewport', 'meta[name="viewport"]'),
+    ('og:title', 'meta[property="og:title"]'),
+    ('og:description', 'meta[property="og:description"]'),
+    ('og:url', 'meta[property="og:url"]'),
+    ('og:image', 'meta[property="og:image"]'),
+    ('twitter:card', 'meta[name="twitter:card"]'),
+    ('twitter:title', 'meta[name="twitter:title"]')
+]
+
+# 메타 태그, 헤딩 개수, 이미지 alt 현황을 한 번의 evaluate 호출로 수집하는 스크립트
+SEO_SNAPSHOT_SCRIPT = """
+(metaTags) => {
+    const meta = {};
+    for (const [key, selector] of metaTags) {
+        const el = document.querySelector(selector);
+        meta[key] = el ? el.getAttribute('content') : null;
+    }
+    const headings = [1, 2, 3, 4, 5, 6].map(i => document.getElementsByTagName('h' + i).length);
+    const images = document.images;
+    let withAlt = 0;
+    for (const img of images) {
+        const alt = img.getAttribute('alt');
+        if (alt && alt.trim()) withAlt++;
+    }
+    return {
+        title: document.title || '',
+        meta,
+        headings,
+        total_images: images.length,
+        images_with_alt: withAlt
+    };
+}
+"""
+
+# 일괄 분석 시 동시에 열 수 있는 최대 페이지 수
+MAX_BATCH_CONCURRENCY = 10
 
 
 # =============================================================================
@@ -35,14 +81,15 @@ playwright_instance = None
 # =============================================================================
 
 @blog_analyzer_mcp.tool
-async def start_browser(headless: bool = True, ctx: Context = None) -> str:
-    """브라우저를 시작합니다."""
-    global browser, context, current_page, playwright_instance
+async def start_browser(headless: bool = True, block_profile: str = "none", ctx: Context = None) -> str:
+    """브라우저를 시작합니다. block_profile로 리소스 차단 프로필(none, light, text)을 지정합니다."""
+    global browser, context, current_page, playwright_instance, resource_blocker
     
     try:
         if ctx:
-            await ctx.info("블로그 분석용 브라우저 시작 중...")
+            await ctx.info(f"블로그 분석용 브라우저 시작 중... (차단 프로필: {block_profile})")
         
+        resource_blocker = ResourceBlocker(block_profile)
         playwright_instance = await async_playwright().start()
         browser = await playwright_instance.chromium.launch(headless=headless)
         
@@ -50,6 +97,7 @@ async def start_browser(headless: bool = True, ctx: Context = None) -> str:
             viewport={"width": 1400, "height": 900},
             user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
         )
+        await resource_blocker.attach(context)
         current_page = await context.new_page()
         
         if ctx:
@@ -92,7 +140,7 @@ async def close_browser(ctx: Context = None) -> str:
 # =============================================================================
 
 @blog_analyzer_mcp.tool
-async def analyze_blog_homepage(blog_url: str, ctx: Context = None) -> str:
+async def analyze_blog_homepage(blog_url: str, block_profile: Optional[str] = None, ctx: Context = None) -> str:
     """블로그 홈페이지를 분석합니다."""
     if not current_page:
         return "브라우저가 시작되지 않았습니다. 먼저 start_browser를 호출하세요."
@@ -102,59 +150,60 @@ async def analyze_blog_homepage(blog_url: str, ctx: Context = None) -> str:
             await ctx.info(f"블로그 홈페이지 분석 중: {blog_url}")
         
         # 페이지로 이동
-        await current_page.goto(blog_url, wait_until="domcontentloaded", timeout=30000)
-        
-        # 기본 정보 수집
-        title = await current_page.title()
+        async with resource_blocker.override(current_page, block_profile):
+            await current_page.goto(blog_url, wait_until="domcontentloaded", timeout=30000)
         
-        # 메타 태그 정보 수집
-        meta_description = await current_page.get_attribute('meta[name="description"]', 'content') or "없음"
-        meta_keywords = await current_page.get_attribute('meta[name="keywords"]', 'content') or "없음"
+            # 기본 정보 수집
+            title = await current_page.title()
         
-        # 블로그 제목 추출 (다양한 셀렉터 시도)
-        blog_title_selectors = [
-            '.blog-title', '.site-title', 'h1', '.header-title', '.blog-name'
-        ]
-        blog_title = "찾을 수 없음"
-        for selector in blog_title_selectors:
-            try:
-                element = await current_page.query_selector(selector)
-                if element:
-                    text = await element.text_content()
-                    if text and text.strip():
-                        blog_title = text.strip()
+            # 메타 태그 정보 수집
+            meta_description = await current_page.get_attribute('meta[name="description"]', 'content') or "없음"
+            meta_keywords = await current_page.get_attribute('meta[name="keywords"]', 'content') or "없음"
+        
+            # 블로그 제목 추출 (다양한 셀렉터 시도)
+            blog_title_selectors = [
+                '.blog-title', '.site-title', 'h1', '.header-title', '.blog-name'
+            ]
+            blog_title = "찾을 수 없음"
+            for selector in blog_title_selectors:
+                try:
+                    element = await current_page.query_selector(selector)
+                    if element:
+                        text = await element.text_content()
+                        if text and text.strip():
+                            blog_title = text.strip()
+                            break
+                except:
+                    continue
+        
+            # 최근 포스트 개수 확인
+            post_selectors = [
+                '.list-item', '.post-item', '.entry', '.article-item', 'article'
+            ]
+            post_count = 0
+            for selector in post_selectors:
+                try:
+                    elements = await current_page.query_selector_all(selector)
+                    if elements:
+                        post_count = len(elements)
                         break
-            except:
-                continue
-        
-        # 최근 포스트 개수 확인
-        post_selectors = [
-            '.list-item', '.post-item', '.entry', '.article-item', 'article'
-        ]
-        post_count = 0
-        for selector in post_selectors:
-            try:
-                elements = await current_page.query_selector_all(selector)
-                if elements:
-                    post_count = len(elements)
-                    break
-            except:
-                continue
-        
-        analysis_result = {
-            "url": blog_url,
-            "page_title": title,
-            "blog_title": blog_title,
-            "meta_description": meta_description,
-            "meta_keywords": meta_keywords,
-            "visible_posts_count": post_count,
-            "analysis_timestamp": datetime.now().isoformat()
-        }
-        
-        if ctx:
-            await ctx.info(f"블로그 분석 완료: {blog_title}")
-        
-        return json.dumps(analysis_result, ensure_ascii=False, indent=2)
+                except:
+                    continue
+        
+            analysis_result = {
+                "url": blog_url,
+                "page_title": title,
+                "blog_title": blog_title,
+                "meta_description": meta_description,
+                "meta_keywords": meta_keywords,
+                "visible_posts_count": post_count,
+                "analysis_timestamp": datetime.now().isoformat()
+            }
+        
+            if ctx:
+                await ctx.info(f"블로그 분석 완료: {blog_title}")
+        
+            return json.dumps(analysis_result, ensure_ascii=False, indent=2)
     
     except Exception as e:
         if ctx:
@@ -163,7 +212,8 @@ async def analyze_blog_homepage(blog_url: str, ctx: Context = None) -> str:
 
 
 @blog_analyzer_mcp.tool
-async def extract_blog_posts(blog_url: str, limit: int = 10, ctx: Context = None) -> str:
+async def extract_blog_posts(blog_url: str, limit: int = 10, block_profile: Optional[str] = None,
+                             ctx: Context = None) -> str:
     """블로그 포스트 목록을 추출합니다."""
     if not current_page:
         return "브라우저가 시작되지 않았습니다."
@@ -173,59 +223,60 @@ async def extract_blog_posts(blog_url: str, limit: int = 10, ctx: Context = None
             await ctx.info(f"블로그 포스트 추출 중 (최대 {limit}개)")
         
         # 페이지로 이동
-        await current_page.goto(blog_url, wait_until="domcontentloaded", timeout=30000)
-        
-        # 다양한 포스트 링크 셀렉터 시도
-        post_link_selectors = [
-            '.list-item .list-title a',
-            '.post-item a',
-            '.entry-title a',
-            'h2 a',
-            'h3 a',
-            '.article-title a',
-            '.post-title a'
-        ]
-        
-        posts = []
-        for selector in post_link_selectors:
-            try:
-                elements = await current_page.query_selector_all(selector)
-                if elements:
-                    for i, element in enumerate(elements[:limit]):
-                        title = await element.text_content()
-                        href = await element.get_attribute('href')
+        async with resource_blocker.override(current_page, block_profile):
+            await current_page.goto(blog_url, wait_until="domcontentloaded", timeout=30000)
+        
+            # 다양한 포스트 링크 셀렉터 시도
+            post_link_selectors = [
+                '.list-item .list-title a',
+                '.post-item a',
+                '.entry-title a',
+                'h2 a',
+                'h3 a',
+                '.article-title a',
+                '.post-title a'
+            ]
+        
+            posts = []
+            for selector in post_link_selectors:
+                try:
+                    elements = await current_page.query_selector_all(selector)
+                    if elements:
+                        for i, element in enumerate(elements[:limit]):
+                            title = await element.text_content()
+                            href = await element.get_attribute('href')
                         
-                        if title and title.strip():
-                            # 상대 URL을 절대 URL로 변환
-                            if href and href.startswith('/'):
-                                base_url = blog_url.rstrip('/')
-                                href = base_url + href
+                            if title and title.strip():
+                                # 상대 URL을 절대 URL로 변환
+                                if href and href.startswith('/'):
+                                    base_url = blog_url.rstrip('/')
+                                    href = base_url + href
                             
-                            posts.append({
-                                "index": i + 1,
-                                "title": title.strip(),
-                                "url": href,
-                                "selector_used": selector
-                            })
+                                posts.append({
+                                    "index": i + 1,
+                                    "title": title.strip(),
+                                    "url": href,
+                                    "selector_used": selector
+                                })
                     
-                    if posts:  # 포스트를 찾았으면 중단
-                        break
-            except Exception as e:
-                if ctx:
-                    await ctx.error(f"셀렉터 {selector} 실패: {str(e)}")
-                continue
-        
-        result = {
-            "blog_url": blog_url,
-            "posts_found": len(posts),
-            "posts": posts[:limit],
-            "extraction_timestamp": datetime.now().isoformat()
-        }
-        
-        if ctx:
-            await ctx.info(f"{len(posts)}개의 포스트를 찾았습니다!")
-        
-        return json.dumps(result, ensure_ascii=False, indent=2)
+                        if posts:  # 포스트를 찾았으면 중단
+                            break
+                except Exception as e:
+                    if ctx:
+                        await ctx.error(f"셀렉터 {selector} 실패: {str(e)}")
+                    continue
+        
+            result = {
+                "blog_url": blog_url,
+                "posts_found": len(posts),
+                "posts": posts[:limit],
+                "extraction_timestamp": datetime.now().isoformat()
+            }
+        
+            if ctx:
+                await ctx.info(f"{len(posts)}개의 포스트를 찾았습니다!")
+        
+            return json.dumps(result, ensure_ascii=False, indent=2)
     
     except Exception as e:
         if ctx:
@@ -233,24 +284,17 @@ async def extract_blog_posts(blog_url: str, limit: int = 10, ctx: Context = None
         return f"포스트 추출 실패: {str(e)}"
 
 
-@blog_analyzer_mcp.tool
-async def analyze_single_post(post_url: str, ctx: Context = None) -> str:
-    """개별 블로그 포스트를 분석합니다."""
-    if not current_page:
-        return "브라우저가 시작되지 않았습니다."
+async def _analyze_post_page(page: Page, post_url: str, block_profile: Optional[str] = None) -> Dict:
+    """주어진 페이지로 포스트를 열고 분석 결과를 반환합니다."""
+    async with resource_blocker.override(page, block_profile):
+        await page.goto(post_url, wait_until="domcontentloaded", timeout=30000)
     
-    try:
-        if ctx:
-            await ctx.info(f"포스트 분석 중: {post_url}")
-        
-        await current_page.goto(post_url, wait_until="domcontentloaded", timeout=30000)
-        
         # 포스트 제목
         title_selectors = ['h1', '.post-title', '.entry-title', '.article-title']
         post_title = "제목을 찾을 수 없음"
         for selector in title_selectors:
             try:
-                element = await current_page.query_selector(selector)
+                element = await page.query_selector(selector)
                 if element:
                     text = await element.text_content()
                     if text and text.strip():
@@ -258,14 +302,14 @@ async def analyze_single_post(post_url: str, ctx: Context = None) -> str:
                         break
             except:
                 continue
-        
+    
         # 포스트 내용
         content_selectors = ['.post-content', '.entry-content', '.article-content', '.content']
         post_content = "내용을 찾을 수 없음"
         content_length = 0
         for selector in content_selectors:
             try:
-                element = await current_page.query_selector(selector)
+                element = await page.query_selector(selector)
                 if element:
                     text = await element.text_content()
                     if text and text.strip():
@@ -275,33 +319,46 @@ async def analyze_single_post(post_url: str, ctx: Context = None) -> str:
                         break
             except:
                 continue
-        
+    
         # 이미지 개수
         try:
-            images = await current_page.query_selector_all('img')
+            images = await page.query_selector_all('img')
             image_count = len(images)
         except:
             image_count = 0
-        
+    
         # 링크 개수
         try:
-            links = await current_page.query_selector_all('a')
+            links = await page.query_selector_all('a')
             link_count = len(links)
         except:
             link_count = 0
+    
+    return {
+        "url": post_url,
+        "title": post_title,
+        "content_preview": post_content,
+        "content_length": content_length,
+        "image_count": image_count,
+        "link_count": link_count,
+        "analysis_timestamp": datetime.now().isoformat()
+    }
+
+
+@blog_analyzer_mcp.tool
+async def analyze_single_post(post_url: str, block_profile: Optional[str] = None, ctx: Context = None) -> str:
+    """개별 블로그 포스트를 분석합니다."""
+    if not current_page:
+        return "브라우저가 시작되지 않았습니다."
+    
+    try:
+        if ctx:
+            await ctx.info(f"포스트 분석 중: {post_url}")
         
-        analysis_result = {
-            "url": post_url,
-            "title": post_title,
-            "content_preview": post_content,
-            "content_length": content_length,
-            "image_count": image_count,
-            "link_count": link_count,
-            "analysis_timestamp": datetime.now().isoformat()
-        }
+        analysis_result = await _analyze_post_page(current_page, post_url, block_profile)
         
         if ctx:
-            await ctx.info(f"포스트 분석 완료: {post_title}")
+            await ctx.info(f"포스트 분석 완료: {analysis_result['title']}")
         
         return json.dumps(analysis_result, ensure_ascii=False, indent=2)
     
@@ -312,32 +369,121 @@ async def analyze_single_post(post_url: str, ctx: Context = None) -> str:
 
 
 @blog_analyzer_mcp.tool
-async def take_blog_screenshot(blog_url: str, screenshot_type: str = "full", ctx: Context = None) -> str:
-    """블로그의 스크린샷을 촬영합니다."""
+async def analyze_posts_batch(urls: List[str], concurrency: int = 5, block_profile: Optional[str] = None,
+                              ctx: Context = None) -> str:
+    """여러 포스트를 페이지 풀에서 동시에 분석합니다."""
+    if not context:
+        return "브라우저가 시작되지 않았습니다."
+    
+    if concurrency < 1:
+        return "동시 실행 수(concurrency)는 1 이상이어야 합니다."
+    
+    concurrency = min(concurrency, MAX_BATCH_CONCURRENCY, len(urls) or 1)
+    started = datetime.now()
+    
+    # 페이지 풀 크기가 곧 동시 실행 수 (페이지를 빌린 작업만 분석을 진행)
+    page_pool: asyncio.Queue = asyncio.Queue()
+    pages: List = []
+    results: List[Optional[Dict]] = [None] * len(urls)
+    completed = 0
+    
+    async def worker(index: int, url: str):
+        nonlocal completed
+        page = await page_pool.get()
+        try:
+            results[index] = await _analyze_post_page(page, url, block_profile)
+        except Exception as e:
+            results[index] = {"url": url, "error": str(e)}
+        finally:
+            page_pool.put_nowait(page)
+        
+        # URL별 결과를 완료되는 대로 진행 상황으로 전달
+        completed += 1
+        if ctx:
+            result = results[index]
+            status = f"실패: {result['error']}" if "error" in result else result["title"]
+            await ctx.info(f"[{completed}/{len(urls)}] {url} - {status}")
+            await ctx.report_progress(progress=completed, total=len(urls))
+    
+    try:
+        if ctx:
+            await ctx.info(f"{len(urls)}개 포스트 일괄 분석 시작 (동시 실행: {concurrency})")
+        
+        # 기존 브라우저 컨텍스트에 분석 전용 페이지 풀 생성
+        for _ in range(concurrency):
+            page = await context.new_page()
+            pages.append(page)
+            page_pool.put_nowait(page)
+        
+        # 진행 상황 전달이 실패해도 다른 작업이 끝날 때까지 기다린 뒤 오류를 전달
+        outcomes = await asyncio.gather(*(worker(i, url) for i, url in enumerate(urls)),
+                                        return_exceptions=True)
+        errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+        if errors:
+            raise errors[0]
+        
+        succeeded = [r for r in results if "error" not in r]
+        batch_result = {
+            "total": len(urls),
+            "succeeded": len(succeeded),
+            "failed": len(urls) - len(succeeded),
+            "concurrency": concurrency,
+            "elapsed_seconds": round((datetime.now() - started).total_seconds(), 2),
+            "total_content_length": sum(r["content_length"] for r in succeeded),
+            "total_images": sum(r["image_count"] for r in succeeded),
+            "total_links": sum(r["link_count"] for r in succeeded),
+            "posts": results,
+            "analysis_timestamp": datetime.now().isoformat()
+        }
+        
+        if ctx:
+            await ctx.info(f"일괄 분석 완료: {len(succeeded)}/{len(urls)} 성공")
+        
+        return json.dumps(batch_result, ensure_ascii=False, indent=2)
+    
+    except Exception as e:
+        if ctx:
+            await ctx.error(f"일괄 분석 실패: {str(e)}")
+        return f"일괄 분석 실패: {str(e)}"
+    
+    finally:
+        for page in pages:
+            try:
+                await page.close()
+            except Exception:
+                pass
+
+
+@blog_analyzer_mcp.tool
+async def take_blog_screenshot(blog_url: str, screenshot_type: str = "full", block_profile: str = "none",
+                               ctx: Context = None) -> str:
+    """블로그의 스크린샷을 촬영합니다. 기본값(none)은 모든 리소스를 불러와 화면 그대로 촬영하고,
+    light/text를 주면 트래커와 이미지 등을 차단한 채 촬영합니다."""
     if not current_page:
         return "브라우저가 시작되지 않았습니다."
     
     try:
         if ctx:
-            await ctx.info(f"블로그 스크린샷 촬영 중: {blog_url}")
+            await ctx.info(f"블로그 스크린샷 촬영 중: {blog_url} (차단 프로필: {block_profile})")
         
-        await current_page.goto(blog_url, wait_until="domcontentloaded", timeout=30000)
+        async with resource_blocker.override(current_page, block_profile):
+            await current_page.goto(blog_url, wait_until="domcontentloaded", timeout=30000)
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"blog_screenshot_{timestamp}.png"
-        screenshot_path = Path(tempfile.gettempdir()) / f"playwright_{filename}"
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"blog_screenshot_{timestamp}.png"
+            screenshot_path = Path(tempfile.gettempdir()) / f"playwright_{filename}"
         
-        if screenshot_type == "full":
-            await current_page.screenshot(path=str(screenshot_path), full_page=True)
-        else:
-            await current_page.screenshot(path=str(screenshot_path))
+            if screenshot_type == "full":
+                await current_page.screenshot(path=str(screenshot_path), full_page=True)
+            else:
+                await current_page.screenshot(path=str(screenshot_path))
         
-        file_size = screenshot_path.stat().st_size
+            file_size = screenshot_path.stat().st_size
         
-        if ctx:
-            await ctx.info(f"스크린샷 저장 완료: {screenshot_path}")
+            if ctx:
+                await ctx.info(f"스크린샷 저장 완료: {screenshot_path}")
         
-        return f"블로그 스크린샷이 저장되었습니다.\n경로: {screenshot_path}\n크기: {file_size} bytes\n타입: {screenshot_type}"
+            return f"블로그 스크린샷이 저장되었습니다.\n경로: {screenshot_path}\n크기: {file_size} bytes\n타입: {screenshot_type}"
     
     except Exception as e:
         if ctx:
@@ -346,7 +492,7 @@ async def take_blog_screenshot(blog_url: str, screenshot_type: str = "full", ctx
 
 
 @blog_analyzer_mcp.tool
-async def check_blog_seo(blog_url: str, ctx: Context = None) -> str:
+async def check_blog_seo(blog_url: str, block_profile: Optional[str] = None, ctx: Context = None) -> str:
     """블로그의 SEO 정보를 확인합니다."""
     if not current_page:
         return "브라우저가 시작되지 않았습니다."
@@ -355,83 +501,43 @@ async def check_blog_seo(blog_url: str, ctx: Context = None) -> str:
         if ctx:
             await ctx.info(f"SEO 정보 확인 중: {blog_url}")
         
-        await current_page.goto(blog_url, wait_until="domcontentloaded", timeout=30000)
-        
-        # SEO 관련 정보 수집
-        seo_info = {}
-        
-        # 메타 태그들
-        meta_tags = [
-            ('description', 'meta[name="description"]'),
-            ('keywords', 'meta[name="keywords"]'),
-            ('author', 'meta[name="author"]'),
-            ('robots', 'meta[name="robots"]'),
-            ('viewport', 'meta[name="viewport"]'),
-            ('og:title', 'meta[property="og:title"]'),
-            ('og:description', 'meta[property="og:description"]'),
-            ('og:url', 'meta[property="og:url"]'),
-            ('og:image', 'meta[property="og:image"]'),
-            ('twitter:card', 'meta[name="twitter:card"]'),
-            ('twitter:title', 'meta[name="twitter:title"]')
-        ]
+        async with resource_blocker.override(current_page, block_profile):
+            await current_page.goto(blog_url, wait_until="domcontentloaded", timeout=30000)
         
-        for tag_name, selector in meta_tags:
-            try:
-                element = await current_page.query_selector(selector)
-                if element:
-                    content = await element.get_attribute('content')
-                    seo_info[tag_name] = content or "없음"
-                else:
-                    seo_info[tag_name] = "없음"
-            except:
-                seo_info[tag_name] = "오류"
+            # SEO 스냅샷을 페이지 안에서 한 번에 수집
+            snapshot = await current_page.evaluate(SEO_SNAPSHOT_SCRIPT, SEO_META_TAGS)
         
-        # 제목 태그
-        try:
-            title = await current_page.title()
-            seo_info['title'] = title
-            seo_info['title_length'] = len(title)
-        except:
-            seo_info['title'] = "없음"
-            seo_info['title_length'] = 0
+            seo_info = {}
         
-        # 헤딩 태그 개수
-        for i in range(1, 7):
-            try:
-                headings = await current_page.query_selector_all(f'h{i}')
-                seo_info[f'h{i}_count'] = len(headings)
-            except:
-                seo_info[f'h{i}_count'] = 0
+            # 메타 태그들
+            for tag_name, _ in SEO_META_TAGS:
+                seo_info[tag_name] = snapshot["meta"].get(tag_name) or "없음"
         
-        # 이미지 alt 태그 확인
-        try:
-            images = await current_page.query_selector_all('img')
-            images_with_alt = 0
-            total_images = len(images)
-            
-            for img in images:
-                alt = await img.get_attribute('alt')
-                if alt and alt.strip():
-                    images_with_alt += 1
-            
+            # 제목 태그
+            seo_info['title'] = snapshot["title"]
+            seo_info['title_length'] = len(snapshot["title"])
+        
+            # 헤딩 태그 개수
+            for i, count in enumerate(snapshot["headings"], start=1):
+                seo_info[f'h{i}_count'] = count
+        
+            # 이미지 alt 태그 확인
+            total_images = snapshot["total_images"]
+            images_with_alt = snapshot["images_with_alt"]
             seo_info['total_images'] = total_images
             seo_info['images_with_alt'] = images_with_alt
             seo_info['alt_coverage'] = f"{images_with_alt}/{total_images}" if total_images > 0 else "0/0"
-        except:
-            seo_info['total_images'] = 0
-            seo_info['images_with_alt'] = 0
-            seo_info['alt_coverage'] = "0/0"
         
-        result = {
-            "url": blog_url,
-            "seo_analysis": seo_info,
-            "analysis_timestamp": datetime.now().isoformat()
-        }
+            result = {
+                "url": blog_url,
+                "seo_analysis": seo_info,
+                "analysis_timestamp": datetime.now().isoformat()
+            }
         
-        if ctx:
-            await ctx.info("SEO 분석 완료!")
+            if ctx:
+                await ctx.info("SEO 분석 완료!")
         
-        return json.dumps(result, ensure_ascii=False, indent=2)
+            return json.dumps(result, ensure_ascii=False, indent=2)
     
     except Exception as e:
         if ctx:
@@ -443,6 +549,21 @@ async def check_blog_seo(blog_url: str, ctx: Context = None) -> str:
 # 리소스들
 # =============================================================================
 
+@blog_analyzer_mcp.resource("browser://status")
+def get_browser_status() -> str:
+    """현재 브라우저 상태와 리소스 차단 통계를 반환합니다."""
+    status = {
+        "browser_started": browser is not None,
+        "context_available": context is not None,
+        "page_available": current_page is not None,
+        "current_url": current_page.url if current_page else None,
+        "resource_blocking": resource_blocker.status(),
+        "available_block_profiles": list(BLOCKING_PROFILES)
+    }
+    
+    return json.dumps(status, ensure_ascii=False, indent=2)
+
+
 @blog_analyzer_mcp.resource("blog://analysis-guide")
 def get_blog_analysis_guide() -> str:
     """블로그 분석 가이드를 반환합니다."""
@@ -451,7 +572,7 @@ def get_blog_analysis_guide() -> str:
             "1. start_browser로 브라우저 시작",
             "2. analyze_blog_homepage로 블로그 홈페이지 분석",
             "3. extract_blog_posts로 포스트 목록 추출",
-            "4. analyze_single_post로 개별 포스트 분석",
+            "4. analyze_single_post로 개별 포스트 분석 (여러 개는 analyze_posts_batch)",
             "5. check_blog_seo로 SEO 상태 확인",
             "6. take_blog_screenshot로 스크린샷 촬영",
             "7. close_browser로 브라우저 종료"
@@ -460,6 +581,7 @@ def get_blog_analysis_guide() -> str:
             "홈페이지 분석": "블로그 제목, 메타 정보, 포스트 개수 등",
             "포스트 추출": "최근 포스트 목록과 URL 수집",
             "개별 분석": "포스트 제목, 내용, 이미지/링크 개수",
+            "일괄 분석": "여러 포스트를 페이지 풀에서 동시에 분석",
             "SEO 분석": "메타 태그, 헤딩 구조, 이미지 alt 태그",
             "스크린샷": "블로그 전체 또는 일부 화면 캡처"
         },
@@ -481,6 +603,7 @@ if __name__ == "__main__":
     print("- analyze_blog_homepage: 블로그 홈페이지 분석")
     print("- extract_blog_posts: 포스트 목록 추출")
     print("- analyze_single_post: 개별 포스트 분석")
+    print("- analyze_posts_batch: 여러 포스트 동시 분석")
     print("- check_blog_seo: SEO 정보 확인")
     print("- take_blog_screenshot: 블로그 스크린샷")
     
@@ -490,6 +613,7 @@ if __name__ == "__main__":
     
     print("\n📋 리소스:")
     print("- blog://analysis-guide: 블로그 분석 가이드")
+    print("- browser://status: 브라우저 상태 및 리소스 차단 통계")
     
     print("\n서버가 실행됩니다...")
     
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+비동기 SQLite 커넥션 풀
+
+FastMCP 도구는 하나의 이벤트 루프에서 실행되므로 sqlite3 호출을 그대로 부르면
+쿼리가 끝날 때까지 다른 클라이언트의 요청이 모두 멈춥니다. 이 모듈은 커넥션
+몇 개를 미리 열어 두고 쿼리를 전용 스레드 풀에서 실행합니다.
+
+- 파일 DB: WAL 모드 + synchronous=NORMAL (읽기가 쓰기를 막지 않고, 커밋마다 fsync하지 않음)
+- ":memory:": 공유 캐시 메모리 DB로 열어 풀의 모든 커넥션이 같은 데이터를 봅니다
+  (쓰기는 직렬화하고, 테이블 잠금에 걸린 쿼리는 잠깐 기다렸다 다시 시도)
+- 커넥션마다 prepared statement 캐시(cached_statements)를 두므로 SQL 문자열을
+  상수로 두고 재사용하면 매번 다시 파싱하지 않습니다
+"""
+
+import asyncio
+import itertools
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+_memory_ids = itertools.count(1)
+
+
+class SQLitePool:
+    """스레드 풀에서 쿼리를 실행하는 SQLite 커넥션 풀"""
+
+    def __init__(self, path: str = ":memory:", size: int = 4, busy_timeout: float = 5.0,
+                 cached_statements: int = 256):
+        self.path = path
+        self.size = max(1, size)
+        self._memory = path == ":memory:"
+        if self._memory:
+            # 커넥션마다 별도 DB가 생기지 않도록 이름 붙은 공유 캐시 메모리 DB 사용
+            self._target = f"file:fastmcp_pool_{next(_memory_ids)}?mode=memory&cache=shared"
+        else:
+            self._target = path
+        # 공유 캐시 메모리 DB는 busy_timeout 없이 곧바로 "table is locked"를 내므로 쓰기를 직렬화
+        self._write_lock = threading.Lock() if self._memory else nullcontext()
+        self._busy_timeout = busy_timeout
+        self._cached_statements = cached_statements
+        self._pool: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._connections: List[sqlite3.Connection] = []
+        for _ in range(self.size):
+            conn = self._connect()
+            self._connections.append(conn)
+            self._pool.put(conn)
+        self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="sqlite-pool")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self._target,
+            uri=self._memory,
+            timeout=self._busy_timeout,
+            check_same_thread=False,
+            cached_statements=self._cached_statements,
+        )
+        if not self._memory:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def connection(self, write: bool = False) -> Iterator[sqlite3.Connection]:
+        """풀에서 커넥션을 빌려 오고, 블록이 끝나면 커밋(예외 시 롤백) 후 돌려줍니다."""
+        conn = self._pool.get()
+        try:
+            with self._write_lock if write else nullcontext(), conn:
+                yield conn
+        finally:
+            if conn.in_transaction:
+                # 커밋이 실패한 트랜잭션을 다음 사용자에게 넘기지 않음
+                conn.rollback()
+            self._pool.put(conn)
+
+    # -------------------------------------------------------------------------
+    # 동기 API (스레드 풀 안에서 실행)
+    # -------------------------------------------------------------------------
+
+    def _run(self, func: Callable[[sqlite3.Connection], T], write: bool = False) -> T:
+        """커넥션 하나로 func를 한 트랜잭션에서 실행합니다.
+
+        공유 캐시 메모리 DB는 다른 커넥션이 잡은 테이블 잠금에 걸리면 busy_timeout 없이
+        곧바로 "table is locked"를 내므로, 롤백된 트랜잭션을 잠깐씩 기다렸다 다시 실행합니다.
+        """
+        deadline = time.monotonic() + self._busy_timeout
+        delay = 0.001
+        while True:
+            try:
+                with self.connection(write) as conn:
+                    return func(conn)
+            except sqlite3.OperationalError as e:
+                if not self._memory or "locked" not in str(e) or time.monotonic() >= deadline:
+                    raise
+            time.sleep(delay)
+            delay = min(delay * 2, 0.05)
+
+    def _execute(self, sql: str, params: Sequence[Any]) -> Tuple[Optional[int], int]:
+        def run(conn: sqlite3.Connection) -> Tuple[Optional[int], int]:
+            cursor = conn.execute(sql, params)
+            return cursor.lastrowid, cursor.rowcount
+        return self._run(run, write=True)
+
+    def _executemany(self, sql: str, rows: Sequence[Sequence[Any]]) -> int:
+        return self._run(lambda conn: conn.executemany(sql, rows).rowcount, write=True)
+
+    def _fetchall(self, sql: str, params: Sequence[Any]) -> List[tuple]:
+        return self._run(lambda conn: conn.execute(sql, params).fetchall())
+
+    def _fetchone(self, sql: str, params: Sequence[Any]) -> Optional[tuple]:
+        return self._run(lambda conn: conn.execute(sql, params).fetchone())
+
+    def _call(self, func: Callable[[sqlite3.Connection], T]) -> T:
+        return self._run(func, write=True)
+
+    # -------------------------------------------------------------------------
+    # 비동기 API
+    # -------------------------------------------------------------------------
+
+    async def _submit(self, func: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def execute(self, sql: str, params: Sequence[Any] = ()) -> Tuple[Optional[int], int]:
+        """쓰기 쿼리 하나를 실행하고 커밋합니다. (lastrowid, rowcount)를 반환합니다."""
+        return await self._submit(self._execute, sql, params)
+
+    async def executemany(self, sql: str, rows: Sequence[Sequence[Any]]) -> int:
+        """여러 행을 한 트랜잭션으로 기록합니다."""
+        return await self._submit(self._executemany, sql, rows)
+
+    async def fetchall(self, sql: str, params: Sequence[Any] = ()) -> List[tuple]:
+        return await self._submit(self._fetchall, sql, params)
+
+    async def fetchone(self, sql: str, params: Sequence[Any] = ()) -> Optional[tuple]:
+        return await self._submit(self._fetchone, sql, params)
+
+    async def run(self, func: Callable[[sqlite3.Connection], T]) -> T:
+        """커넥션 하나로 여러 쿼리를 한 트랜잭션에서 실행합니다."""
+        return await self._submit(self._call, func)
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        for conn in self._connections:
+            conn.close()
+        self._connections.clear()
@@ -9,8 +9,10 @@ LLM이 웹페이지를 탐색하고, 스크린샷을 찍고, 폼을 작성할 
 import asyncio
 import base64
 import json
+import logging
 import os
 import tempfile
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -18,15 +20,196 @@ from typing import Any, Dict, List, Optional
 from fastmcp import FastMCP, Context
 from playwright.async_api import async_playwright, Browser, Page, BrowserContext
 
+from resource_blocking import BLOCKING_PROFILES, ResourceBlocker
+
+
+logger = logging.getLogger(__name__)
 
 # Playwright MCP 서버 인스턴스 생성
 playwright_mcp = FastMCP("Playwright MCP 서버 🎭")
 
-# 전역 변수들
+# 세션별 브라우저 컨텍스트 설정 (환경 변수로 조정 가능)
+MAX_SESSIONS = int(os.getenv("PLAYWRIGHT_MAX_SESSIONS", "16"))
+MAX_PAGES_PER_SESSION = int(os.getenv("PLAYWRIGHT_MAX_PAGES_PER_SESSION", "4"))
+MAX_TOTAL_PAGES = int(os.getenv("PLAYWRIGHT_MAX_TOTAL_PAGES", "32"))
+DEFAULT_SESSION = "default"
+DEFAULT_TAB = "main"
+
+# 요소 목록을 태그명/잘린 텍스트/HTML 길이로 한 번에 직렬화하는 스크립트
+ELEMENTS_INFO_SCRIPT = """
+(elements, { offset, limit, maxText }) => ({
+    total: elements.length,
+    elements: elements.slice(offset, offset + limit).map((el, i) => {
+        const text = el.textContent;
+        return {
+            index: offset + i,
+            tag_name: el.tagName,
+            text_content: text && text.length > maxText ? text.slice(0, maxText) + "..." : text,
+            inner_html_length: el.innerHTML ? el.innerHTML.length : 0
+        };
+    })
+})
+"""
+
+# 전역 변수들 (브라우저 프로세스는 모든 세션이 공유)
 browser: Optional[Browser] = None
-context: Optional[BrowserContext] = None
-current_page: Optional[Page] = None
 playwright_instance = None
+resource_blocker = ResourceBlocker()
+
+
+class BrowserSession:
+    """MCP 세션 하나에 대응하는 BrowserContext와 탭 목록"""
+
+    def __init__(self, context: BrowserContext):
+        self.context = context
+        self.pages: Dict[str, Page] = {}
+        self.active_tab = DEFAULT_TAB
+
+    @property
+    def current_page(self) -> Optional[Page]:
+        return self.pages.get(self.active_tab)
+
+
+class SessionEvictedError(RuntimeError):
+    """한도 때문에 정리된 세션이 다시 요청했을 때 한 번 알려 주는 오류"""
+
+
+class SessionManager:
+    """MCP 세션마다 독립된 BrowserContext를 할당하고 전체 페이지 수를 제한합니다."""
+
+    def __init__(self, max_sessions: int = MAX_SESSIONS,
+                 max_pages_per_session: int = MAX_PAGES_PER_SESSION,
+                 max_total_pages: int = MAX_TOTAL_PAGES):
+        self.max_sessions = max_sessions
+        self.max_pages_per_session = max_pages_per_session
+        self.max_total_pages = max_total_pages
+        self.context_options: Dict[str, Any] = {}
+        self._sessions: "OrderedDict[str, BrowserSession]" = OrderedDict()
+        # 한도 때문에 정리된 세션 ID (다음 요청 때 알린 뒤 지움)
+        self._evicted: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    @property
+    def total_pages(self) -> int:
+        return sum(len(session.pages) for session in self._sessions.values())
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    async def get(self, session_id: str) -> BrowserSession:
+        """세션의 컨텍스트를 반환합니다. 없으면 기본 탭과 함께 생성합니다.
+
+        한도 때문에 정리된 세션이 다시 요청하면 SessionEvictedError를 한 번 발생시키고,
+        그다음 요청부터는 새 컨텍스트를 만듭니다.
+        """
+        async with self._lock:
+            session = self._sessions.get(session_id)
+            if session:
+                self._sessions.move_to_end(session_id)
+                return session
+
+            if session_id in self._evicted:
+                del self._evicted[session_id]
+                raise SessionEvictedError(
+                    f"세션 '{session_id}'의 브라우저 컨텍스트가 최대 세션/페이지 수 제한으로 정리되었습니다. "
+                    "열려 있던 탭과 로그인 상태가 사라졌으니 다시 요청하면 새 컨텍스트가 할당됩니다."
+                )
+
+            # 세션 수 또는 전체 페이지 수가 한도에 도달하면 가장 오래 사용하지 않은 세션을 정리
+            while self._sessions and (len(self._sessions) >= self.max_sessions
+                                      or self.total_pages >= self.max_total_pages):
+                evicted_id, evicted = self._sessions.popitem(last=False)
+                logger.warning("세션 한도 초과로 가장 오래된 세션 '%s'의 컨텍스트를 정리합니다 (탭 %d개)",
+                               evicted_id, len(evicted.pages))
+                self._evicted[evicted_id] = None
+                while len(self._evicted) > self.max_sessions * 4:
+                    self._evicted.popitem(last=False)
+                await self._close(evicted)
+
+            context = await browser.new_context(**self.context_options)
+            await resource_blocker.attach(context)
+            session = BrowserSession(context)
+            session.pages[DEFAULT_TAB] = await context.new_page()
+            self._sessions[session_id] = session
+            return session
+
+    async def open_tab(self, session_id: str, tab: str) -> Page:
+        """세션에 새 탭을 열고 활성 탭으로 전환합니다."""
+        session = await self.get(session_id)
+        async with self._lock:
+            if tab not in session.pages:
+                if len(session.pages) >= self.max_pages_per_session:
+                    raise RuntimeError(f"세션당 최대 탭 수({self.max_pages_per_session})를 초과했습니다.")
+                if self.total_pages >= self.max_total_pages:
+                    raise RuntimeError(f"전체 최대 페이지 수({self.max_total_pages})를 초과했습니다.")
+                session.pages[tab] = await session.context.new_page()
+            session.active_tab = tab
+            return session.pages[tab]
+
+    async def close_tab(self, session_id: str, tab: str) -> bool:
+        """탭을 닫습니다. 마지막 탭을 닫으면 빈 기본 탭을 새로 열어 둡니다."""
+        async with self._lock:
+            session = self._sessions.get(session_id)
+            if not session or tab not in session.pages:
+                return False
+            page = session.pages.pop(tab)
+            await page.close()
+            if not session.pages:
+                session.pages[DEFAULT_TAB] = await session.context.new_page()
+            if session.active_tab not in session.pages:
+                session.active_tab = next(iter(session.pages))
+            return True
+
+    async def close_session(self, session_id: str) -> bool:
+        async with self._lock:
+            self._evicted.pop(session_id, None)
+            session = self._sessions.pop(session_id, None)
+        if not session:
+            return False
+        await self._close(session)
+        return True
+
+    async def close_all(self):
+        async with self._lock:
+            while self._sessions:
+                _, session = self._sessions.popitem()
+                await self._close(session)
+
+    async def _close(self, session: BrowserSession):
+        try:
+            await session.context.close()
+        except Exception:
+            pass
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            session_id: {
+                "active_tab": session.active_tab,
+                "tabs": {tab: page.url for tab, page in session.pages.items()}
+            }
+            for session_id, session in self._sessions.items()
+        }
+
+
+sessions = SessionManager()
+
+
+def _session_id(ctx: Optional[Context]) -> str:
+    """요청한 MCP 세션의 식별자를 반환합니다 (세션 정보가 없으면 기본 세션)."""
+    if ctx is None:
+        return DEFAULT_SESSION
+    try:
+        return ctx.session_id or DEFAULT_SESSION
+    except Exception:
+        return DEFAULT_SESSION
+
+
+async def _get_page(ctx: Optional[Context]) -> Optional[Page]:
+    """요청한 세션의 활성 탭을 반환합니다."""
+    if not browser:
+        return None
+    session = await sessions.get(_session_id(ctx))
+    return session.current_page
 
 
 # =============================================================================
@@ -34,13 +217,33 @@ playwright_instance = None
 # =============================================================================
 
 @playwright_mcp.tool
-async def start_browser(headless: bool = True, browser_type: str = "chromium", ctx: Context = None) -> str:
-    """브라우저를 시작합니다."""
-    global browser, context, current_page, playwright_instance
+async def start_browser(headless: bool = True, browser_type: str = "chromium",
+                        block_profile: str = "none", block_resource_types: List[str] = None,
+                        block_domains: List[str] = None, ctx: Context = None) -> str:
+    """브라우저를 시작합니다. 이미 실행 중이면 기존 브라우저를 공유합니다.
+    
+    block_profile: 리소스 차단 프로필 (none, light, text)
+    block_resource_types / block_domains: 프로필에 추가로 차단할 리소스 타입과 도메인
+    """
+    global browser, playwright_instance, resource_blocker
     
     try:
+        if browser:
+            await sessions.get(_session_id(ctx))
+            message = f"브라우저가 이미 실행 중입니다. 세션 '{_session_id(ctx)}'에 컨텍스트가 할당되었습니다."
+            requested = ResourceBlocker(block_profile, block_resource_types, block_domains)
+            if (requested.resource_types != resource_blocker.resource_types
+                    or requested.domains != resource_blocker.domains):
+                # 차단 규칙은 실행 중인 브라우저의 모든 세션이 공유하므로 여기서 바꾸지 않음
+                message += (f"\n요청한 차단 프로필 '{block_profile}'은 적용되지 않았습니다. "
+                            f"현재 프로필 '{resource_blocker.profile}'이 유지되며, "
+                            "호출 단위로는 navigate_to_url의 block_profile 인자를 사용하세요.")
+            return message
+        
         if ctx:
-            await ctx.info(f"브라우저 시작 중... (타입: {browser_type}, 헤드리스: {headless})")
+            await ctx.info(f"브라우저 시작 중... (타입: {browser_type}, 헤드리스: {headless}, 차단 프로필: {block_profile})")
+        
+        resource_blocker = ResourceBlocker(block_profile, block_resource_types, block_domains)
         
         playwright_instance = await async_playwright().start()
         
@@ -51,14 +254,16 @@ async def start_browser(headless: bool = True, browser_type: str = "chromium", c
         elif browser_type == "webkit":
             browser = await playwright_instance.webkit.launch(headless=headless)
         else:
+            await playwright_instance.stop()
+            playwright_instance = None
             return f"지원되지 않는 브라우저 타입: {browser_type}"
         
-        # 새 컨텍스트와 페이지 생성
-        context = await browser.new_context(
-            viewport={"width": 1280, "height": 720},
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        )
-        current_page = await context.new_page()
+        # 세션별 컨텍스트 옵션 설정 후 요청한 세션의 컨텍스트 생성
+        sessions.context_options = {
+            "viewport": {"width": 1280, "height": 720},
+            "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+        }
+        await sessions.get(_session_id(ctx))
         
         if ctx:
             await ctx.info("브라우저가 성공적으로 시작되었습니다!")
@@ -73,20 +278,14 @@ async def start_browser(headless: bool = True, browser_type: str = "chromium", c
 
 @playwright_mcp.tool
 async def close_browser(ctx: Context = None) -> str:
-    """브라우저를 종료합니다."""
-    global browser, context, current_page, playwright_instance
+    """브라우저를 종료합니다. 모든 세션의 컨텍스트가 함께 닫힙니다."""
+    global browser, playwright_instance
     
     try:
         if ctx:
             await ctx.info("브라우저 종료 중...")
         
-        if current_page:
-            await current_page.close()
-            current_page = None
-        
-        if context:
-            await context.close()
-            context = None
+        await sessions.close_all()
         
         if browser:
             await browser.close()
@@ -107,13 +306,63 @@ async def close_browser(ctx: Context = None) -> str:
         return f"브라우저 종료 실패: {str(e)}"
 
 
+@playwright_mcp.tool
+async def close_session(ctx: Context = None) -> str:
+    """현재 MCP 세션의 컨텍스트만 종료합니다. 다른 세션은 영향을 받지 않습니다."""
+    session_id = _session_id(ctx)
+    
+    try:
+        if await sessions.close_session(session_id):
+            return f"세션 '{session_id}'의 컨텍스트가 종료되었습니다."
+        return f"세션 '{session_id}'에 열린 컨텍스트가 없습니다."
+    
+    except Exception as e:
+        if ctx:
+            await ctx.error(f"세션 종료 실패: {str(e)}")
+        return f"세션 종료 실패: {str(e)}"
+
+
+@playwright_mcp.tool
+async def open_tab(tab: str, ctx: Context = None) -> str:
+    """현재 세션에 새 탭을 열거나 기존 탭으로 전환합니다."""
+    if not browser:
+        return "브라우저가 시작되지 않았습니다. 먼저 start_browser를 호출하세요."
+    
+    try:
+        page = await sessions.open_tab(_session_id(ctx), tab)
+        return f"활성 탭: {tab} (URL: {page.url})"
+    
+    except Exception as e:
+        if ctx:
+            await ctx.error(f"탭 열기 실패: {str(e)}")
+        return f"탭 열기 실패: {str(e)}"
+
+
+@playwright_mcp.tool
+async def close_tab(tab: str, ctx: Context = None) -> str:
+    """현재 세션의 탭을 닫습니다."""
+    try:
+        if await sessions.close_tab(_session_id(ctx), tab):
+            return f"탭 '{tab}'이 닫혔습니다."
+        return f"탭 '{tab}'을 찾을 수 없습니다."
+    
+    except Exception as e:
+        if ctx:
+            await ctx.error(f"탭 닫기 실패: {str(e)}")
+        return f"탭 닫기 실패: {str(e)}"
+
+
 # =============================================================================
 # 웹페이지 탐색 도구들
 # =============================================================================
 
 @playwright_mcp.tool
-async def navigate_to_url(url: str, ctx: Context = None) -> str:
-    """지정된 URL로 이동합니다."""
+async def navigate_to_url(url: str, block_profile: Optional[str] = None, ctx: Context = None) -> str:
+    """지정된 URL로 이동합니다. block_profile을 지정하면 이번 탐색에만 해당 차단 프로필을 적용합니다.
+    
+    탐색이 끝난 뒤(domcontentloaded 이후) 발생하는 요청에는 브라우저 시작 시 정한 프로필이 적용됩니다.
+    """
+    current_page = await _get_page(ctx)
     if not current_page:
         return "브라우저가 시작되지 않았습니다. 먼저 start_browser를 호출하세요."
     
@@ -121,7 +370,8 @@ async def navigate_to_url(url: str, ctx: Context = None) -> str:
         if ctx:
             await ctx.info(f"URL로 이동 중: {url}")
         
-        response = await current_page.goto(url, wait_until="domcontentloaded", timeout=30000)
+        async with resource_blocker.override(current_page, block_profile):
+            response = await current_page.goto(url, wait_until="domcontentloaded", timeout=30000)
         
         if response:
             status = response.status
@@ -144,6 +394,7 @@ async def navigate_to_url(url: str, ctx: Context = None) -> str:
 @playwright_mcp.tool
 async def get_page_info(ctx: Context = None) -> str:
     """현재 페이지의 기본 정보를 가져옵니다."""
+    current_page = await _get_page(ctx)
     if not current_page:
         return "브라우저가 시작되지 않았습니다."
     
@@ -173,6 +424,7 @@ async def get_page_info(ctx: Context = None) -> str:
 @playwright_mcp.tool
 async def get_page_text(selector: str = "body", ctx: Context = None) -> str:
     """페이지에서 텍스트를 추출합니다."""
+    current_page = await _get_page(ctx)
     if not current_page:
         return "브라우저가 시작되지 않았습니다."
     
@@ -205,6 +457,7 @@ async def get_page_text(selector: str = "body", ctx: Context = None) -> str:
 @playwright_mcp.tool
 async def take_screenshot(filename: str = None, full_page: bool = False, ctx: Context = None) -> str:
     """현재 페이지의 스크린샷을 찍습니다."""
+    current_page = await _get_page(ctx)
     if not current_page:
         return "브라우저가 시작되지 않았습니다."
     
@@ -244,6 +497,7 @@ async def take_screenshot(filename: str = None, full_page: bool = False, ctx: Co
 @playwright_mcp.tool
 async def take_element_screenshot(selector: str, filename: str = None, ctx: Context = None) -> str:
     """특정 요소의 스크린샷을 찍습니다."""
+    current_page = await _get_page(ctx)
     if not current_page:
         return "브라우저가 시작되지 않았습니다."
     
@@ -288,6 +542,7 @@ async def take_element_screenshot(selector: str, filename: str = None, ctx: Cont
 @playwright_mcp.tool
 async def click_element(selector: str, ctx: Context = None) -> str:
     """지정된 셀렉터의 요소를 클릭합니다."""
+    current_page = await _get_page(ctx)
     if not current_page:
         return "브라우저가 시작되지 않았습니다."
     
@@ -313,6 +568,7 @@ async def click_element(selector: str, ctx: Context = None) -> str:
 @playwright_mcp.tool
 async def fill_input(selector: str, text: str, ctx: Context = None) -> str:
     """입력 필드에 텍스트를 입력합니다."""
+    current_page = await _get_page(ctx)
     if not current_page:
         return "브라우저가 시작되지 않았습니다."
     
@@ -338,6 +594,7 @@ async def fill_input(selector: str, text: str, ctx: Context = None) -> str:
 @playwright_mcp.tool
 async def wait_for_element(selector: str, timeout: int = 10000, ctx: Context = None) -> str:
     """지정된 요소가 나타날 때까지 기다립니다."""
+    current_page = await _get_page(ctx)
     if not current_page:
         return "브라우저가 시작되지 않았습니다."
     
@@ -365,6 +622,7 @@ async def wait_for_element(selector: str, timeout: int = 10000, ctx: Context = N
 @playwright_mcp.tool
 async def evaluate_javascript(script: str, ctx: Context = None) -> str:
     """페이지에서 JavaScript 코드를 실행합니다."""
+    current_page = await _get_page(ctx)
     if not current_page:
         return "브라우저가 시작되지 않았습니다."
     
@@ -386,36 +644,37 @@ async def evaluate_javascript(script: str, ctx: Context = None) -> str:
 
 
 @playwright_mcp.tool
-async def get_elements_info(selector: str, ctx: Context = None) -> str:
-    """지정된 셀렉터의 모든 요소 정보를 가져옵니다."""
+async def get_elements_info(selector: str, offset: int = 0, limit: int = 100, ctx: Context = None) -> str:
+    """지정된 셀렉터의 요소 정보를 가져옵니다. offset/limit으로 페이지 단위 조회가 가능합니다."""
+    current_page = await _get_page(ctx)
     if not current_page:
         return "브라우저가 시작되지 않았습니다."
     
+    offset = max(offset, 0)
+    limit = max(limit, 0)
+    
     try:
         if ctx:
-            await ctx.info(f"요소 정보 조회 중 (셀렉터: {selector})")
-        
-        elements = await current_page.query_selector_all(selector)
+            await ctx.info(f"요소 정보 조회 중 (셀렉터: {selector}, offset: {offset}, limit: {limit})")
         
-        elements_info = []
-        for i, element in enumerate(elements):
-            text_content = await element.text_content()
-            inner_html = await element.inner_html()
-            tag_name = await element.evaluate("el => el.tagName")
-            
-            elements_info.append({
-                "index": i,
-                "tag_name": tag_name,
-                "text_content": text_content[:100] + "..." if text_content and len(text_content) > 100 else text_content,
-                "inner_html_length": len(inner_html) if inner_html else 0
-            })
+        # 모든 요소를 한 번의 $$eval 호출로 직렬화
+        page_info = await current_page.eval_on_selector_all(
+            selector,
+            ELEMENTS_INFO_SCRIPT,
+            {"offset": offset, "limit": limit, "maxText": 100}
+        )
+        elements_info = page_info["elements"]
         
         if ctx:
-            await ctx.info(f"{len(elements_info)}개의 요소 정보 조회 완료")
+            await ctx.info(f"{len(elements_info)}개의 요소 정보 조회 완료 (전체 {page_info['total']}개)")
         
         return json.dumps({
             "selector": selector,
-            "count": len(elements_info),
+            "count": page_info["total"],
+            "offset": offset,
+            "limit": limit,
+            "returned": len(elements_info),
+            "has_more": offset + len(elements_info) < page_info["total"],
             "elements": elements_info
         }, ensure_ascii=False, indent=2)
     
@@ -434,10 +693,17 @@ def get_browser_status() -> str:
     """현재 브라우저 상태를 반환합니다."""
     status = {
         "browser_started": browser is not None,
-        "context_available": context is not None,
-        "page_available": current_page is not None,
-        "current_url": current_page.url if current_page else None,
-        "playwright_instance": playwright_instance is not None
+        "playwright_instance": playwright_instance is not None,
+        "session_count": len(sessions),
+        "total_pages": sessions.total_pages,
+        "limits": {
+            "max_sessions": sessions.max_sessions,
+            "max_pages_per_session": sessions.max_pages_per_session,
+            "max_total_pages": sessions.max_total_pages
+        },
+        "sessions": sessions.status(),
+        "resource_blocking": resource_blocker.status(),
+        "available_block_profiles": list(BLOCKING_PROFILES)
     }
     
     return json.dumps(status, ensure_ascii=False, indent=2)
@@ -479,6 +745,8 @@ if __name__ == "__main__":
     print("\n🛠️ 브라우저 관리 도구:")
     print("- start_browser: 브라우저 시작")
     print("- close_browser: 브라우저 종료")
+    print("- close_session: 현재 세션 컨텍스트 종료")
+    print("- open_tab / close_tab: 세션 내 탭 관리")
     
     print("\n🌐 웹페이지 탐색 도구:")
     print("- navigate_to_url: URL로 이동")
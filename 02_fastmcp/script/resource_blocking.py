@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Playwright 리소스 차단 프로필
+
+텍스트와 메타 태그만 읽는 스크래핑 도구를 위해 이미지, 폰트, 미디어,
+서드파티 트래커 요청을 네트워크 단계에서 차단합니다.
+playwright_mcp.py와 blog_analyzer_mcp.py에서 공통으로 사용합니다.
+"""
+
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+from playwright.async_api import BrowserContext, Page, Request, Response, Route
+
+
+# 자주 쓰이는 광고/분석 트래커 도메인
+TRACKER_DOMAINS = {
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "adservice.google.com",
+    "facebook.net",
+    "connect.facebook.net",
+    "analytics.tiktok.com",
+    "wcs.naver.net",
+    "kakaoad.com",
+    "hotjar.com",
+    "clarity.ms",
+}
+
+# 프로필별 차단 규칙 (리소스 타입, 도메인)
+BLOCKING_PROFILES: Dict[str, Dict[str, set]] = {
+    "none": {"resource_types": set(), "domains": set()},
+    "light": {"resource_types": {"image", "media", "font"}, "domains": TRACKER_DOMAINS},
+    "text": {"resource_types": {"image", "media", "font", "stylesheet"}, "domains": TRACKER_DOMAINS},
+}
+
+
+class BlockingStats:
+    """차단/허용된 요청 수와 전송량 통계"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.blocked_requests = 0
+        self.allowed_requests = 0
+        self.loaded_bytes = 0
+        self.blocked_by_type: Dict[str, int] = {}
+        self.blocked_by_domain: Dict[str, int] = {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "blocked_requests": self.blocked_requests,
+            "allowed_requests": self.allowed_requests,
+            "loaded_bytes": self.loaded_bytes,
+            "blocked_by_type": dict(self.blocked_by_type),
+            "blocked_by_domain": dict(self.blocked_by_domain),
+        }
+
+
+class ResourceBlocker:
+    """리소스 타입/도메인 기반 요청 차단기"""
+
+    def __init__(self, profile: str = "none", resource_types: Optional[Iterable[str]] = None,
+                 domains: Optional[Iterable[str]] = None, stats: Optional[BlockingStats] = None):
+        if profile not in BLOCKING_PROFILES:
+            raise ValueError(f"지원되지 않는 차단 프로필: {profile} (사용 가능: {', '.join(BLOCKING_PROFILES)})")
+        rules = BLOCKING_PROFILES[profile]
+        self.profile = profile
+        self.resource_types = set(rules["resource_types"]) | set(resource_types or ())
+        self.domains = set(rules["domains"]) | set(domains or ())
+        self.stats = stats or BlockingStats()
+
+    @property
+    def active(self) -> bool:
+        return bool(self.resource_types or self.domains)
+
+    def _blocked_domain(self, url: str) -> Optional[str]:
+        host = urlparse(url).hostname or ""
+        for domain in self.domains:
+            if host == domain or host.endswith("." + domain):
+                return domain
+        return None
+
+    async def handle(self, route: Route):
+        """route 핸들러: 규칙에 해당하면 abort, 아니면 그대로 진행합니다."""
+        request: Request = route.request
+        resource_type = request.resource_type
+        domain = None if resource_type in self.resource_types else self._blocked_domain(request.url)
+
+        if resource_type in self.resource_types or domain:
+            self.stats.blocked_requests += 1
+            if domain:
+                self.stats.blocked_by_domain[domain] = self.stats.blocked_by_domain.get(domain, 0) + 1
+            else:
+                self.stats.blocked_by_type[resource_type] = self.stats.blocked_by_type.get(resource_type, 0) + 1
+            await route.abort("blockedbyclient")
+        else:
+            self.stats.allowed_requests += 1
+            await route.continue_()
+
+    def record_response(self, response: Response):
+        """응답 이벤트 핸들러: Content-Length 기준으로 실제 전송량을 누적합니다."""
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            self.stats.loaded_bytes += int(length)
+
+    async def attach(self, target: BrowserContext):
+        """컨텍스트에 차단 규칙과 전송량 집계를 연결합니다."""
+        target.on("response", self.record_response)
+        if self.active:
+            await target.route("**/*", self.handle)
+
+    @asynccontextmanager
+    async def override(self, page: Page, profile: Optional[str]):
+        """호출 단위로 다른 프로필을 적용합니다. 페이지 route가 컨텍스트 route보다 우선합니다.
+
+        블록을 벗어나면 페이지 route를 해제하므로 그 뒤에 발생하는 요청(지연 로딩 이미지,
+        스크립트가 나중에 부르는 요청 등)은 컨텍스트 프로필을 따릅니다. 페이지 내용을 다 읽을
+        때까지 블록을 유지하세요.
+        """
+        if profile is None:
+            yield
+            return
+        blocker = ResourceBlocker(profile, stats=self.stats)
+        await page.route("**/*", blocker.handle)
+        try:
+            yield
+        finally:
+            await page.unroute("**/*", blocker.handle)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "profile": self.profile,
+            "resource_types": sorted(self.resource_types),
+            "domains": sorted(self.domains),
+            **self.stats.to_dict(),
+        }
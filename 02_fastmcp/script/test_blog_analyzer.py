@@ -263,6 +263,57 @@ async def test_blog_comparison_analysis():
         print("\n✅ 블로그 비교 분석이 완료되었습니다!")
 
 
+async def test_batch_post_analysis():
+    """여러 포스트 동시 분석 테스트"""
+    
+    print("\n⚡ 포스트 일괄 분석 테스트를 시작합니다...")
+    
+    from blog_analyzer_mcp import blog_analyzer_mcp
+    
+    blog_url = "https://metashower.tistory.com"
+    
+    async with Client(blog_analyzer_mcp) as client:
+        
+        # 브라우저 시작
+        print("\n🌐 브라우저 시작...")
+        await client.call_tool("start_browser", {"headless": True})
+        
+        # 분석할 포스트 URL 수집
+        result = await client.call_tool("extract_blog_posts", {
+            "blog_url": blog_url,
+            "limit": 10
+        })
+        try:
+            posts_data = json.loads(result.content[0].text)
+            post_urls = [post['url'] for post in posts_data['posts'] if post['url']]
+        except Exception:
+            print(f"포스트 추출 결과: {result.content[0].text}")
+            post_urls = []
+        
+        if post_urls:
+            print(f"\n📚 {len(post_urls)}개 포스트 동시 분석 중...")
+            result = await client.call_tool("analyze_posts_batch", {
+                "urls": post_urls,
+                "concurrency": 4
+            })
+            try:
+                batch = json.loads(result.content[0].text)
+                print(f"  ✅ 성공: {batch['succeeded']}개 / ❌ 실패: {batch['failed']}개")
+                print(f"  ⏱️ 소요 시간: {batch['elapsed_seconds']}초 (동시 실행: {batch['concurrency']})")
+                for post in batch['posts'][:5]:
+                    print(f"  - {post.get('title', post.get('error'))}")
+            except Exception:
+                print(f"일괄 분석 결과: {result.content[0].text}")
+        else:
+            print("⚠️ 분석할 포스트를 찾을 수 없습니다.")
+        
+        # 브라우저 종료
+        print("\n🔚 브라우저 종료...")
+        await client.call_tool("close_browser", {})
+        
+        print("\n✅ 포스트 일괄 분석 테스트가 완료되었습니다!")
+
+
 if __name__ == "__main__":
     print("🚀 블로그 분석 MCP 테스트를 시작합니다...\n")
     
@@ -272,5 +323,8 @@ if __name__ == "__main__":
     # 블로그 비교 분석 (간단 버전)
     asyncio.run(test_blog_comparison_analysis())
     
+    # 포스트 일괄 분석
+    asyncio.run(test_batch_post_analysis())
+    
     print("\n🎉 모든 블로그 분석 테스트가 성공적으로 완료되었습니다!")
     print("\n💡 생성된 스크린샷과 분석 결과를 확인해보세요!")
\ No newline at end of file